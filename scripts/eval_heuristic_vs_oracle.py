@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import copy
 from typing import List, Dict, Tuple
 
 from src.runner import run_config
 from src.analyzer import analyze_maze
+from src.grids import freeze_maze
 from src.selectors.heuristic_selector import select_solver_heuristic
 from src.eval.metrics import MazeMeta, run_solver_with_metrics
 from src.eval.labeling import choose_oracle_label, compute_regret
@@ -52,9 +52,10 @@ def main():
     worst_regret = 0
     none_solved_count = 0
 
-    chose_count = {"BFS": 0, "DFS": 0, "ASTAR": 0}
-    oracle_count = {"BFS": 0, "DFS": 0, "ASTAR": 0, "NONE": 0}
-    match_count = {"BFS": 0, "DFS": 0, "ASTAR": 0}  # matches by predicted label
+    solver_names = [name for name, _ in SOLVERS]
+    chose_count = {name: 0 for name in solver_names}
+    oracle_count = {name: 0 for name in solver_names + ["NONE"]}
+    match_count = {name: 0 for name in solver_names}  # matches by predicted label
 
     for idx, cfg in enumerate(configs):
         total += 1
@@ -79,10 +80,10 @@ def main():
         )
 
         metrics_list = []
+        shared = freeze_maze(maze)  # read-only, shared by every solver
         for (solver_name, solver_fn) in SOLVERS:
-            maze_copy = copy.deepcopy(maze)
             m = run_solver_with_metrics(
-                maze_copy,
+                shared,
                 solver_fn,
                 solver_name=solver_name,
                 meta=meta
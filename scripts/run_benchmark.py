@@ -1,7 +1,7 @@
 # run_benchmark.py
 from src.benchmark import benchmark
 from src import config
-from src.solvers import solve_bfs, solve_dfs, solve_astar
+from src.solvers import solve_bfs, solve_dfs, solve_astar, solve_astar_bucket, solve_jps
 
 def main():
     configs = [
@@ -13,6 +13,8 @@ def main():
         solve_bfs,
         solve_dfs,
         solve_astar,
+        solve_astar_bucket,
+        solve_jps,
     ]
 
     benchmark(
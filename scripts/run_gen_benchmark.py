@@ -0,0 +1,22 @@
+# run_gen_benchmark.py
+from src.gen_benchmark import benchmark_generation, sweep_configs
+
+def main():
+    configs = sweep_configs(
+        families=["A", "B"],
+        sizes=[(51, 51), (201, 201)],
+        open_ratios=[0.35, 0.5],
+        seeds=[1, 2],
+        perfect_algorithms=["backtracker", "eller"],
+        family_b_engines=["frontier", "legacy"],
+    )
+
+    benchmark_generation(
+        configs=configs,
+        repeats_per_config=1,
+        verbose=True,
+        export_path="generation_results.csv",
+    )
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ import copy
 from collections import Counter
 
 from src.config import PRESETS
-from src.solvers import solve_bfs, solve_dfs, solve_astar
+from src.solvers import solve_bfs, solve_dfs, solve_astar, solve_jps
 from src.ml.dataset import build_dataset
 
 
@@ -13,6 +13,7 @@ def main():
         ("BFS", solve_bfs),
         ("DFS", solve_dfs),
         ("ASTAR", solve_astar),
+        ("JPS", solve_jps),
     ]
 
     configs = []
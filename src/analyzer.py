@@ -1,12 +1,12 @@
 # analyzer.py
 
 from __future__ import annotations
-import copy
 from collections import deque
 from dataclasses import dataclass
 from typing import List
 
 from src.maze import Maze, OPEN, WALL, DIRECTIONS, coord
+from src.grids import CompactGrid, PackedGrid, freeze_maze
 from src.solvers import solve_bfs
 
 @dataclass(frozen=True)
@@ -30,37 +30,45 @@ def analyze_maze(maze: Maze)-> MazeFeatures:
     open_cells = 0
     wall_cells = 0
 
-    for row in maze.grid:
-        for cell in row:
-            if cell == OPEN:
-                open_cells += 1
-            elif cell == WALL:
-                wall_cells += 1
-            else:
-                raise ValueError(f"Invalid/Unknown cell value: {cell!r} ")
+    if isinstance(maze.grid, (CompactGrid, PackedGrid)):
+        open_cells = maze.grid.count(OPEN)
+        wall_cells = maze.grid.count(WALL)
+        if open_cells + wall_cells != cells_total:
+            raise ValueError("Invalid/Unknown cell value in compact grid")
+    else:
+        for row in maze.grid:
+            for cell in row:
+                if cell == OPEN:
+                    open_cells += 1
+                elif cell == WALL:
+                    wall_cells += 1
+                else:
+                    raise ValueError(f"Invalid/Unknown cell value: {cell!r} ")
 
     open_ratio = open_cells / cells_total
 
     reachable = 0
-    visited = set()
 
-    queue = deque()
+    if not maze.is_open(maze.start):
+        raise ValueError("Invalid Maze")
 
-    if maze.is_open(maze.start):
-        visited.add(maze.start)
-        queue.append(maze.start)
+    if maze.components is not None:
+        # labels from generation: the start's component is what BFS would reach
+        sx, sy = maze.start
+        reachable = int((maze.components == maze.components[sy, sx]).sum())
     else:
-        raise ValueError("Invalid Maze")
+        visited = {maze.start}
+        queue = deque([maze.start])
 
-    while queue:
-        current = queue.popleft()
+        while queue:
+            current = queue.popleft()
 
-        reachable += 1
+            reachable += 1
 
-        for neighbor in maze.neighbors(current):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append(neighbor)
+            for neighbor in maze.neighbors(current):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
 
     reachable_open_cells_from_start = reachable
 
@@ -100,7 +108,7 @@ def analyze_maze(maze: Maze)-> MazeFeatures:
         dead_end_ratio = dead_ends/open_cells
 
     #Shortest Path
-    bfs_solution = solve_bfs(copy.deepcopy(maze))
+    bfs_solution = solve_bfs(freeze_maze(maze))
     if bfs_solution.found:
         shortest_path_length = bfs_solution.path_length
     else:
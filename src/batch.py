@@ -0,0 +1,103 @@
+# batch.py
+# fan (maze, solver) jobs out to a process pool, results in input order
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Sequence, Tuple
+
+from src import maze as maze_mod
+from src.eval.metrics import MazeMeta, SolverRunMetrics, run_solver_with_metrics
+from src.grids import CompactGrid, flat_cells, freeze_maze
+from src.shared_maze import SharedMazeStore, attached_maze
+from src.solution import Solution
+
+
+SolverSpec = Tuple[str, Callable[[maze_mod.Maze], Solution]]
+
+# what crosses the process boundary: (width, height, start, end, row-major cell bytes)
+MazePayload = Tuple[int, int, maze_mod.coord, maze_mod.coord, bytes]
+
+
+def pack_maze(m: maze_mod.Maze) -> MazePayload:
+    return m.width, m.height, m.start, m.end, bytes(flat_cells(m.grid))
+
+
+def unpack_maze(payload: MazePayload) -> maze_mod.Maze:
+    width, height, start, end, cells = payload
+    grid = CompactGrid(width, height, bytearray(cells))
+    return maze_mod.Maze(width, height, grid, start, end)
+
+
+def normalize_solvers(solvers: Sequence) -> List[SolverSpec]:
+    # accept bare callables (benchmark style) or (name, fn) pairs (dataset style)
+    specs: List[SolverSpec] = []
+    for solver in solvers:
+        if isinstance(solver, tuple):
+            specs.append(solver)
+        else:
+            specs.append((getattr(solver, "__name__", str(solver)), solver))
+    return specs
+
+
+def solve_many(
+    mazes: Sequence[maze_mod.Maze],
+    solvers: Sequence,
+    workers: int = 1,
+    chunksize: int = 1,
+) -> List[List[Solution]]:
+    """
+    Run every solver on every maze.
+
+    Returns results[i][j] = solvers[j] applied to mazes[i]. Every solver of a
+    maze gets the same read-only maze (grids.freeze_maze), never a copy.
+    With workers > 1 cells are placed in shared memory once and all solvers
+    of a maze run in the same worker; chunksize groups several mazes per task.
+    """
+    specs = normalize_solvers(solvers)
+    jobs = [(m, specs, None) for m in mazes]
+    return _run_jobs(jobs, workers, chunksize)
+
+
+def solve_many_with_metrics(
+    mazes: Sequence[maze_mod.Maze],
+    metas: Sequence[MazeMeta],
+    solvers: Sequence,
+    workers: int = 1,
+    chunksize: int = 1,
+) -> List[List[SolverRunMetrics]]:
+    """Same as solve_many, but each run is timed in its worker and returned as SolverRunMetrics."""
+    if len(mazes) != len(metas):
+        raise ValueError(f"mazes/metas length mismatch: {len(mazes)} != {len(metas)}")
+
+    specs = normalize_solvers(solvers)
+    jobs = [(m, specs, meta) for m, meta in zip(mazes, metas)]
+    return _run_jobs(jobs, workers, chunksize)
+
+
+def _run_jobs(jobs: list, workers: int, chunksize: int) -> list:
+    if workers <= 1:
+        return [_solve_job((freeze_maze(m), specs, meta)) for m, specs, meta in jobs]
+
+    with SharedMazeStore([m for m, _, _ in jobs]) as store:
+        shared = [(ref, specs, meta) for ref, (_, specs, meta) in zip(store.refs, jobs)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Executor.map keeps input order regardless of completion order
+            return list(pool.map(_solve_shared_job, shared, chunksize=max(1, chunksize)))
+
+
+def _solve_shared_job(job) -> list:
+    ref, specs, meta = job
+    with attached_maze(ref) as m:
+        return _solve_job((m, specs, meta))
+
+
+def _solve_job(job) -> list:
+    m, specs, meta = job
+    results = []
+    for solver_name, solver_fn in specs:
+        if meta is None:
+            results.append(solver_fn(m))
+        else:
+            results.append(run_solver_with_metrics(m, solver_fn, solver_name=solver_name, meta=meta))
+    return results
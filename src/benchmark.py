@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-import copy
 import csv
+import inspect
+import io
 import json
-from dataclasses import dataclass, asdict
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict, fields, replace
+from functools import partial
 from hashlib import sha256
-from time import perf_counter
-from typing import Callable, List, Tuple, Any
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Tuple, Any
 
+from src.budget import SearchBudget
 from src.maze import coord, Maze
+from src.grids import freeze_maze
+from src.shared_maze import SharedMazeRef, SharedMazeStore, attached_maze
 from src.solution import Solution
+from src.timing import TimingStats, significantly_faster, time_call
 from src import runner
 
 
@@ -22,6 +32,7 @@ class SolverResult:
     expanded_nodes: int
     runtime_ms: float
     notes: str | None
+    timing: TimingStats | None = None  # set when timed with repeats/warmup
 
 
 @dataclass
@@ -37,9 +48,17 @@ class BenchmarkRow:
     solved: bool
     path_length: int | None
     expanded_nodes: int
-    runtime_ms: float
+    runtime_ms: float  # median when timing_repeats > 1
     is_best: bool
     best_reason: str
+    timing_repeats: int = 1
+    runtime_min_ms: float | None = None
+    runtime_median_ms: float | None = None
+    runtime_p95_ms: float | None = None
+    runtime_ci_low_ms: float | None = None  # bootstrap CI of the median
+    runtime_ci_high_ms: float | None = None
+    notes: str | None = None  # e.g. "budget exceeded: deadline", "not found"
+    config_key: str = ""  # config_key(cfg); with run_id, what resume matches on
 
 
 def benchmark(
@@ -49,56 +68,221 @@ def benchmark(
     tie_breakers: List[str] = ["solved", "path_length", "runtime_ms"],
     export_path: str | None = None,
     verbose: bool = False,
+    maze_cache=None,  # optional maze_cache.MazeCache
+    workers: int = 1,
+    pin_cpus: bool | List[int] = False,
+    timing_repeats: int = 1,
+    timing_warmup: int = 0,
+    resume: bool = False,
+    keep_rows: bool = True,
+    flush_every: int = 1,
+    max_expansions: int | None = None,
+    time_limit_ms: float | None = None,
 ) -> List[BenchmarkRow]:
+    # workers > 1: (config, repeat) units run in a process pool, one unit (so
+    # one solver timing) per worker at a time; rows come back in serial order.
+    # pin_cpus: True = one CPU per worker from os.sched_getaffinity, or an
+    # explicit CPU list (Linux only; ignored where affinity is unsupported);
+    # fewer CPUs than workers is a ValueError.
+    # Solvers must be picklable (module-level functions) when workers > 1.
+    # timing_repeats/timing_warmup: time each solver with timing.time_call
+    # (GC off, perf_counter_ns) and rank on runtime only where significant.
+    # Each call gets its own maze object, so per-maze solver caches are
+    # rebuilt (and timed) every time rather than only on the first call.
+    # export_path: rows are appended as each (config, repeat) finishes,
+    # flushed every flush_every runs. resume=True keeps an existing file
+    # (minus a torn last line) and, per run (config_key + run_id), runs only
+    # the requested solvers it has no row for; rows already there are never
+    # dropped, whichever solvers wrote them. Rows added to a run are ranked
+    # (is_best) among themselves. The returned rows are then only the new
+    # ones. keep_rows=False returns [] and keeps nothing in memory.
+    # max_expansions/time_limit_ms: per solver run, via budget.SearchBudget,
+    # for solvers that take a `budget` argument; a run that hits a limit is
+    # unsolved with notes "budget exceeded: ..." and never ranked best
+    # while some other solver finished; it is timed once, not repeated.
+    # Solvers without a budget parameter run unbounded, with a warning.
+    timing = (timing_repeats, timing_warmup)
+    budget = None
+    if max_expansions is not None or time_limit_ms is not None:
+        budget = SearchBudget(max_expansions=max_expansions, time_limit_ms=time_limit_ms)
+        for solver in solvers:
+            if not accepts_budget(solver):
+                warnings.warn(f"{get_solver_name(solver)} takes no budget and runs unbounded",
+                              stacklevel=2)
     rows: List[BenchmarkRow] = []
 
-    for cfg in configs:
+    done: Dict[tuple, set] = {}
+    writer = None
+    if export_path is not None:
+        if resume:
+            check_export_schema(export_path, BenchmarkRow)
+            done = read_done_solvers(export_path)
+        writer = RowWriter(export_path, BenchmarkRow, append=resume, flush_every=flush_every)
+
+    def emit(unit_rows: List[BenchmarkRow]) -> None:
+        if writer is not None:
+            writer.write(unit_rows)
+        if keep_rows:
+            rows.extend(unit_rows)
+
+    def pending(cfg: dict) -> List[Tuple[int, List[Callable]]]:
+        # (repeat, solvers still to run) for each repeat with work left
+        key = config_key(cfg)
+        todo = []
         for r in range(repeats_per_config):
-            run_id = make_run_id(cfg, repeat_index=r)
-
-            maze = runner.run_config(cfg)
-            mh = compute_maze_hash(maze)
-
-            solver_results: List[SolverResult] = []
-            for solver in solvers:
-                solver_results.append(run_single_solver(solver, maze, run_id, verbose))
-
-            best_solver_name, best_reason = select_best(solver_results, tie_breakers)
-
-            for result in solver_results:
-                is_best = (result.solver_name == best_solver_name)
-
-                row = BenchmarkRow(
-                    run_id=run_id,
-                    width=cfg["width"],
-                    height=cfg["height"],
-                    family=cfg["family"],
-                    seed_value=cfg.get("seed_value"),
-                    open_ratio=cfg.get("open_ratio"),
-                    maze_hash=mh,
-                    solver_name=result.solver_name,
-                    solved=result.solved,
-                    path_length=result.path_length,
-                    expanded_nodes=result.expanded_nodes,
-                    runtime_ms=result.runtime_ms,
-                    is_best=is_best,
-                    best_reason=(best_reason if is_best else ""),
-                )
-                rows.append(row)
-
-            if verbose:
-                print_run_summary(run_id, cfg, solver_results, best_solver_name, best_reason)
+            ran = done.get((key, make_run_id(cfg, repeat_index=r)), set())
+            missing = [s for s in solvers if get_solver_name(s) not in ran]
+            if missing:
+                todo.append((r, missing))
+        return todo
 
-    if export_path is not None:
-        write_rows(rows, export_path)
+    try:
+        if workers <= 1:
+            for cfg in configs:
+                maze = None
+                for r, run_solvers in pending(cfg):
+                    # a seeded config always builds the same maze: build it once
+                    if maze is None or cfg.get("seed_value") is None:
+                        maze = load_maze(cfg, maze_cache)
+                    emit(benchmark_unit(cfg, r, run_solvers, tie_breakers, verbose, maze, timing, budget))
+        else:
+            todo = [(cfg, pending(cfg)) for cfg in configs]
+            todo = [(cfg, repeats) for cfg, repeats in todo if repeats]
+
+            # the cache is single-process: resolve mazes here and hand them to
+            # workers through shared memory; otherwise each worker builds its own
+            mazes = [load_maze(cfg, maze_cache) for cfg, _ in todo] if maze_cache is not None else []
+            with SharedMazeStore(mazes) as store:
+                refs = store.refs or [None] * len(todo)
+                units = []
+                for (cfg, repeats), ref in zip(todo, refs):
+                    for r, run_solvers in repeats:
+                        units.append((cfg, r, run_solvers, tie_breakers, verbose, ref, timing, budget))
+
+                with make_worker_pool(workers, pin_cpus) as pool:
+                    # map yields in submission order as results arrive
+                    for unit_rows in pool.map(_benchmark_unit_star, units):
+                        emit(unit_rows)
+    finally:
+        if writer is not None:
+            writer.close()
+        if maze_cache is not None:
+            maze_cache.flush()
 
     return rows
 
 
+def benchmark_unit(
+    cfg: dict,
+    repeat_index: int,
+    solvers: List[Callable],
+    tie_breakers: List[str],
+    verbose: bool = False,
+    maze: Maze | None = None,
+    timing: Tuple[int, int] = (1, 0),  # (timing_repeats, timing_warmup)
+    budget: SearchBudget | None = None,
+) -> List[BenchmarkRow]:
+    # one (config, repeat): build the maze unless given, run every solver, rank
+    run_id = make_run_id(cfg, repeat_index=repeat_index)
+    cfg_key = config_key(cfg)
+    if maze is None:
+        maze = runner.run_config(cfg)
+    # read-only cells shared by every solver run (maybe_clone then copies no cells)
+    maze = freeze_maze(maze)
+    mh = compute_maze_hash(maze)
+
+    solver_results: List[SolverResult] = []
+    for solver in solvers:
+        solver_results.append(run_single_solver(solver, maze, run_id, verbose,
+                                                timing_repeats=timing[0], timing_warmup=timing[1],
+                                                budget=budget))
+
+    best_solver_name, best_reason = select_best(solver_results, tie_breakers)
+
+    rows: List[BenchmarkRow] = []
+    for result in solver_results:
+        is_best = (result.solver_name == best_solver_name)
+        stats = result.timing
+
+        row = BenchmarkRow(
+            run_id=run_id,
+            width=cfg["width"],
+            height=cfg["height"],
+            family=cfg["family"],
+            seed_value=cfg.get("seed_value"),
+            open_ratio=cfg.get("open_ratio"),
+            maze_hash=mh,
+            solver_name=result.solver_name,
+            solved=result.solved,
+            path_length=result.path_length,
+            expanded_nodes=result.expanded_nodes,
+            runtime_ms=result.runtime_ms,
+            is_best=is_best,
+            best_reason=(best_reason if is_best else ""),
+            timing_repeats=stats.repeats if stats is not None else 1,
+            runtime_min_ms=stats.min_ms if stats is not None else None,
+            runtime_median_ms=stats.median_ms if stats is not None else None,
+            runtime_p95_ms=stats.p95_ms if stats is not None else None,
+            runtime_ci_low_ms=stats.ci_low_ms if stats is not None else None,
+            runtime_ci_high_ms=stats.ci_high_ms if stats is not None else None,
+            notes=result.notes,
+            config_key=cfg_key,
+        )
+        rows.append(row)
+
+    if verbose:
+        print_run_summary(run_id, cfg, solver_results, best_solver_name, best_reason)
+
+    return rows
+
+
+def _benchmark_unit_star(unit: tuple) -> List[BenchmarkRow]:
+    cfg, r, solvers, tie_breakers, verbose, maze, timing, budget = unit
+    if isinstance(maze, SharedMazeRef):
+        with attached_maze(maze) as shared:
+            return benchmark_unit(cfg, r, solvers, tie_breakers, verbose, shared, timing, budget)
+    return benchmark_unit(cfg, r, solvers, tie_breakers, verbose, maze, timing, budget)
+
+
+def make_worker_pool(workers: int, pin_cpus: bool | List[int] = False) -> ProcessPoolExecutor:
+    if not pin_cpus or not hasattr(os, "sched_setaffinity"):
+        return ProcessPoolExecutor(max_workers=workers)
+
+    cpus = sorted(os.sched_getaffinity(0)) if pin_cpus is True else list(dict.fromkeys(pin_cpus))
+    if len(cpus) < workers:
+        # sharing a CPU would defeat the point of pinning: isolated timings
+        raise ValueError(f"pin_cpus: {workers} workers need as many CPUs, got {cpus}")
+
+    # each worker takes the next CPU id from the queue once, at startup
+    ctx = multiprocessing.get_context()
+    cpu_queue = ctx.Queue()
+    for cpu in cpus[:workers]:
+        cpu_queue.put(cpu)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                               initializer=_pin_worker, initargs=(cpu_queue,))
+
+
+def _pin_worker(cpu_queue) -> None:
+    os.sched_setaffinity(0, {cpu_queue.get()})
+
+
 # --------------------
 # Helpers
 # --------------------
 
+def load_maze(cfg: dict, maze_cache=None) -> Maze:
+    if maze_cache is not None:
+        return maze_cache.run_config(cfg)
+    return runner.run_config(cfg)
+
+
+def config_key(cfg: dict) -> str:
+    # run_id only names the common keys; this covers the whole normalized
+    # config (perfect_algorithm, family_b_engine, ...), same as the maze cache
+    from src.maze_cache import cache_key  # maze_cache imports this module
+    return cache_key(cfg)[:16]
+
+
 def make_run_id(cfg: dict, repeat_index: int) -> str:
     w = cfg["width"]
     h = cfg["height"]
@@ -133,13 +317,34 @@ def serialize_maze(maze: Maze) -> bytes:
 
 
 def maybe_clone(maze: Maze) -> Maze:
-    return copy.deepcopy(maze)
+    # solvers get a read-only maze. The cells of a frozen maze are shared, not
+    # copied, but every call returns a new Maze object, so per-maze solver
+    # caches keyed on it (junction_graph_for) start cold for each solver run
+    return replace(freeze_maze(maze))
 
 
 def get_solver_name(solver: Callable) -> str:
     return getattr(solver, "__name__", str(solver))
 
 
+BUDGET_EXCEEDED = "budget exceeded"
+
+
+def accepts_budget(solver: Callable) -> bool:
+    try:
+        return "budget" in inspect.signature(solver).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def is_budget_exceeded(result: SolverResult) -> bool:
+    return result.notes is not None and result.notes.startswith(BUDGET_EXCEEDED)
+
+
+def _hit_budget(raw: Any) -> bool:
+    return isinstance(raw, Solution) and raw.budget_exceeded is not None
+
+
 def normalize_solver_output(raw: Any) -> Tuple[List[coord] | None, int, str | None]:
     # Case 1: None
     if raw is None:
@@ -147,6 +352,8 @@ def normalize_solver_output(raw: Any) -> Tuple[List[coord] | None, int, str | No
 
     # Case 2: Solution object (THIS IS YOUR MAIN CASE)
     if isinstance(raw, Solution):
+        if raw.budget_exceeded is not None:
+            return None, raw.expanded_count, f"{BUDGET_EXCEEDED}: {raw.budget_exceeded}"
         if not raw.found:
             return None, raw.expanded_count, "not found"
 
@@ -170,27 +377,49 @@ def normalize_solver_output(raw: Any) -> Tuple[List[coord] | None, int, str | No
     return raw, 0, None
 
 
-def run_single_solver(solver: Callable, maze: Maze, run_id: str, verbose: bool) -> SolverResult:
+def run_single_solver(solver: Callable, maze: Maze, run_id: str, verbose: bool,
+                      timing_repeats: int = 1, timing_warmup: int = 0,
+                      budget: SearchBudget | None = None) -> SolverResult:
     solver_name = get_solver_name(solver)
-    maze_for_solver = maybe_clone(maze)
-
-    t0 = perf_counter()
+    frozen = freeze_maze(maze)
+    # solvers without a budget parameter can't be stopped and run unbounded
+    if budget is not None and accepts_budget(solver):
+        solver = partial(solver, budget=budget)
+
+    def run(m: Maze):
+        # a fresh maze object per call (cells shared): with repeats, every
+        # call pays for per-maze caches such as the junction graph, so the
+        # median measures the same work as a single-sample run
+        return solver(maybe_clone(m))
+
+    # only the solver call is timed; output normalization happens afterwards
+    timing = None
+    error = None
+    t0 = perf_counter_ns()
     try:
-        raw = solver(maze_for_solver)
-        path, expanded_nodes, notes = normalize_solver_output(raw)
-
-        solved = (path is not None and len(path) > 0)
-        path_length = len(path) if solved else None
-
+        if timing_repeats > 1 or timing_warmup > 0:
+            # a run that hit its budget would hit it again; don't repeat it
+            stop_when = _hit_budget if budget is not None else None
+            raw, timing = time_call(run, frozen, warmup=timing_warmup,
+                                    repeats=timing_repeats, stop_when=stop_when)
+        else:
+            raw = run(frozen)
     except Exception as e:
+        raw = None
+        error = e
+    t1 = perf_counter_ns()
+    runtime_ms = timing.median_ms if timing is not None else (t1 - t0) / 1e6
+
+    if error is not None:
         path = None
         solved = False
         path_length = None
         expanded_nodes = 0
-        notes = f"exception: {e!r}"
-
-    t1 = perf_counter()
-    runtime_ms = (t1 - t0) * 1000.0
+        notes = f"exception: {error!r}"
+    else:
+        path, expanded_nodes, notes = normalize_solver_output(raw)
+        solved = (path is not None and len(path) > 0)
+        path_length = len(path) if solved else None
 
     if verbose:
         print(f"{run_id} | {solver_name} | solved={solved} len={path_length} expanded={expanded_nodes} ms={runtime_ms:.2f} notes={notes}")
@@ -203,34 +432,61 @@ def run_single_solver(solver: Callable, maze: Maze, run_id: str, verbose: bool)
         expanded_nodes=expanded_nodes,
         runtime_ms=runtime_ms,
         notes=notes,
+        timing=timing,
     )
 
 
 def select_best(results: List[SolverResult], tie_breakers: List[str]) -> Tuple[str, str]:
+    # Breakers narrow the candidate set in order; the first survivor wins.
+    # "runtime_ms" with repeated timings on every candidate only picks the
+    # fastest (by median) if it beats each other candidate with non-
+    # overlapping confidence intervals; otherwise runtime is treated as a tie.
+    # Runs cut short by a budget are only considered if every run was.
     if not results:
         return "", "no results"
 
-    def score(r: SolverResult) -> tuple:
-        parts = []
-        for breaker in tie_breakers:
-            if breaker == "solved":
-                parts.append(0 if r.solved else 1)  # solved wins
-            elif breaker == "path_length":
-                parts.append(r.path_length if r.path_length is not None else float("inf"))
-            elif breaker == "expanded_nodes":
-                parts.append(r.expanded_nodes)
-            elif breaker == "runtime_ms":
-                parts.append(r.runtime_ms)
+    def value(r: SolverResult, breaker: str):
+        if breaker == "solved":
+            return 0 if r.solved else 1  # solved wins
+        if breaker == "path_length":
+            return r.path_length if r.path_length is not None else float("inf")
+        if breaker == "expanded_nodes":
+            return r.expanded_nodes
+        if breaker == "runtime_ms":
+            return r.runtime_ms
+        return 0
+
+    over_budget = [r for r in results if is_budget_exceeded(r)]
+    candidates = [r for r in results if not is_budget_exceeded(r)] or list(results)
+    runtime_undecided = False
+    for breaker in tie_breakers:
+        if len(candidates) == 1:
+            break
+
+        if breaker == "runtime_ms" and all(r.timing is not None for r in candidates):
+            fastest = min(candidates, key=lambda r: r.timing.median_ms)
+            others = [r for r in candidates if r is not fastest]
+            if all(significantly_faster(fastest.timing, r.timing) for r in others):
+                candidates = [fastest]
             else:
-                parts.append(0)
-        return tuple(parts)
+                runtime_undecided = True
+            continue
 
-    best = min(results, key=score)
+        best_value = min(value(r, breaker) for r in candidates)
+        candidates = [r for r in candidates if value(r, breaker) == best_value]
+
+    best = candidates[0]
 
     if best.solved:
         reason = "best by " + " > ".join(tie_breakers)
+    elif len(over_budget) == len(results):
+        reason = "all over budget; best by " + " > ".join(tie_breakers)
     else:
         reason = "none solved; best by " + " > ".join(tie_breakers)
+    if runtime_undecided:
+        reason += " (runtime difference not significant)"
+    if over_budget and len(over_budget) < len(results):
+        reason += f" ({len(over_budget)} over budget)"
 
     return best.solver_name, reason
 
@@ -242,6 +498,144 @@ def print_run_summary(run_id: str, cfg: dict, results: List[SolverResult], best_
         print(f"  {r.solver_name:20s} solved={r.solved} len={r.path_length} expanded={r.expanded_nodes} ms={r.runtime_ms:.2f} notes={r.notes}")
 
 
+class RowWriter:
+    """
+    Appends dataclass rows to a .csv/.jsonl file as they are produced.
+
+    Each write() goes out as one chunk; the file is flushed every
+    flush_every writes and on close. append=True continues an existing file
+    (dropping a torn last line from a crash); otherwise it is truncated.
+    """
+
+    def __init__(self, path: str, row_type, append: bool = False, flush_every: int = 1):
+        if not (path.endswith(".csv") or path.endswith(".jsonl")):
+            raise ValueError("unsupported export format (use .csv or .jsonl)")
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be >= 1, got {flush_every}")
+
+        self.path = path
+        self.is_csv = path.endswith(".csv")
+        self.fieldnames = [f.name for f in fields(row_type)]
+        self.flush_every = flush_every
+        self._pending = 0
+
+        has_content = append and os.path.exists(path) and os.path.getsize(path) > 0
+        if has_content:
+            trim_partial_line(path)
+            check_export_schema(path, row_type)
+            has_content = os.path.getsize(path) > 0
+
+        self._f = open(path, "a" if append else "w", newline="", encoding="utf-8")
+        if self.is_csv and not has_content:
+            self._f.write(self._csv_text([dict(zip(self.fieldnames, self.fieldnames))]))
+            self._f.flush()
+
+    def _csv_text(self, records: List[dict]) -> str:
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=self.fieldnames)
+        writer.writerows(records)
+        return buf.getvalue()
+
+    def write(self, rows: List) -> None:
+        if not rows:
+            return
+        records = [asdict(row) for row in rows]
+        if self.is_csv:
+            text = self._csv_text(records)
+        else:
+            text = "".join(json.dumps(record) + "\n" for record in records)
+        self._f.write(text)
+
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        self._f.flush()
+        self._pending = 0
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self.flush()
+            self._f.close()
+
+
+def trim_partial_line(path: str) -> None:
+    # a crash mid-write can leave a torn last line; cut back to the last newline
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(max(0, size - 1))
+        if f.read(1) == b"\n":
+            return
+
+        pos = size
+        chunk = 4096
+        while pos > 0:
+            start = max(0, pos - chunk)
+            f.seek(start)
+            data = f.read(pos - start)
+            cut = data.rfind(b"\n")
+            if cut >= 0:
+                f.truncate(start + cut + 1)
+                return
+            pos = start
+        f.truncate(0)
+
+
+def check_export_schema(path: str, row_type) -> None:
+    """Raise ValueError if an existing export's columns differ from row_type's."""
+    if not os.path.exists(path):
+        return
+    fieldnames = [f.name for f in fields(row_type)]
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            columns = next(csv.reader(f), None)
+        else:
+            # first complete record; a torn last line is not a schema
+            record = next((r for r in map(_parse_json_line, f) if r), None)
+            columns = list(record) if record is not None else None
+    if columns is not None and columns != fieldnames:
+        raise ValueError(f"Cannot resume {path!r}: its columns {columns} differ from {fieldnames}")
+
+
+def read_export(path: str):
+    # (config_key, run_id) and record for each complete row of an export
+    is_csv = path.endswith(".csv")
+    with open(path, newline="", encoding="utf-8") as f:
+        records = csv.DictReader(f) if is_csv else (_parse_json_line(line) for line in f)
+        for record in records:
+            # torn lines: unparseable JSON, or CSV rows missing columns (None)
+            if not record or not record.get("run_id") or (is_csv and None in record.values()):
+                continue
+            yield (record.get("config_key") or "", record["run_id"]), record
+
+
+def read_done_solvers(path: str) -> Dict[tuple, set]:
+    """
+    (config_key, run_id) -> names of the solvers with a row in an existing
+    export. A torn last line (a crash mid-write) is cut off first, so new
+    rows append cleanly after the complete ones.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return {}
+    trim_partial_line(path)
+
+    done: Dict[tuple, set] = {}
+    for key, record in read_export(path):
+        done.setdefault(key, set()).add(record.get("solver_name"))
+    return done
+
+
+def _parse_json_line(line: str) -> dict | None:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
 def write_rows(rows: List[BenchmarkRow], export_path: str) -> None:
     if export_path.endswith(".csv"):
         write_csv(rows, export_path)
@@ -0,0 +1,68 @@
+# budget.py
+# caps on a single solver run: node expansions and/or wall-clock time
+#
+# A solver that takes `budget` calls budget.start() once, then
+# budget.exceeded(expanded_count) before each expansion and returns
+# budget.solution(...) when it says so. The clock is only read every
+# check_every expansions, so the check costs next to nothing per node.
+# Solvers that check once per batch of work (a whole BFS layer) pass
+# check_clock=True, since their count jumps past the multiples.
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from src import solution
+
+EXPANSIONS = "expansions"
+DEADLINE = "deadline"
+
+
+@dataclass
+class SearchBudget:
+    max_expansions: int | None = None
+    time_limit_ms: float | None = None
+    check_every: int = 256
+    # set by exceeded(): which limit stopped the search (EXPANSIONS/DEADLINE)
+    reason: str | None = field(default=None, init=False)
+    _deadline: float | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.max_expansions is not None and self.max_expansions < 0:
+            raise ValueError(f"max_expansions must be >= 0, got {self.max_expansions}")
+        if self.time_limit_ms is not None and self.time_limit_ms < 0:
+            raise ValueError(f"time_limit_ms must be >= 0, got {self.time_limit_ms}")
+        if self.check_every < 1:
+            raise ValueError(f"check_every must be >= 1, got {self.check_every}")
+
+    def start(self) -> "SearchBudget":
+        # (re)arm for one run; a budget can be reused, but not by two runs at once
+        self.reason = None
+        self._deadline = None
+        if self.time_limit_ms is not None:
+            self._deadline = perf_counter() + self.time_limit_ms / 1000.0
+        return self
+
+    def exceeded(self, expanded_count: int, check_clock: bool = False) -> bool:
+        if self.max_expansions is not None and expanded_count >= self.max_expansions:
+            self.reason = EXPANSIONS
+            return True
+        if (self._deadline is not None
+                and (check_clock or expanded_count % self.check_every == 0)
+                and perf_counter() >= self._deadline):
+            self.reason = DEADLINE
+            return True
+        return False
+
+    def solution(self, expanded_count: int, visited_count: int, max_frontier: int) -> solution.Solution:
+        # what a solver returns when cut short: no path, and no claim there is none
+        return solution.Solution(
+            found=False,
+            path=[],
+            path_length=0,
+            expanded_count=expanded_count,
+            visited_count=visited_count,
+            max_frontier=max_frontier,
+            budget_exceeded=self.reason,
+        )
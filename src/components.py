@@ -0,0 +1,169 @@
+# components.py
+# incremental connectivity of open cells (union-find), kept up to date
+# while a generator opens cells
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+import numpy as np
+
+from src import maze
+
+
+class ComponentTracker:
+    """
+    Union-find over the open cells of a width x height grid.
+
+    Each open cell stores a component label; labels are merged in a small
+    label-level disjoint set (union by size, path halving), so a merge never
+    touches cells. open_cell handles one cell, open_cells a whole batch with
+    NumPy (only label pairs that actually differ reach the Python loop).
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.label = np.full(width * height, -1, dtype=np.int32)  # -1 = not open
+        self.parent: List[int] = []
+        self.size: List[int] = []
+        self.component_count = 0
+        self._dirs = list(maze.DIRECTIONS)
+
+    # ---- label-level disjoint set ----
+
+    def _new_label(self, size: int = 1) -> int:
+        label = len(self.parent)
+        self.parent.append(label)
+        self.size.append(size)
+        self.component_count += 1
+        return label
+
+    def find(self, label: int) -> int:
+        parent = self.parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def union(self, a: int, b: int) -> int:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        self.component_count -= 1
+        return ra
+
+    # ---- cells ----
+
+    def _index(self, pos: maze.coord) -> int:
+        x, y = pos
+        return y * self.width + x
+
+    def is_open(self, pos: maze.coord) -> bool:
+        return bool(self.label[self._index(pos)] >= 0)
+
+    def open_cell(self, pos: maze.coord) -> None:
+        idx = self._index(pos)
+        if self.label[idx] >= 0:
+            return
+
+        x, y = pos
+        roots = []
+        for dx, dy in self._dirs:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                nl = int(self.label[ny * self.width + nx])
+                if nl >= 0:
+                    roots.append(self.find(nl))
+
+        if not roots:
+            self.label[idx] = self._new_label()
+            return
+
+        root = roots[0]
+        self.label[idx] = root
+        self.size[root] += 1
+        for other in roots[1:]:
+            root = self.union(root, other)
+
+    def open_cells(self, cells: np.ndarray) -> None:
+        # cells: flat indices (y * width + x) of currently closed cells, no repeats
+        cells = np.asarray(cells, dtype=np.int64)
+        if cells.size == 0:
+            return
+
+        width, height = self.width, self.height
+        xs = cells % width
+        nbrs = np.empty((cells.size, len(self._dirs)), dtype=np.int64)
+        valid = np.empty_like(nbrs, dtype=bool)
+        for j, (dx, dy) in enumerate(self._dirs):
+            n = cells + dy * width + dx
+            ok = (n >= 0) & (n < width * height)
+            if dx:
+                ok &= (xs + dx >= 0) & (xs + dx < width)
+            nbrs[:, j] = np.where(ok, n, 0)
+            valid[:, j] = ok
+
+        # 1) join the component of any already-open neighbor (fresh label if none)
+        roots = self._root_table()
+        neighbor_label = np.where(valid, self.label[nbrs], -1)
+        if roots.size:
+            own = np.where(neighbor_label >= 0, roots[np.maximum(neighbor_label, 0)], -1).max(axis=1)
+        else:
+            own = np.full(cells.size, -1, dtype=np.int64)
+
+        fresh = np.flatnonzero(own < 0)
+        if fresh.size:
+            first = len(self.parent)
+            self.parent.extend(range(first, first + fresh.size))
+            self.size.extend([0] * fresh.size)
+            self.component_count += int(fresh.size)
+            own[fresh] = np.arange(first, first + fresh.size)
+
+        self.label[cells] = own
+        counts = np.bincount(own)
+        for label in np.flatnonzero(counts).tolist():
+            self.size[label] += int(counts[label])
+
+        # 2) merge wherever an open neighbor (old or from this batch) has another root
+        roots = self._root_table()
+        neighbor_label = np.where(valid, self.label[nbrs], -1)
+        has = neighbor_label >= 0
+        a = roots[np.broadcast_to(own[:, None], neighbor_label.shape)[has]]
+        b = roots[neighbor_label[has]]
+        differ = a != b
+        if differ.any():
+            pairs = np.unique(np.stack([a[differ], b[differ]], axis=1), axis=0)
+            for la, lb in pairs.tolist():
+                self.union(la, lb)
+
+    def _root_table(self) -> np.ndarray:
+        return np.array([self.find(i) for i in range(len(self.parent))], dtype=np.int64)
+
+    # ---- queries ----
+
+    def component_of(self, pos: maze.coord) -> Optional[int]:
+        label = int(self.label[self._index(pos)])
+        return None if label < 0 else self.find(label)
+
+    def connected(self, a: maze.coord, b: maze.coord) -> bool:
+        ca = self.component_of(a)
+        return ca is not None and ca == self.component_of(b)
+
+    def component_size(self, pos: maze.coord) -> int:
+        root = self.component_of(pos)
+        return 0 if root is None else self.size[root]
+
+    def labels(self) -> np.ndarray:
+        """(height, width) int32 array: -1 for walls, 0..k-1 per component."""
+        out = np.full(self.label.shape, -1, dtype=np.int32)
+        opened = self.label >= 0
+        if opened.any():
+            roots = self._root_table()[self.label[opened]]
+            _, dense = np.unique(roots, return_inverse=True)
+            out[opened] = dense
+        return out.reshape(self.height, self.width)
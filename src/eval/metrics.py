@@ -30,7 +30,7 @@ class SolverRunMetrics:
     open_ratio: Optional[float]
 
     # --- solver identity ---
-    solver_name: str   # "BFS" | "DFS" | "ASTAR"
+    solver_name: str   # "BFS" | "DFS" | "ASTAR" | "BIDIR_BFS" | "BIDIR_ASTAR" | "JPS" | ...
 
     # --- outcomes ---
     solved: bool
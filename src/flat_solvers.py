@@ -0,0 +1,257 @@
+# flat_solvers.py
+# BFS / DFS / A* on flat integer cell indices instead of (x, y) tuples.
+#
+# The maze is copied once into a wall-padded row-major buffer so the four
+# neighbors of cell i are always i-W, i+W, i-1, i+1 (no bounds checks).
+# parent / visited / g live in preallocated arrays indexed by cell.
+# Results (path, counters) match solvers.solve_bfs / solve_dfs / solve_astar.
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import List
+import heapq
+
+from src import maze, solution
+from src.budget import SearchBudget
+from src.grids import flat_cells
+
+
+@dataclass(frozen=True)
+class FlatMaze:
+    width: int            # original maze width
+    height: int           # original maze height
+    stride: int           # padded row length (width + 2)
+    cells: bytearray      # padded cell buffer, border is WALL
+    offsets: tuple        # neighbor offsets in maze.DIRECTIONS order
+    start: int
+    end: int
+
+    @property
+    def size(self) -> int:
+        return len(self.cells)
+
+    def index(self, pos: maze.coord) -> int:
+        x, y = pos
+        return (y + 1) * self.stride + (x + 1)
+
+    def coord(self, idx: int) -> maze.coord:
+        y, x = divmod(idx, self.stride)
+        return x - 1, y - 1
+
+
+def to_flat(m: maze.Maze) -> FlatMaze:
+    width, height = m.width, m.height
+    stride = width + 2
+
+    src = flat_cells(m.grid)
+    cells = bytearray([maze.WALL]) * (stride * (height + 2))
+    for y in range(height):
+        row_start = (y + 1) * stride + 1
+        cells[row_start:row_start + width] = src[y * width:(y + 1) * width]
+
+    offsets = tuple(dy * stride + dx for dx, dy in maze.DIRECTIONS)
+
+    def index(pos):
+        return (pos[1] + 1) * stride + (pos[0] + 1)
+
+    return FlatMaze(
+        width=width,
+        height=height,
+        stride=stride,
+        cells=cells,
+        offsets=offsets,
+        start=index(m.start),
+        end=index(m.end),
+    )
+
+
+def reconstruct_flat_path(fm: FlatMaze, parent: array, goal: int) -> List[maze.coord]:
+    path: List[maze.coord] = []
+    current = goal
+
+    while current != -1:
+        path.append(fm.coord(current))
+        current = parent[current]
+
+    path.reverse()
+    return path
+
+
+def _found(fm: FlatMaze, parent: array, goal: int, expanded_count: int,
+           visited_count: int, max_frontier: int) -> solution.Solution:
+    path = reconstruct_flat_path(fm, parent, goal)
+    return solution.Solution(
+        found=True,
+        path=path,
+        path_length=len(path) - 1,
+        expanded_count=expanded_count,
+        visited_count=visited_count,
+        max_frontier=max_frontier,
+    )
+
+
+def _not_found(expanded_count: int, visited_count: int, max_frontier: int) -> solution.Solution:
+    return solution.Solution(
+        found=False,
+        path=[],
+        path_length=0,
+        visited_count=visited_count,
+        expanded_count=expanded_count,
+        max_frontier=max_frontier,
+    )
+
+
+def solve_bfs_flat(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    fm = to_flat(m)
+    cells = fm.cells
+    offsets = fm.offsets
+    goal = fm.end
+
+    parent = array("q", [-1]) * fm.size
+    visited = bytearray(fm.size)
+    visited[fm.start] = 1
+    visited_count = 1
+
+    queue: deque[int] = deque([fm.start])
+    expanded_count = 0
+    max_frontier = 1
+
+    if budget is not None:
+        budget.start()
+
+    while queue:
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, visited_count, max_frontier)
+
+        if len(queue) > max_frontier:
+            max_frontier = len(queue)
+
+        current = queue.popleft()
+        expanded_count += 1
+
+        if current == goal:
+            return _found(fm, parent, current, expanded_count, visited_count, max_frontier)
+
+        for off in offsets:
+            n = current + off
+            if cells[n] == maze.OPEN and not visited[n]:
+                visited[n] = 1
+                visited_count += 1
+                parent[n] = current
+                queue.append(n)
+
+    return _not_found(expanded_count, visited_count, max_frontier)
+
+
+def solve_dfs_flat(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    fm = to_flat(m)
+    cells = fm.cells
+    offsets = fm.offsets
+    goal = fm.end
+
+    parent = array("q", [-1]) * fm.size
+    visited = bytearray(fm.size)
+    visited[fm.start] = 1
+    visited_count = 1
+
+    stack: List[int] = [fm.start]
+    expanded_count = 0
+    max_frontier = 1
+
+    if budget is not None:
+        budget.start()
+
+    while stack:
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, visited_count, max_frontier)
+
+        if len(stack) > max_frontier:
+            max_frontier = len(stack)
+
+        current = stack.pop()
+        expanded_count += 1
+
+        if current == goal:
+            return _found(fm, parent, current, expanded_count, visited_count, max_frontier)
+
+        for off in offsets:
+            n = current + off
+            if cells[n] == maze.OPEN and not visited[n]:
+                visited[n] = 1
+                visited_count += 1
+                parent[n] = current
+                stack.append(n)
+
+    return _not_found(expanded_count, visited_count, max_frontier)
+
+
+def solve_astar_flat(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    fm = to_flat(m)
+    cells = fm.cells
+    offsets = fm.offsets
+    stride = fm.stride
+    goal = fm.end
+    gy, gx = divmod(goal, stride)
+
+    unreached = fm.size  # larger than any real g
+    parent = array("q", [-1]) * fm.size
+    g_score = array("q", [unreached]) * fm.size
+    closed = bytearray(fm.size)
+    seen = bytearray(fm.size)
+
+    start = fm.start
+    g_score[start] = 0
+    seen[start] = 1
+    seen_count = 1
+
+    sy, sx = divmod(start, stride)
+    # heap of (f_score, tie_breaker, node)
+    open_set: list[tuple[int, int, int]] = [(abs(sx - gx) + abs(sy - gy), 0, start)]
+    tie = 1
+
+    expanded_count = 0
+    max_frontier = 1
+
+    if budget is not None:
+        budget.start()
+
+    while open_set:
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, seen_count, max_frontier)
+
+        if len(open_set) > max_frontier:
+            max_frontier = len(open_set)
+
+        _, _, current = heapq.heappop(open_set)
+        expanded_count += 1
+
+        # skip stale entries
+        if closed[current]:
+            continue
+
+        if current == goal:
+            return _found(fm, parent, current, expanded_count, seen_count, max_frontier)
+
+        closed[current] = 1
+        tentative_g = g_score[current] + 1  # move cost = 1
+
+        for off in offsets:
+            n = current + off
+            if cells[n] != maze.OPEN or tentative_g >= g_score[n]:
+                continue
+
+            parent[n] = current
+            g_score[n] = tentative_g
+
+            ny, nx = divmod(n, stride)
+            heapq.heappush(open_set, (tentative_g + abs(nx - gx) + abs(ny - gy), tie, n))
+            tie += 1
+
+            if not seen[n]:
+                seen[n] = 1
+                seen_count += 1
+
+    return _not_found(expanded_count, seen_count, max_frontier)
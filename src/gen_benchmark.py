@@ -0,0 +1,146 @@
+# gen_benchmark.py
+# generation throughput benchmark: times runner.run per config (the part
+# benchmark.benchmark never sees) and exports rows with benchmark.write_rows
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from itertools import product
+from time import perf_counter
+from typing import Iterable, List, Tuple
+
+from src import runner
+from src.maze import OPEN
+from src.benchmark import compute_maze_hash, make_run_id, write_rows
+
+
+@dataclass
+class GenerationRow:
+    run_id: str
+    width: int
+    height: int
+    family: str
+    seed_value: int | None
+    open_ratio: float | None
+    generator: str          # e.g. "backtracker", "eller", "frontier", "legacy"
+    grid_backend: str
+    maze_hash: str
+    cells: int
+    open_cells: int
+    runtime_ms: float
+    cells_per_s: float
+    peak_mem_kb: float | None  # tracemalloc peak of a separate, untimed build
+    retry_count: int           # backtracks (perfect) / rejected draws (legacy Family B)
+    batch_count: int           # frontier batches (Family B frontier engine)
+
+
+def sweep_configs(
+    families: Iterable[str] = ("A", "B"),
+    sizes: Iterable[Tuple[int, int]] = ((31, 31), (101, 101)),
+    open_ratios: Iterable[float] = (0.35, 0.5),
+    seeds: Iterable[int] = (1,),
+    perfect_algorithms: Iterable[str] = ("backtracker",),
+    family_b_engines: Iterable[str] = ("frontier",),
+) -> List[dict]:
+    # cartesian sweep; open_ratio/engine only vary for Family B, algorithm only for A
+    configs: List[dict] = []
+    for family, (width, height), seed_value in product(families, sizes, seeds):
+        family = family.upper().strip()
+        base = {"width": width, "height": height, "family": family, "seed_value": seed_value}
+        if family == "A":
+            for algorithm in perfect_algorithms:
+                configs.append(dict(base, perfect_algorithm=algorithm))
+        else:
+            for open_ratio, engine in product(open_ratios, family_b_engines):
+                configs.append(dict(base, open_ratio=open_ratio, family_b_engine=engine))
+    return configs
+
+
+def generator_name(cfg: dict) -> str:
+    family = cfg["family"].upper().strip()
+    if family == "A":
+        return cfg.get("perfect_algorithm", "backtracker")
+    if family == "B":
+        return cfg.get("family_b_engine", "frontier")
+    return "lazy"
+
+
+def benchmark_generation(
+    configs: List[dict],
+    repeats_per_config: int = 1,
+    grid_backend: str = "list",
+    measure_memory: bool = True,
+    export_path: str | None = None,
+    verbose: bool = False,
+) -> List[GenerationRow]:
+    rows: List[GenerationRow] = []
+
+    for cfg in configs:
+        for r in range(repeats_per_config):
+            generator = generator_name(cfg)
+            run_id = f"{make_run_id(cfg, repeat_index=r)}_{generator}"
+            stats: dict = {}
+
+            gc.collect()
+            t0 = perf_counter()
+            m = runner.run_config(cfg, grid_backend=grid_backend, stats=stats)
+            runtime_ms = (perf_counter() - t0) * 1000.0
+
+            peak_mem_kb = None
+            if measure_memory:
+                peak_mem_kb = measure_peak_memory_kb(cfg, grid_backend)
+
+            cells = m.width * m.height
+            row = GenerationRow(
+                run_id=run_id,
+                width=cfg["width"],
+                height=cfg["height"],
+                family=cfg["family"],
+                seed_value=cfg.get("seed_value"),
+                open_ratio=cfg.get("open_ratio"),
+                generator=generator,
+                grid_backend=grid_backend,
+                maze_hash=compute_maze_hash(m),
+                cells=cells,
+                open_cells=count_open(m),
+                runtime_ms=runtime_ms,
+                cells_per_s=cells / (runtime_ms / 1000.0) if runtime_ms > 0 else float("inf"),
+                peak_mem_kb=peak_mem_kb,
+                retry_count=stats.get("backtracks", 0) + stats.get("rejected_draws", 0),
+                batch_count=stats.get("frontier_batches", 0),
+            )
+            rows.append(row)
+
+            if verbose:
+                print(
+                    f"{run_id} | {row.generator:11s} cells/s={row.cells_per_s:,.0f} "
+                    f"ms={row.runtime_ms:.2f} peak_kb={row.peak_mem_kb} "
+                    f"retries={row.retry_count} batches={row.batch_count}"
+                )
+
+    if export_path is not None:
+        write_rows(rows, export_path)
+
+    return rows
+
+
+def measure_peak_memory_kb(cfg: dict, grid_backend: str = "list") -> float:
+    # tracemalloc slows allocation-heavy code, so this is a separate build
+    # from the timed one (seeded configs rebuild the same maze)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        runner.run_config(cfg, grid_backend=grid_backend)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024.0
+
+
+def count_open(m) -> int:
+    count = getattr(m.grid, "count", None)
+    if count is not None:
+        return count(OPEN)
+    return sum(row.count(OPEN) for row in m.grid)
@@ -1,22 +1,25 @@
 # generators.py
 from src import maze
+from src.components import ComponentTracker
+from src.grids import CompactGrid, as_numpy
 from src.rng import rng as prng
 
 from collections import deque
-from typing import List
+from random import Random
+from typing import Iterator, List
 
 
 import numpy as np
 
-def manhattan_distance_numpy(point1, point2):
-    """
-    Calculates the Manhattan distance between two NumPy arrays.
-    """
-    point1_arr = np.array(point1)
-    point2_arr = np.array(point2)
-    return np.sum(np.abs(point1_arr - point2_arr))
+GRID_BACKENDS = ("list", "compact")
+
+def create_grid(width: int, height: int, backend: str = "list") -> List[List[int]] | CompactGrid:
+    # "compact" -> grids.CompactGrid (1 byte/cell, same grid[y][x] interface)
+    if backend == "compact":
+        return CompactGrid(width, height, fill=maze.WALL)
+    if backend != "list":
+        raise ValueError(f"Unknown grid backend={backend!r}. Expected one of {GRID_BACKENDS}.")
 
-def create_grid(width: int, height: int) -> List[List[int]]:
     grid = []
     for y in range(height):
         row = []
@@ -26,7 +29,7 @@ def create_grid(width: int, height: int) -> List[List[int]]:
 
     return grid
 
-def create_maze(grid, start, end) -> maze.Maze:
+def create_maze(grid, start, end, components=None) -> maze.Maze:
 
 
     width = get_width(grid)
@@ -37,13 +40,16 @@ def create_maze(grid, start, end) -> maze.Maze:
 
     grid[sy][sx] = maze.OPEN
     grid[ey][ex] = maze.OPEN
-    created = maze.Maze(width, height, grid, start, end)
+    created = maze.Maze(width, height, grid, start, end, components)
 
     created.validate()
     return created
 
 # perfect maze
-def generate_perfect(grid: List[List[int]], start: maze.coord, end: maze.coord) -> List[List[int]]:
+def generate_perfect(grid: List[List[int]], start: maze.coord, end: maze.coord,
+                     rng: Random | None = None, stats: dict | None = None) -> List[List[int]]:
+    # stats: optional dict, gets "backtracks" (dead-end pops) added to it
+    r = rng if rng is not None else prng
     start_cell = snap_to_odd_interior(grid, start)
     end_cell   = snap_to_odd_interior(grid, end)
 
@@ -70,6 +76,7 @@ def generate_perfect(grid: List[List[int]], start: maze.coord, end: maze.coord)
 
     stack = [start_cell]
     visited = {start_cell}
+    backtracks = 0
 
     grid[start_cell[1]][start_cell[0]] = maze.OPEN
 
@@ -79,9 +86,10 @@ def generate_perfect(grid: List[List[int]], start: maze.coord, end: maze.coord)
         unvisited = [n for n in neighbors_2_steps((cx, cy)) if n not in visited]
         if not unvisited:
             stack.pop()
+            backtracks += 1
             continue
 
-        nx, ny = prng.choice(unvisited)
+        nx, ny = r.choice(unvisited)
 
         # carve wall between cells
         wx = (cx + nx) // 2
@@ -96,9 +104,120 @@ def generate_perfect(grid: List[List[int]], start: maze.coord, end: maze.coord)
     ex, ey = end_cell
     grid[ey][ex] = maze.OPEN
 
+    if stats is not None:
+        stats["backtracks"] = stats.get("backtracks", 0) + backtracks
+    return grid
+
+# perfect maze, streamed one row at a time (Eller's algorithm)
+def iter_eller_rows(width: int, height: int, seed: int | None = None,
+                    rng: Random | None = None) -> Iterator[bytes]:
+    """
+    Yield the grid rows (bytes of maze.WALL/OPEN) of a perfect maze on the
+    same odd-coordinate lattice as generate_perfect.
+
+    Only the current row's set labels are kept, so working memory is
+    O(width) for any height. Draws from rng (e.g. a GenerationContext's
+    stream), else a Random(seed) when a seed is given, else the shared prng.
+    """
+    if rng is not None:
+        r = rng
+    else:
+        r = Random(seed) if seed is not None else prng
+
+    cols = (width - 1) // 2
+    rows = (height - 1) // 2
+    wall_row = bytes([maze.WALL]) * width
+
+    emitted = 0
+    yield wall_row
+    emitted += 1
+
+    sets: List[int | None] = [None] * cols
+    next_id = 0
+
+    for row_index in range(rows if cols else 0):
+        last = row_index == rows - 1
+
+        # cells with no passage from above start their own set
+        for c in range(cols):
+            if sets[c] is None:
+                sets[c] = next_id
+                next_id += 1
+
+        members: dict[int, List[int]] = {}
+        for c, set_id in enumerate(sets):
+            members.setdefault(set_id, []).append(c)
+
+        cell_row = bytearray(wall_row)
+        for c in range(cols):
+            cell_row[2 * c + 1] = maze.OPEN
+
+        # join neighbors in different sets; the last row joins all of them
+        for c in range(cols - 1):
+            a, b = sets[c], sets[c + 1]
+            if a != b and (last or r.random() < 0.5):
+                cell_row[2 * c + 2] = maze.OPEN
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for col in members[b]:
+                    sets[col] = a
+                members[a].extend(members.pop(b))
+
+        yield bytes(cell_row)
+        emitted += 1
+        if last:
+            break
+
+        # every set carries on downward through at least one cell
+        below = bytearray(wall_row)
+        next_sets: List[int | None] = [None] * cols
+        for set_id, cs in members.items():
+            down = [c for c in cs if r.random() < 0.5]
+            if not down:
+                down = [r.choice(cs)]
+            for c in down:
+                below[2 * c + 1] = maze.OPEN
+                next_sets[c] = set_id
+
+        yield bytes(below)
+        emitted += 1
+        sets = next_sets
+
+    for _ in range(height - emitted):
+        yield wall_row
+
+
+def generate_perfect_eller(grid, start: maze.coord, end: maze.coord,
+                           rng: Random | None = None) -> List[List[int]]:
+    # fills an existing (list or compact) grid; start/end must already sit
+    # on the odd lattice (see snap_to_odd_interior), as for generate_perfect
+    for y, row in enumerate(iter_eller_rows(get_width(grid), get_height(grid), rng=rng)):
+        grid[y][:] = row
+
     return grid
 
-def generate_dense_solvable(grid, start, end, open_ratio: float) -> List[List[int]]:
+
+def write_eller_rows(path: str, width: int, height: int, seed: int | None = None) -> None:
+    # raw row-major cell bytes (width * height), written row by row
+    with open(path, "wb") as f:
+        for row in iter_eller_rows(width, height, seed):
+            f.write(row)
+
+FAMILY_B_ENGINES = ("frontier", "legacy")
+
+# share of the current frontier opened per vectorized batch; small enough
+# that growth stays close to opening one random frontier wall at a time
+FRONTIER_BATCH_FRACTION = 0.125
+
+def generate_dense_solvable(grid, start, end, open_ratio: float, engine: str = "frontier",
+                            tracker: ComponentTracker | None = None,
+                            rng: Random | None = None, stats: dict | None = None) -> List[List[int]]:
+    # engine="frontier": batched sampling from walls next to open cells (default)
+    # engine="legacy":   one random cell at a time with rejection (pre-frontier mazes)
+    # tracker: optional union-find, updated as every cell is opened
+    # stats: optional dict, gets "rejected_draws" (legacy) / "frontier_batches" added
+    if engine not in FAMILY_B_ENGINES:
+        raise ValueError(f"Unknown Family B engine={engine!r}. Expected one of {FAMILY_B_ENGINES}.")
 
     #clamps
     if open_ratio< 0.0:
@@ -108,41 +227,216 @@ def generate_dense_solvable(grid, start, end, open_ratio: float) -> List[List[in
 
     target_open = int(open_ratio * (get_width(grid) * get_height(grid)))
     
-    path_cells = carve_path_start_to_end(grid, start, end)
+    path_cells = carve_path_start_to_end(grid, start, end, rng)
     for cell in path_cells:
         cx = cell[0]
         cy = cell[1]
         grid[cy][cx] = maze.OPEN
+        if tracker is not None:
+            tracker.open_cell(cell)
+
+    # the carved path joins start to end and cells are only ever opened,
+    # so the result is always solvable: no final BFS, no regeneration
+    # (tracker.connected(start, end) confirms it in near-O(1))
+    if engine == "frontier":
+        batches = open_frontier_batches(grid, target_open, tracker, rng)
+        if stats is not None:
+            stats["frontier_batches"] = stats.get("frontier_batches", 0) + batches
+    else:
+        rejected = open_random_rejection(grid, target_open, tracker, rng)
+        if stats is not None:
+            stats["rejected_draws"] = stats.get("rejected_draws", 0) + rejected
+
+    return grid
 
-    while count_open_cells(grid) < target_open:
-        candidate = random_cell_position(grid)
+def open_random_rejection(grid, target_open: int, tracker: ComponentTracker | None = None,
+                          rng: Random | None = None) -> int:
+    # legacy Family B loop: uniform random cell, accepted if it is a wall
+    # touching an open cell; the open count is tracked instead of rescanned.
+    # Returns how many draws were rejected.
+    open_count = count_open_cells(grid)
+    rejected = 0
+
+    while open_count < target_open:
+        candidate = random_cell_position(grid, rng)
         cx = candidate[0]
         cy = candidate[1]
         if grid[cy][cx] == maze.OPEN:
+            rejected += 1
             continue
 
         open_nbrs = count_open_neighbors(grid, candidate)
 
         if open_nbrs == 0:
+            rejected += 1
             continue
 
 
         grid[cy][cx] = maze.OPEN
-
-    if not is_solvable(grid, start, end):
-        fresh = create_grid(get_width(grid), get_height(grid))
-        return generate_dense_solvable(fresh, start, end, open_ratio)
-
-    return grid
-
-def random_cell_position(grid) -> tuple :
+        open_count += 1
+        if tracker is not None:
+            tracker.open_cell(candidate)
+
+    return rejected
+
+def open_frontier_batches(grid, target_open: int, tracker: ComponentTracker | None = None,
+                          rng: Random | None = None) -> int:
+    # frontier = wall cells with an open 4-neighbor, kept as flat indices on
+    # a 1-cell padded lattice (no wraparound at row ends). Each batch opens
+    # a random sample of it, then only the new cells' neighbors are added.
+    # Returns the number of batches (no draw is ever rejected).
     width = get_width(grid)
     height = get_height(grid)
-    x = prng.randrange(width)
-    y = prng.randrange(height)
+    stride = width + 2
+
+    nrng = np.random.default_rng((rng if rng is not None else prng).getrandbits(64))
+
+    inside = np.zeros((height + 2, stride), dtype=bool)
+    inside[1:-1, 1:-1] = True
+    inside = inside.ravel()
+
+    is_open = np.zeros((height + 2, stride), dtype=bool)
+    is_open[1:-1, 1:-1] = as_numpy(grid) == maze.OPEN
+    is_open = is_open.ravel()
+
+    offsets = np.array([dy * stride + dx for dx, dy in maze.DIRECTIONS], dtype=np.int64)
+    in_frontier = np.zeros_like(is_open)
+
+    def walls_around(cells: np.ndarray) -> np.ndarray:
+        around = (cells[:, None] + offsets).ravel()
+        around = around[inside[around] & ~is_open[around] & ~in_frontier[around]]
+        return np.unique(around)
+
+    open_count = int(np.count_nonzero(is_open))
+    frontier = walls_around(np.flatnonzero(is_open))
+    in_frontier[frontier] = True
+    batches = 0
+
+    while open_count < target_open and frontier.size:
+        batches += 1
+        k = min(target_open - open_count, max(1, int(frontier.size * FRONTIER_BATCH_FRACTION)))
+        picked = nrng.choice(frontier.size, size=k, replace=False)
+        chosen = frontier[picked]
+
+        is_open[chosen] = True
+        in_frontier[chosen] = False
+        open_count += k
+        if tracker is not None:
+            cy, cx = np.divmod(chosen, stride)
+            tracker.open_cells((cy - 1) * width + (cx - 1))
+
+        keep = np.ones(frontier.size, dtype=bool)
+        keep[picked] = False
+        grown = walls_around(chosen)
+        in_frontier[grown] = True
+        frontier = np.concatenate([frontier[keep], grown])
+
+    opened = np.where(is_open.reshape(height + 2, stride)[1:-1, 1:-1], maze.OPEN, maze.WALL).astype(np.uint8)
+    write_cells(grid, opened)
+
+    return batches
+
+def write_cells(grid, cells: np.ndarray) -> None:
+    # copy a (height, width) array of cell values into a list or compact grid
+    if isinstance(grid, CompactGrid):
+        grid.to_numpy()[:] = cells
+    else:
+        for y in range(get_height(grid)):
+            grid[y][:] = cells[y].tolist()
+
+# batched Family B: K same-size mazes as one (K, H, W) uint8 array
+#
+# Each maze gets a monotone start->end path plus a random weight per cell,
+# both drawn from np.random.default_rng(its seed) alone. Every cell's
+# "arrival time" T is the cheapest weight sum of a route from the path
+# (first-passage growth); the target_open cells with the smallest T are
+# opened. T is found for all K mazes at once by shift-and-min relaxation,
+# and {T <= t} is always connected to the path, so every maze is solvable.
+# Maze k depends only on seeds[k], never on K or its position in the batch.
+
+def generate_dense_batch(seeds, width: int, height: int, open_ratio: float,
+                         start: maze.coord | None = None,
+                         end: maze.coord | None = None) -> np.ndarray:
+    if width <= 0 or height <= 0:
+        raise ValueError(f"width/height must be positive, got {width}x{height}")
+    open_ratio = min(max(open_ratio, 0.0), 1.0)
+    if start is None:
+        start = (0, 0)
+    if end is None:
+        end = (width - 1, height - 1)
+
+    seeds = list(seeds)
+    k = len(seeds)
+    if k == 0:
+        return np.empty((0, height, width), dtype=np.uint8)
+
+    (sx, sy), (ex, ey) = start, end
+    nx, ny = abs(ex - sx), abs(ey - sy)
+    x_steps = np.zeros(nx + ny, dtype=bool)
+    x_steps[:nx] = True
+
+    # (H, W, K) layout: every row/column sweep step below is one contiguous
+    # vector op across the whole batch
+    weights = np.empty((height, width, k), dtype=np.float64)
+    is_x = np.empty((k, nx + ny), dtype=bool)
+    for i, seed_value in enumerate(seeds):
+        r = np.random.default_rng(seed_value)
+        is_x[i] = r.permutation(x_steps)
+        weights[:, :, i] = r.random((height, width))
+
+    # ---- monotone carved path, all mazes at once ----
+    px = np.empty((k, nx + ny + 1), dtype=np.int64)
+    py = np.empty_like(px)
+    px[:, 0], py[:, 0] = sx, sy
+    px[:, 1:] = sx + (1 if ex >= sx else -1) * np.cumsum(is_x, axis=1)
+    py[:, 1:] = sy + (1 if ey >= sy else -1) * np.cumsum(~is_x, axis=1)
+
+    arrival = np.full((height, width, k), np.inf)
+    arrival[py, px, np.arange(k)[:, None]] = 0.0
+
+    # ---- first-passage times: fast sweeping (down/up rows, right/left
+    # columns) until a full round changes nothing; positive weights give a
+    # unique fixed point, so the sweep order does not change the result ----
+    changed = True
+    while changed:
+        before = arrival.copy()
+        for y in range(1, height):
+            np.minimum(arrival[y], arrival[y - 1] + weights[y], out=arrival[y])
+        for y in range(height - 2, -1, -1):
+            np.minimum(arrival[y], arrival[y + 1] + weights[y], out=arrival[y])
+        for x in range(1, width):
+            np.minimum(arrival[:, x], arrival[:, x - 1] + weights[:, x], out=arrival[:, x])
+        for x in range(width - 2, -1, -1):
+            np.minimum(arrival[:, x], arrival[:, x + 1] + weights[:, x], out=arrival[:, x])
+        changed = not np.array_equal(before, arrival)
+
+    # ---- open the target_open earliest cells (at least the whole path) ----
+    cells = width * height
+    target_open = int(open_ratio * cells)
+    flat = arrival.reshape(cells, k).T
+    n_open = max(target_open, nx + ny + 1)
+    opened = np.zeros((k, cells), dtype=bool)
+    if n_open >= cells:
+        opened[:] = True
+    else:
+        earliest = np.argpartition(flat, n_open - 1, axis=1)[:, :n_open]
+        np.put_along_axis(opened, earliest, True, axis=1)
+
+    return np.where(opened, maze.OPEN, maze.WALL).astype(np.uint8).reshape(k, height, width)
+
+
+def random_cell_position(grid, rng: Random | None = None) -> tuple :
+    r = rng if rng is not None else prng
+    width = get_width(grid)
+    height = get_height(grid)
+    x = r.randrange(width)
+    y = r.randrange(height)
     return x, y
 
 def count_open_cells(grid) -> int :
+    if isinstance(grid, CompactGrid):
+        return grid.count(maze.OPEN)
+
     count = 0
     for y in range(get_height(grid)):
         for x in range(get_width(grid)):
@@ -160,7 +454,8 @@ def count_open_neighbors(grid, cell: tuple) -> int:
             count += 1
     return count
 
-def carve_path_start_to_end(grid, start, end) -> List[tuple]:
+def carve_path_start_to_end(grid, start, end, rng: Random | None = None) -> List[tuple]:
+    r = rng if rng is not None else prng
     current = start
     path = [start]
     visited = {start}
@@ -178,21 +473,22 @@ def carve_path_start_to_end(grid, start, end) -> List[tuple]:
         better = []
 
 
+        current_dist = abs(cx - end[0]) + abs(cy - end[1])
         for n in neighbors:
-            if manhattan_distance_numpy(n, end) < manhattan_distance_numpy(current, end):
+            if abs(n[0] - end[0]) + abs(n[1] - end[1]) < current_dist:
                 better.append(n)
 
-        if better and prng.random() < 0.85:
-            nxt = prng.choice(better)
+        if better and r.random() < 0.85:
+            nxt = r.choice(better)
         else:
-            nxt = prng.choice(neighbors)
+            nxt = r.choice(neighbors)
 
 
 
         if nxt in visited:
             unvisited = [n for n in neighbors if n not in visited]
             if unvisited:
-                 nxt = prng.choice(unvisited)
+                 nxt = r.choice(unvisited)
 
         current = nxt
         path.append(current)
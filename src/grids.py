@@ -0,0 +1,288 @@
+# grids.py
+# compact grid backend: one byte per cell in a single contiguous buffer
+
+from __future__ import annotations
+from typing import Iterator, List
+
+import numpy as np
+
+from src import maze
+
+
+class CompactGrid:
+    """
+    Row-major uint8 cell store that behaves like a List[List[int]] grid.
+
+    grid[y][x] reads/writes go through a memoryview of the row, so code
+    written against list grids (generators, analyzer, display, hashing)
+    works unchanged. Maze picks up `cells` directly for flat indexing.
+    """
+    __slots__ = ("width", "height", "cells", "_view")
+
+    def __init__(self, width: int, height: int, cells=None, fill: int = maze.WALL):
+        if width <= 0 or height <= 0:
+            raise ValueError(f"width/height must be positive, got {width}x{height}")
+
+        if cells is None:
+            cells = bytearray([fill]) * (width * height)
+        elif len(cells) != width * height:
+            raise ValueError(
+                f"cells size mismatch: len(cells)={len(cells)} but width*height={width * height}"
+            )
+
+        self.width = width
+        self.height = height
+        self.cells = cells
+        # one view of the whole buffer; grid[y] slices it instead of wrapping
+        # cells in a new memoryview on every row access
+        self._view = memoryview(cells)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> memoryview:
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError(f"row out of range: y={y}")
+        start = y * self.width
+        return self._view[start:start + self.width]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for y in range(self.height):
+            yield self[y]
+
+    def __reduce__(self):
+        # rebuild on a private buffer so copies/pickles are independent;
+        # read-only grids stay read-only
+        if self.readonly:
+            return self.__class__, (self.width, self.height, bytes(self.cells))
+        return self.__class__, (self.width, self.height, bytearray(self.cells))
+
+    def __copy__(self) -> "CompactGrid":
+        return self if self.readonly else self.__class__(self.width, self.height, bytearray(self.cells))
+
+    def __deepcopy__(self, memo) -> "CompactGrid":
+        # nothing can change a read-only grid, so copies may share it
+        return self.__copy__()
+
+    @property
+    def readonly(self) -> bool:
+        cells = self.cells
+        if isinstance(cells, bytes):
+            return True
+        return isinstance(cells, memoryview) and cells.readonly
+
+    def frozen(self) -> "CompactGrid":
+        """Read-only version of this grid (self if already read-only, else one copy)."""
+        if self.readonly:
+            return self
+        return self.__class__(self.width, self.height, bytes(self.cells))
+
+    def release(self) -> None:
+        # drop this grid's views of its buffer, so a buffer that must be
+        # closed (shared memory) can be; the grid is unusable afterwards
+        self._view.release()
+        if isinstance(self.cells, memoryview):
+            self.cells.release()
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[y * self.width + x]
+
+    def set(self, x: int, y: int, value: int) -> None:
+        self.cells[y * self.width + x] = value
+
+    def count(self, value: int) -> int:
+        cells = self.cells
+        if not isinstance(cells, (bytes, bytearray)):
+            cells = bytes(cells)
+        return cells.count(value)
+
+    def to_numpy(self) -> np.ndarray:
+        # zero-copy (height, width) uint8 view
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height, self.width)
+
+    def tolist(self) -> List[List[int]]:
+        return [list(row) for row in self]
+
+    @classmethod
+    def from_rows(cls, grid) -> "CompactGrid":
+        height = len(grid)
+        width = len(grid[0])
+        cells = bytearray(width * height)
+        for y, row in enumerate(grid):
+            cells[y * width:(y + 1) * width] = bytes(row)
+        return cls(width, height, cells)
+
+    @classmethod
+    def from_numpy(cls, arr: np.ndarray) -> "CompactGrid":
+        if arr.ndim != 2:
+            raise ValueError(f"expected a 2D array, got shape={arr.shape}")
+        height, width = arr.shape
+        return cls(width, height, bytearray(np.ascontiguousarray(arr, dtype=np.uint8).tobytes()))
+
+
+class PackedCells:
+    """Read-only flat view of a bit-packed buffer: cells[i] -> 0/1 (bit i, LSB first)."""
+    __slots__ = ("bits", "size")
+
+    def __init__(self, bits, size: int):
+        self.bits = bits
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, i: int) -> int:
+        return (self.bits[i >> 3] >> (i & 7)) & 1
+
+
+class PackedRow:
+    __slots__ = ("cells", "start", "width")
+
+    def __init__(self, cells: PackedCells, start: int, width: int):
+        self.cells = cells
+        self.start = start
+        self.width = width
+
+    def __len__(self) -> int:
+        return self.width
+
+    def __getitem__(self, x: int) -> int:
+        if x < 0:
+            x += self.width
+        if not 0 <= x < self.width:
+            raise IndexError(f"column out of range: x={x}")
+        return self.cells[self.start + x]
+
+    def __iter__(self) -> Iterator[int]:
+        cells = self.cells
+        for i in range(self.start, self.start + self.width):
+            yield cells[i]
+
+
+class PackedGrid:
+    """
+    Read-only grid over 1 bit per cell (1 = WALL), e.g. a memory-mapped
+    maze file (see maze_format). grid[y][x] and Maze's flat fast path read
+    bits in place; to_numpy()/flat_cells() unpack into a fresh buffer.
+    """
+    __slots__ = ("width", "height", "bits", "cells")
+    readonly = True
+
+    def __init__(self, width: int, height: int, bits):
+        if width <= 0 or height <= 0:
+            raise ValueError(f"width/height must be positive, got {width}x{height}")
+        if len(bits) < packed_size(width, height):
+            raise ValueError(
+                f"bits size mismatch: len(bits)={len(bits)} but need {packed_size(width, height)}"
+            )
+
+        self.width = width
+        self.height = height
+        self.bits = bits
+        self.cells = PackedCells(bits, width * height)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> PackedRow:
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError(f"row out of range: y={y}")
+        return PackedRow(self.cells, y * self.width, self.width)
+
+    def __iter__(self) -> Iterator[PackedRow]:
+        for y in range(self.height):
+            yield self[y]
+
+    def __reduce__(self):
+        return self.__class__, (self.width, self.height, bytes(self.bits))
+
+    def __deepcopy__(self, memo) -> "PackedGrid":
+        return self
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[y * self.width + x]
+
+    def count(self, value: int) -> int:
+        walls = int(np.count_nonzero(self.to_numpy()))
+        return walls if value == maze.WALL else self.width * self.height - walls
+
+    def to_numpy(self) -> np.ndarray:
+        # unpacked (height, width) uint8 copy
+        packed = np.frombuffer(self.bits, dtype=np.uint8, count=packed_size(self.width, self.height))
+        flat = np.unpackbits(packed, count=self.width * self.height, bitorder="little")
+        return flat.reshape(self.height, self.width)
+
+    def tolist(self) -> List[List[int]]:
+        return self.to_numpy().tolist()
+
+
+def packed_size(width: int, height: int) -> int:
+    return (width * height + 7) // 8
+
+
+def pack_bits(grid) -> bytes:
+    """1 bit per cell, row-major, LSB first; WALL=1 / OPEN=0 as in maze.py."""
+    if isinstance(grid, PackedGrid):
+        return bytes(grid.bits[:packed_size(grid.width, grid.height)])
+    return np.packbits(as_numpy(grid).ravel() == maze.WALL, bitorder="little").tobytes()
+
+
+def freeze_grid(grid):
+    """Read-only CompactGrid (or other read-only grid) with the same cells."""
+    if getattr(grid, "readonly", False):
+        return grid
+    if isinstance(grid, CompactGrid):
+        return grid.frozen()
+    if isinstance(grid, np.ndarray):
+        height, width = grid.shape
+        return CompactGrid(width, height, np.ascontiguousarray(grid, dtype=np.uint8).tobytes())
+    return CompactGrid(len(grid[0]), len(grid), bytes(flat_cells(grid)))
+
+
+def freeze_maze(m: maze.Maze) -> maze.Maze:
+    """
+    Immutable version of m: read-only grid and component labels.
+
+    Converting costs one copy of the cells (none if m is already frozen);
+    after that the maze can be handed to any number of solvers or threads
+    without cloning, and copy.deepcopy returns it as-is.
+    """
+    grid = freeze_grid(m.grid)
+
+    components = m.components
+    if components is not None and getattr(components, "flags", None) is not None and components.flags.writeable:
+        components = components.view()
+        components.flags.writeable = False
+
+    if grid is m.grid and components is m.components:
+        return m
+    return maze.Maze(m.width, m.height, grid, m.start, m.end, components)
+
+
+def flat_cells(grid):
+    """
+    Row-major cell buffer for any supported grid (indexable by y*width+x).
+
+    Compact grids return their own buffer; list/NumPy/bit-packed grids are
+    unpacked into a fresh bytearray.
+    """
+    if isinstance(grid, CompactGrid):
+        return grid.cells
+    if isinstance(grid, PackedGrid):
+        return bytearray(grid.to_numpy().tobytes())
+    if isinstance(grid, np.ndarray):
+        return bytearray(np.ascontiguousarray(grid, dtype=np.uint8).tobytes())
+    return bytearray().join(bytes(row) for row in grid)
+
+
+def as_numpy(grid) -> np.ndarray:
+    """(height, width) uint8 array for any supported grid; zero-copy when possible."""
+    if isinstance(grid, (CompactGrid, PackedGrid)):
+        return grid.to_numpy()
+    if isinstance(grid, np.ndarray):
+        return grid
+    return np.asarray(grid, dtype=np.uint8)
@@ -0,0 +1,192 @@
+# junction_graph.py
+# corridor contraction: 1-wide corridors collapse into weighted edges
+#
+# nodes  = open cells whose degree != 2 (junctions, dead ends) + start + end
+# edges  = corridors between nodes, weight = number of steps
+# Built once per Maze (cached by identity) and searched with Dijkstra/A*;
+# the cell path is rebuilt from the stored corridor cells.
+
+from __future__ import annotations
+
+import heapq
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src import maze, solution
+from src.budget import SearchBudget
+from src.solvers import h, reconstruct_path
+
+
+# adjacency entry: (neighbor node, corridor steps, corridor id, walked backwards)
+Edge = Tuple[maze.coord, int, int, bool]
+
+
+@dataclass
+class JunctionGraph:
+    start: maze.coord
+    end: maze.coord
+    adjacency: Dict[maze.coord, List[Edge]] = field(default_factory=dict)
+    corridors: List[List[maze.coord]] = field(default_factory=list)  # interior cells, stored once
+
+    @property
+    def node_count(self) -> int:
+        return len(self.adjacency)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.corridors)
+
+    def corridor_cells(self, corridor_id: int, reverse: bool) -> List[maze.coord]:
+        cells = self.corridors[corridor_id]
+        return cells[::-1] if reverse else list(cells)
+
+    def expand_path(self, nodes: List[maze.coord], edges_used: List[Edge]) -> List[maze.coord]:
+        if not nodes:
+            return []
+
+        path: List[maze.coord] = [nodes[0]]
+        for node, (_, _, corridor_id, reverse) in zip(nodes[1:], edges_used):
+            path.extend(self.corridor_cells(corridor_id, reverse))
+            path.append(node)
+        return path
+
+
+def build_junction_graph(m: maze.Maze) -> JunctionGraph:
+    def is_node(pos: maze.coord, degree: int) -> bool:
+        return degree != 2 or pos == m.start or pos == m.end
+
+    graph = JunctionGraph(start=m.start, end=m.end)
+
+    # nodes are every open cell that is not a plain corridor cell
+    for y in range(m.height):
+        for x in range(m.width):
+            pos = (x, y)
+            if m.is_open(pos) and is_node(pos, len(m.neighbors(pos))):
+                graph.adjacency[pos] = []
+
+    # walk each corridor once; the reverse edge shares its cell list
+    traced: set[Tuple[maze.coord, maze.coord]] = set()
+
+    for node in graph.adjacency:
+        for first in m.neighbors(node):
+            if (node, first) in traced:
+                continue
+
+            prev, current = node, first
+            cells: List[maze.coord] = []
+            while current not in graph.adjacency:
+                cells.append(current)
+                nxt = [n for n in m.neighbors(current) if n != prev]
+                prev, current = current, nxt[0]
+
+            other = current
+            traced.add((node, first))
+            traced.add((other, prev))
+
+            if other == node:
+                continue  # loop back to the same node never shortens a path
+
+            corridor_id = len(graph.corridors)
+            graph.corridors.append(cells)
+            steps = len(cells) + 1
+            graph.adjacency[node].append((other, steps, corridor_id, False))
+            graph.adjacency[other].append((node, steps, corridor_id, True))
+
+    return graph
+
+
+# id(maze) -> graph; entries drop when the Maze is garbage collected
+_GRAPH_CACHE: Dict[int, JunctionGraph] = {}
+
+
+def junction_graph_for(m: maze.Maze) -> JunctionGraph:
+    key = id(m)
+    graph = _GRAPH_CACHE.get(key)
+    if graph is None or graph.start != m.start or graph.end != m.end:
+        graph = build_junction_graph(m)
+        _GRAPH_CACHE[key] = graph
+        weakref.finalize(m, _GRAPH_CACHE.pop, key, None)
+    return graph
+
+
+def solve_junction_dijkstra(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    return _search_junction_graph(junction_graph_for(m), use_heuristic=False, budget=budget)
+
+
+def solve_junction_astar(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    return _search_junction_graph(junction_graph_for(m), use_heuristic=True, budget=budget)
+
+
+def _search_junction_graph(graph: JunctionGraph, use_heuristic: bool,
+                           budget: SearchBudget | None = None) -> solution.Solution:
+    # the budget covers the search only; building the graph (once per maze,
+    # cached) is not counted against it
+    start = graph.start
+    goal = graph.end
+
+    def estimate(node: maze.coord) -> int:
+        return h(node, goal) if use_heuristic else 0
+
+    # heap of (f_score, tie_breaker, node)
+    open_set: list[tuple[int, int, maze.coord]] = [(estimate(start), 0, start)]
+    tie = 1
+
+    came_from: Dict[maze.coord, Optional[maze.coord]] = {start: None}
+    edge_to: Dict[maze.coord, Edge] = {}
+    g_score: Dict[maze.coord, int] = {start: 0}
+    closed: set[maze.coord] = set()
+
+    expanded_count = 0
+    max_frontier = 1
+
+    if budget is not None:
+        budget.start()
+
+    while open_set:
+        max_frontier = max(max_frontier, len(open_set))
+
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, len(g_score), max_frontier)
+
+        _, _, current = heapq.heappop(open_set)
+        expanded_count += 1
+
+        # skip stale entries
+        if current in closed:
+            continue
+
+        if current == goal:
+            nodes = reconstruct_path(came_from, goal=current)
+            path = graph.expand_path(nodes, [edge_to[n] for n in nodes[1:]])
+            return solution.Solution(
+                found=True,
+                path=path,
+                path_length=len(path) - 1,
+                expanded_count=expanded_count,
+                visited_count=len(g_score),
+                max_frontier=max_frontier,
+            )
+
+        closed.add(current)
+
+        for edge in graph.adjacency[current]:
+            neighbor, steps = edge[0], edge[1]
+            tentative_g = g_score[current] + steps
+
+            if tentative_g < g_score.get(neighbor, float("inf")):
+                came_from[neighbor] = current
+                edge_to[neighbor] = edge
+                g_score[neighbor] = tentative_g
+                heapq.heappush(open_set, (tentative_g + estimate(neighbor), tie, neighbor))
+                tie += 1
+
+    #No path found
+    return solution.Solution(
+        found=False,
+        path=[],
+        path_length=0,
+        visited_count=len(g_score),
+        expanded_count=expanded_count,
+        max_frontier=max_frontier,
+    )
@@ -0,0 +1,228 @@
+# lazy_maze.py
+# procedurally defined mazes: a cell's state is a pure function of
+# (seed, x, y), computed only when something reads it
+#
+# cell is OPEN if hash(seed, x, y) < open_ratio * 2**64, plus a guaranteed
+# staircase corridor from start to end (so every lazy maze is solvable)
+# whose membership test is O(1). Cells are computed a block at a time with
+# NumPy and kept in a bounded LRU memo, so a search pays only for the blocks
+# around the cells it visits, whatever the nominal width/height.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Iterator, Tuple
+
+import numpy as np
+
+from src import maze
+
+DEFAULT_BLOCK_SIZE = 32
+DEFAULT_MAX_BLOCKS = 4096
+
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(z: np.ndarray) -> np.ndarray:
+    # uint64 arithmetic wraps, as the mixer expects
+    z = z + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def cell_hashes(seed: int, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Deterministic 64-bit hash per (x, y); broadcasts like NumPy arithmetic."""
+    key = _splitmix64(np.full(1, seed & _MASK64, dtype=np.uint64))
+    xs = xs.astype(np.uint64)
+    ys = ys.astype(np.uint64)
+    return _splitmix64(key ^ _splitmix64(xs * np.uint64(0x100000001B3) ^ (ys << np.uint64(32)) ^ ys))
+
+
+class LazyCells:
+    """Flat view (index y*width + x) over a LazyGrid, for Maze's fast path."""
+    __slots__ = ("grid", "width")
+
+    def __init__(self, grid: "LazyGrid"):
+        self.grid = grid
+        self.width = grid.width
+
+    def __len__(self) -> int:
+        return self.grid.width * self.grid.height
+
+    def __getitem__(self, i: int) -> int:
+        y, x = divmod(i, self.width)
+        return self.grid.get(x, y)
+
+
+class LazyRow:
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid: "LazyGrid", y: int):
+        self.grid = grid
+        self.y = y
+
+    def __len__(self) -> int:
+        return self.grid.width
+
+    def __getitem__(self, x: int) -> int:
+        if x < 0:
+            x += self.grid.width
+        if not 0 <= x < self.grid.width:
+            raise IndexError(f"column out of range: x={x}")
+        return self.grid.get(x, self.y)
+
+    def __iter__(self) -> Iterator[int]:
+        get = self.grid.get
+        for x in range(self.grid.width):
+            yield get(x, self.y)
+
+
+class LazyGrid:
+    """
+    Read-only grid whose cells are derived from a seed on access.
+
+    Blocks of block_size x block_size cells are memoized (LRU, at most
+    max_blocks); hits/misses/evictions are counted like tiled.TiledGrid.
+    Iterating the whole grid works but materializes it, so keep that to
+    small mazes.
+    """
+    readonly = True
+
+    def __init__(self, width: int, height: int, seed: int, open_ratio: float,
+                 start: maze.coord, end: maze.coord, *,
+                 block_size: int = DEFAULT_BLOCK_SIZE, max_blocks: int = DEFAULT_MAX_BLOCKS):
+        if width <= 0 or height <= 0:
+            raise ValueError(f"width/height must be positive, got {width}x{height}")
+        if not (0.0 <= open_ratio <= 1.0):
+            raise ValueError(f"open_ratio must be in [0.0, 1.0], got {open_ratio}")
+        if block_size <= 0 or max_blocks < 1:
+            raise ValueError(f"block_size/max_blocks must be positive, got {block_size}/{max_blocks}")
+
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.open_ratio = open_ratio
+        self.start = start
+        self.end = end
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.cells = LazyCells(self)
+
+        # hash < threshold -> open; open_ratio=1.0 opens everything
+        self._threshold = np.uint64(min(int(open_ratio * 2.0 ** 64), _MASK64))
+        self._all_open = open_ratio >= 1.0
+
+        self._blocks: OrderedDict[Tuple[int, int], bytes] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __reduce__(self):
+        # same definition, cold memo
+        return _rebuild_lazy_grid, (self.width, self.height, self.seed, self.open_ratio,
+                                    self.start, self.end, self.block_size, self.max_blocks)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> LazyRow:
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError(f"row out of range: y={y}")
+        return LazyRow(self, y)
+
+    def __iter__(self) -> Iterator[LazyRow]:
+        for y in range(self.height):
+            yield self[y]
+
+    def get(self, x: int, y: int) -> int:
+        b = self.block_size
+        return self.block(x // b, y // b)[(y % b) * b + x % b]
+
+    def block(self, bx: int, by: int) -> bytes:
+        key = (bx, by)
+        blocks = self._blocks
+        data = blocks.get(key)
+        if data is not None:
+            self.hits += 1
+            blocks.move_to_end(key)
+            return data
+
+        self.misses += 1
+        data = self._compute_block(bx, by)
+        blocks[key] = data
+        if len(blocks) > self.max_blocks:
+            blocks.popitem(last=False)
+            self.evictions += 1
+        return data
+
+    def _compute_block(self, bx: int, by: int) -> bytes:
+        b = self.block_size
+        x0, y0 = bx * b, by * b
+        xs = np.arange(x0, x0 + b, dtype=np.int64)
+        ys = np.arange(y0, y0 + b, dtype=np.int64)
+
+        if self._all_open:
+            open_mask = np.ones((b, b), dtype=bool)
+        else:
+            open_mask = cell_hashes(self.seed, xs[None, :], ys[:, None]) < self._threshold
+
+        for row, y in enumerate(ys.tolist()):
+            span = self._corridor_span(y)
+            if span is not None:
+                lo, hi = max(span[0], x0), min(span[1], x0 + b - 1)
+                if lo <= hi:
+                    open_mask[row, lo - x0:hi - x0 + 1] = True
+
+        open_mask &= (xs < self.width)[None, :] & (ys < self.height)[:, None]
+        return np.where(open_mask, maze.OPEN, maze.WALL).astype(np.uint8).tobytes()
+
+    def _corridor_span(self, y: int) -> Tuple[int, int] | None:
+        # staircase from start to end: row t (t = |y - sy|) covers x between
+        # a(t) and a(t+1), with a(t) stepping evenly from sx to ex
+        (sx, sy), (ex, ey) = self.start, self.end
+        n = abs(ey - sy)
+        t = (y - sy) if ey >= sy else (sy - y)
+        if not 0 <= t <= n:
+            return None
+        if n == 0:
+            return min(sx, ex), max(sx, ex)
+
+        a = sx + (ex - sx) * t // n
+        a_next = sx + (ex - sx) * min(t + 1, n) // n
+        return min(a, a_next), max(a, a_next)
+
+    def blocks_in_memory(self) -> int:
+        return len(self._blocks)
+
+    def stats(self) -> Dict[str, float]:
+        accesses = self.hits + self.misses
+        return {
+            "block_size": self.block_size,
+            "max_blocks": self.max_blocks,
+            "block_hits": self.hits,
+            "block_misses": self.misses,
+            "block_evictions": self.evictions,
+            "block_hit_rate": self.hits / accesses if accesses else 0.0,
+        }
+
+
+def _rebuild_lazy_grid(width, height, seed, open_ratio, start, end, block_size, max_blocks):
+    return LazyGrid(width, height, seed, open_ratio, start, end,
+                    block_size=block_size, max_blocks=max_blocks)
+
+
+def create_lazy_maze(width: int, height: int, seed: int, open_ratio: float, *,
+                     start: maze.coord | None = None, end: maze.coord | None = None,
+                     block_size: int = DEFAULT_BLOCK_SIZE,
+                     max_blocks: int = DEFAULT_MAX_BLOCKS) -> maze.Maze:
+    if start is None:
+        start = (0, 0)
+    if end is None:
+        end = (width - 1, height - 1)
+
+    grid = LazyGrid(width, height, seed, open_ratio, start, end,
+                    block_size=block_size, max_blocks=max_blocks)
+    return maze.Maze(width, height, grid, start, end)
@@ -1,7 +1,8 @@
 # maze.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Tuple, List
+import copy
+from dataclasses import dataclass, field
+from typing import Tuple, List, Any
 
 
 coord = Tuple[int, int] #coordinate(x,y)
@@ -20,9 +21,36 @@ DIRECTIONS = [
 class Maze:
     width:int
     height:int
-    grid: List[List[int]]
+    grid: List[List[int]]  # or any grid with grid[y][x] access (e.g. grids.CompactGrid)
     start: coord
     end: coord
+    # optional (height, width) component labels, -1 for walls (see components.ComponentTracker)
+    components: Any = field(default=None, repr=False, compare=False)
+    # flat row-major cell buffer when the grid exposes one (compact backend)
+    _cells: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_cells", getattr(self.grid, "cells", None))
+
+    # _cells aliases grid storage; rebuild it on copy/unpickle instead of copying it twice
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state.pop("_cells", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__post_init__()
+
+    # a maze over a read-only grid (grids.freeze_maze) cannot change, so
+    # copies share it instead of duplicating the cells
+    def __deepcopy__(self, memo: dict) -> "Maze":
+        if getattr(self.grid, "readonly", False):
+            return self
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        clone.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return clone
 
     def in_bounds(self, pos: coord) -> bool:
         x, y = pos
@@ -33,12 +61,25 @@ class Maze:
         if not self.in_bounds(pos):
             return False
         x, y = pos
+        cells = self._cells
+        if cells is not None:
+            return cells[y * self.width + x] == OPEN
         return self.grid[y][x] == OPEN
 
     def neighbors(self, pos: coord) -> List[coord]:
         x, y = pos
         results = []
 
+        cells = self._cells
+        if cells is not None:
+            width = self.width
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if (0 <= nx < width and 0 <= ny < self.height
+                        and cells[ny * width + nx] == OPEN):
+                    results.append((nx, ny))
+            return results
+
         for dx, dy in DIRECTIONS:
             nx, ny = x + dx, y + dy
             next_pos = (nx, ny)
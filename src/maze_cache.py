@@ -0,0 +1,208 @@
+# maze_cache.py
+# on-disk, content-addressed cache of generated mazes
+#
+# key      = sha256 of the normalized generation config + GENERATOR_VERSION
+# entry    = <key>.cells (raw row-major cell bytes) + optional <key>.labels.npy
+# index    = index.json: key -> {width, height, start, end, maze_hash, bytes, last_used}
+# Hits are memory-mapped (copy-on-write), never regenerated. Total size is
+# bounded by max_bytes with least-recently-used eviction. One process per
+# cache directory at a time; the index is rewritten atomically on put, and
+# hits only bump in-memory LRU clocks until flush()/close().
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+from src import maze as maze_mod
+from src import runner
+from src.benchmark import compute_maze_hash
+from src.grids import CompactGrid, flat_cells
+
+# bump whenever generators produce different mazes for the same config
+GENERATOR_VERSION = 1
+
+# generation options that change the maze, with runner.run's defaults
+_KEY_DEFAULTS = {
+    "seed_value": None,
+    "open_ratio": None,
+    "perfect_algorithm": "backtracker",
+    "family_b_engine": "frontier",
+}
+
+
+def cache_key(cfg: dict) -> str:
+    normalized = dict(_KEY_DEFAULTS)
+    normalized.update(cfg)
+    normalized["family"] = str(normalized["family"]).upper().strip()
+    if normalized["family"] == "A":
+        normalized["open_ratio"] = None
+    normalized["generator_version"] = GENERATOR_VERSION
+
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MazeCache:
+    def __init__(self, root: str, max_bytes: int = 1 << 30):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(root, exist_ok=True)
+
+        self._index_path = os.path.join(root, "index.json")
+        self._index: Dict[str, dict] = self._load_index()
+        self._by_hash: Dict[str, str] = {e["maze_hash"]: key for key, e in self._index.items()}
+        self._clock = max((e["last_used"] for e in self._index.values()), default=0)
+        self._dirty = False  # LRU clocks changed since the index was last written
+
+        self.hits = 0
+        self.misses = 0
+
+    # ---- public API ----
+
+    def run_config(self, cfg: dict, *, verbose: bool = False) -> maze_mod.Maze:
+        """runner.run_config, served from disk when this config was built before."""
+        cached = self.get(cfg)
+        if cached is not None:
+            return cached
+
+        built = runner.run_config(cfg, verbose=verbose)
+        key = self.put(cfg, built)
+        if key is None:
+            return built
+        # hand out the stored form on a miss too, so every caller sees the
+        # same grid type whether or not this was the first build
+        return self._load(key, self._index[key])
+
+    def get(self, cfg: dict) -> Optional[maze_mod.Maze]:
+        if cfg.get("seed_value") is None:
+            return None  # unseeded builds are not reproducible
+
+        key = cache_key(cfg)
+        entry = self._index.get(key)
+        if entry is None or not os.path.exists(self._cells_path(key)):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._touch(key)
+        return self._load(key, entry)
+
+    def get_by_hash(self, maze_hash: str) -> Optional[maze_mod.Maze]:
+        key = self._by_hash.get(maze_hash)
+        if key is None:
+            return None
+        self._touch(key)
+        return self._load(key, self._index[key])
+
+    def put(self, cfg: dict, m: maze_mod.Maze) -> Optional[str]:
+        if cfg.get("seed_value") is None:
+            return None
+
+        key = cache_key(cfg)
+        cells = bytes(flat_cells(m.grid))
+        with open(self._cells_path(key), "wb") as f:
+            f.write(cells)
+
+        size = len(cells)
+        if m.components is not None:
+            np.save(self._labels_path(key), np.asarray(m.components, dtype=np.int32))
+            size += os.path.getsize(self._labels_path(key))
+
+        self._clock += 1
+        maze_hash = compute_maze_hash(m)
+        self._index[key] = {
+            "width": m.width,
+            "height": m.height,
+            "start": list(m.start),
+            "end": list(m.end),
+            "maze_hash": maze_hash,
+            "bytes": size,
+            "has_labels": m.components is not None,
+            "last_used": self._clock,
+        }
+        self._by_hash[maze_hash] = key
+        self._evict()
+        self._save_index()
+        return key
+
+    def flush(self) -> None:
+        # write out LRU clocks bumped by hits since the last put
+        if self._dirty:
+            self._save_index()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "MazeCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def total_bytes(self) -> int:
+        return sum(e["bytes"] for e in self._index.values())
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, cfg: dict) -> bool:
+        return cfg.get("seed_value") is not None and cache_key(cfg) in self._index
+
+    # ---- internals ----
+
+    def _cells_path(self, key: str) -> str:
+        return os.path.join(self.root, key + ".cells")
+
+    def _labels_path(self, key: str) -> str:
+        return os.path.join(self.root, key + ".labels.npy")
+
+    def _load(self, key: str, entry: dict) -> maze_mod.Maze:
+        width, height = entry["width"], entry["height"]
+
+        with open(self._cells_path(key), "rb") as f:
+            # ACCESS_COPY: pages load on demand, writes stay private to this process
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        grid = CompactGrid(width, height, memoryview(mapped))
+
+        components = None
+        if entry.get("has_labels"):
+            components = np.load(self._labels_path(key), mmap_mode="r")
+
+        return maze_mod.Maze(width, height, grid, tuple(entry["start"]), tuple(entry["end"]), components)
+
+    def _touch(self, key: str) -> None:
+        self._clock += 1
+        self._index[key]["last_used"] = self._clock
+        self._dirty = True
+
+    def _evict(self) -> None:
+        total = self.total_bytes()
+        for key in sorted(self._index, key=lambda k: self._index[k]["last_used"]):
+            if total <= self.max_bytes or len(self._index) == 1:
+                break
+            entry = self._index.pop(key)
+            total -= entry["bytes"]
+            if self._by_hash.get(entry["maze_hash"]) == key:
+                del self._by_hash[entry["maze_hash"]]
+            for path in (self._cells_path(key), self._labels_path(key)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _load_index(self) -> Dict[str, dict]:
+        if not os.path.exists(self._index_path):
+            return {}
+        with open(self._index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_index(self) -> None:
+        tmp = self._index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp, self._index_path)
+        self._dirty = False
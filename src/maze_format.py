@@ -0,0 +1,165 @@
+# maze_format.py
+# versioned binary maze files: fixed header + bit-packed wall bitmap
+#
+# layout (little-endian), HEADER_SIZE = 48 bytes:
+#   magic      4s   b"MAZB"
+#   version    H    FORMAT_VERSION
+#   flags      H    FLAG_CHECKSUM | FLAG_SEED
+#   width      I
+#   height     I
+#   start      II   (x, y)
+#   end        II   (x, y)
+#   family     c    b"A" / b"B" / b"?"
+#   (pad)      3x
+#   seed       q    valid only with FLAG_SEED
+#   crc32      I    zlib.crc32 of the bitmap, valid only with FLAG_CHECKSUM
+# then ceil(width*height/8) bitmap bytes: cell i = y*width + x is bit (i % 8)
+# of byte i // 8, 1 = WALL.
+#
+# load_maze memory-maps the file and wraps the bitmap in a read-only
+# grids.PackedGrid, so nothing is unpacked or copied until it is read.
+
+from __future__ import annotations
+
+import mmap
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+from src import maze
+from src.grids import PackedGrid, pack_bits, packed_size
+
+MAGIC = b"MAZB"
+FORMAT_VERSION = 1
+
+FLAG_CHECKSUM = 1 << 0
+FLAG_SEED = 1 << 1
+
+_HEADER = struct.Struct("<4sHHIIIIIIc3xqI")
+HEADER_SIZE = _HEADER.size
+
+
+@dataclass(frozen=True)
+class MazeHeader:
+    version: int
+    width: int
+    height: int
+    start: maze.coord
+    end: maze.coord
+    family: Optional[str] = None
+    seed: Optional[int] = None
+    checksum: Optional[int] = None
+
+    @property
+    def bitmap_size(self) -> int:
+        return packed_size(self.width, self.height)
+
+    @property
+    def file_size(self) -> int:
+        return HEADER_SIZE + self.bitmap_size
+
+
+def encode_maze(m: maze.Maze, *, family: str | None = None, seed: int | None = None,
+                checksum: bool = True) -> bytes:
+    bitmap = pack_bits(m.grid)
+
+    flags = 0
+    if checksum:
+        flags |= FLAG_CHECKSUM
+    if seed is not None:
+        flags |= FLAG_SEED
+
+    family_byte = (family or "?").upper().strip().encode("ascii")
+    if len(family_byte) != 1:
+        raise ValueError(f"family must be a single character, got {family!r}")
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, flags,
+        m.width, m.height, *m.start, *m.end,
+        family_byte,
+        seed if seed is not None else 0,
+        zlib.crc32(bitmap) if checksum else 0,
+    )
+    return header + bitmap
+
+
+def write_maze(path: str, m: maze.Maze, *, family: str | None = None, seed: int | None = None,
+               checksum: bool = True) -> int:
+    data = encode_maze(m, family=family, seed=seed, checksum=checksum)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def write_config_maze(path: str, cfg: dict, m: maze.Maze, *, checksum: bool = True) -> int:
+    # records the family/seed of a runner config alongside the maze
+    return write_maze(path, m, family=cfg.get("family"), seed=cfg.get("seed_value"), checksum=checksum)
+
+
+def decode_header(buf, *, check_size: bool = True) -> MazeHeader:
+    if len(buf) < HEADER_SIZE:
+        raise ValueError(f"Truncated maze file: {len(buf)} bytes, header needs {HEADER_SIZE}")
+
+    (magic, version, flags, width, height, sx, sy, ex, ey,
+     family, seed, crc) = _HEADER.unpack_from(buf, 0)
+
+    if magic != MAGIC:
+        raise ValueError(f"Not a maze file: magic={magic!r}. Expected {MAGIC!r}.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported maze file version={version}. Expected {FORMAT_VERSION}.")
+
+    family = family.decode("ascii")
+    header = MazeHeader(
+        version=version,
+        width=width,
+        height=height,
+        start=(sx, sy),
+        end=(ex, ey),
+        family=None if family == "?" else family,
+        seed=seed if flags & FLAG_SEED else None,
+        checksum=crc if flags & FLAG_CHECKSUM else None,
+    )
+    if check_size:
+        _check_size(header, len(buf))
+    return header
+
+
+def _check_size(header: MazeHeader, size: int) -> None:
+    if size < header.file_size:
+        raise ValueError(f"Truncated maze file: {size} bytes, expected {header.file_size}")
+
+
+def decode_maze(buf, *, verify: bool = False) -> maze.Maze:
+    """Maze over any bytes-like buffer; the bitmap is referenced, not copied."""
+    header = decode_header(buf)
+    bitmap = memoryview(buf)[HEADER_SIZE:header.file_size]
+
+    if verify and header.checksum is not None and zlib.crc32(bitmap) != header.checksum:
+        raise ValueError("Maze file checksum mismatch (corrupt or truncated bitmap)")
+
+    grid = PackedGrid(header.width, header.height, bitmap)
+    return maze.Maze(header.width, header.height, grid, header.start, header.end)
+
+
+def read_header(path: str) -> MazeHeader:
+    with open(path, "rb") as f:
+        head = f.read(HEADER_SIZE)
+        f.seek(0, 2)
+        size = f.tell()
+
+    header = decode_header(head, check_size=False)
+    _check_size(header, size)
+    return header
+
+
+def load_maze(path: str, *, verify: bool = False) -> maze.Maze:
+    """
+    Memory-map a maze file (read-only) into a Maze backed by a PackedGrid.
+
+    Pages are read on first touch, so loading is O(1) in the maze size;
+    verify=True checks the CRC32, which reads the whole bitmap once.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return decode_maze(mapped, verify=verify)
@@ -0,0 +1,146 @@
+# maze_index.py
+# many goals, one maze: cache full BFS trees per source and answer
+# path/distance queries by walking parent pointers (O(path length))
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict, deque
+from typing import List, Optional
+
+from src import maze, solution
+from src.flat_solvers import FlatMaze, to_flat, reconstruct_flat_path
+
+
+class ShortestPathTree:
+    """Full BFS from one source over a FlatMaze: parent + distance per cell."""
+
+    def __init__(self, fm: FlatMaze, source: maze.coord):
+        self.fm = fm
+        self.source = source
+
+        cells = fm.cells
+        offsets = fm.offsets
+        x, y = source
+        if not (0 <= x < fm.width and 0 <= y < fm.height):
+            raise ValueError(f"Source out of bounds: source={source}")
+        root = fm.index(source)
+
+        self.parent = array("q", [-1]) * fm.size
+        self.dist = array("i", [-1]) * fm.size
+
+        parent = self.parent
+        dist = self.dist
+
+        if cells[root] != maze.OPEN:
+            raise ValueError(f"Source is not an open cell: source={source}")
+
+        dist[root] = 0
+        queue: deque[int] = deque([root])
+        reached = 1
+        max_frontier = 1
+
+        while queue:
+            if len(queue) > max_frontier:
+                max_frontier = len(queue)
+
+            current = queue.popleft()
+            next_dist = dist[current] + 1
+
+            for off in offsets:
+                n = current + off
+                if cells[n] == maze.OPEN and dist[n] < 0:
+                    dist[n] = next_dist
+                    parent[n] = current
+                    reached += 1
+                    queue.append(n)
+
+        self.reached_count = reached
+        self.max_frontier = max_frontier
+
+    def _index(self, goal: maze.coord) -> Optional[int]:
+        x, y = goal
+        if not (0 <= x < self.fm.width and 0 <= y < self.fm.height):
+            return None
+        return self.fm.index(goal)
+
+    def distance_to(self, goal: maze.coord) -> Optional[int]:
+        idx = self._index(goal)
+        if idx is None or self.dist[idx] < 0:
+            return None
+        return self.dist[idx]
+
+    def path_to(self, goal: maze.coord) -> solution.Solution:
+        # counters describe the one-off tree build shared by every query
+        idx = self._index(goal)
+        if idx is None or self.dist[idx] < 0:
+            return solution.Solution(
+                found=False,
+                path=[],
+                path_length=0,
+                visited_count=self.reached_count,
+                expanded_count=self.reached_count,
+                max_frontier=self.max_frontier,
+            )
+
+        path: List[maze.coord] = reconstruct_flat_path(self.fm, self.parent, idx)
+        return solution.Solution(
+            found=True,
+            path=path,
+            path_length=len(path) - 1,
+            expanded_count=self.reached_count,
+            visited_count=self.reached_count,
+            max_frontier=self.max_frontier,
+        )
+
+
+class MazeIndex:
+    """
+    Shortest-path index over one Maze.
+
+    Trees are built lazily per source (default: maze start) and kept in an
+    LRU of at most max_trees entries; every query refreshes its source.
+    """
+
+    def __init__(self, m: maze.Maze, max_trees: int = 8):
+        if max_trees < 1:
+            raise ValueError(f"max_trees must be >= 1, got {max_trees}")
+
+        self.maze = m
+        self.max_trees = max_trees
+        self.fm = to_flat(m)
+        self._trees: OrderedDict[maze.coord, ShortestPathTree] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def tree(self, source: maze.coord | None = None) -> ShortestPathTree:
+        if source is None:
+            source = self.maze.start
+
+        tree = self._trees.get(source)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(source)
+            return tree
+
+        self.misses += 1
+        tree = ShortestPathTree(self.fm, source)
+        self._trees[source] = tree
+        if len(self._trees) > self.max_trees:
+            self._trees.popitem(last=False)
+        return tree
+
+    def path_to(self, goal: maze.coord, source: maze.coord | None = None) -> solution.Solution:
+        return self.tree(source).path_to(goal)
+
+    def distance_to(self, goal: maze.coord, source: maze.coord | None = None) -> Optional[int]:
+        return self.tree(source).distance_to(goal)
+
+    def solve(self) -> solution.Solution:
+        # start -> end, same shape as solvers.solve_bfs(maze)
+        return self.path_to(self.maze.end)
+
+    def sources(self) -> List[maze.coord]:
+        # least recently used first
+        return list(self._trees)
@@ -1,13 +1,14 @@
 # dataset.py
 
-import copy
 from dataclasses import asdict
 from typing import Callable, List, Tuple
 
 from src.analyzer import analyze_maze
+from src.batch import solve_many_with_metrics
 from src.eval.metrics import run_solver_with_metrics, MazeMeta
 from src.eval.labeling import choose_oracle_label
-from src.runner import run_config
+from src.grids import freeze_maze
+from src.runner import run_config, run_configs
 
 
 def extract_feature_dict(maze):
@@ -21,11 +22,11 @@ def run_all_solvers_with_metrics(
         solver_fns: List[Tuple[str, Callable]]
 ):
     metrics_list = []
+    shared = freeze_maze(maze)  # read-only, so every solver can share it
 
     for (solver_name, solver_fn) in solver_fns:
-        maze_copy = copy.deepcopy(maze)
         m = run_solver_with_metrics(
-            maze_copy,
+            shared,
             solver_fn,
             solver_name=solver_name,
             meta=meta,
@@ -38,10 +39,12 @@ def run_all_solvers_with_metrics(
 def build_row_for_maze(
         maze,
         meta,
-        solver_fns: List[Tuple[str, Callable]]
+        solver_fns: List[Tuple[str, Callable]],
+        metrics_list=None,
 ):
     features = extract_feature_dict(maze)
-    metrics_list = run_all_solvers_with_metrics(maze, meta, solver_fns)
+    if metrics_list is None:
+        metrics_list = run_all_solvers_with_metrics(maze, meta, solver_fns)
     label = choose_oracle_label(metrics_list)
 
     if features["shortest_path_length"] is None:
@@ -57,26 +60,58 @@ def build_row_for_maze(
 
     return row, metrics_list
 
-def build_dataset(configs, solver_fns):
+def build_dataset(configs, solver_fns, workers: int = 1, maze_cache=None):
+    # maze_cache: optional maze_cache.MazeCache, reused across builds
     rows = []
     metrics_lookup = {}
 
+    if workers > 1:
+        if maze_cache is not None:
+            mazes = [maze_cache.run_config(cfg) for cfg in configs]
+            maze_cache.flush()
+        else:
+            # each config has its own RNG stream, so pooled generation matches serial
+            mazes = run_configs(configs, workers=workers)
+        built = [(maze, make_meta_from_cfg(cfg)) for maze, cfg in zip(mazes, configs)]
+        all_metrics = solve_many_with_metrics(
+            [maze for maze, _ in built],
+            [meta for _, meta in built],
+            solver_fns,
+            workers=workers,
+        )
+        for (maze, meta), metrics_list in zip(built, all_metrics):
+            row, metrics_list = build_row_for_maze(maze, meta, solver_fns, metrics_list)
+
+            rows.append(row)
+            metrics_lookup[meta.maze_id] = metrics_list
+
+        return rows, metrics_lookup
+
     for cfg in configs:
-        maze, meta = build_maze_and_meta(cfg)
+        maze, meta = build_maze_and_meta(cfg, maze_cache)
         row, metrics_list = build_row_for_maze(maze, meta, solver_fns)
 
         rows.append(row)
         metrics_lookup[meta.maze_id] = metrics_list
 
+    if maze_cache is not None:
+        maze_cache.flush()
     return rows, metrics_lookup
 
 
-def build_maze_and_meta(cfg):
-    maze = run_config(cfg, verbose=False)
+def build_maze_and_meta(cfg, maze_cache=None):
+    if maze_cache is not None:
+        maze = maze_cache.run_config(cfg)
+    else:
+        maze = run_config(cfg, verbose=False)
+    meta = make_meta_from_cfg(cfg)
 
+    return maze, meta
+
+def make_meta_from_cfg(cfg):
     maze_id = make_id_from_cfg(cfg)
 
-    meta = MazeMeta(
+    return MazeMeta(
         maze_id=maze_id,
         seed=cfg["seed_value"],
         family=cfg["family"],
@@ -85,8 +120,6 @@ def build_maze_and_meta(cfg):
         open_ratio=cfg.get("open_ratio")
     )
 
-    return maze, meta
-
 def make_id_from_cfg(cfg):
     return f"{cfg['family']}_{cfg['width']}x{cfg['height']}_seed{cfg['seed_value']}_r{cfg.get('open_ratio')}"
 
@@ -1,8 +1,36 @@
 # rng.py
 from __future__ import annotations
+from dataclasses import dataclass
 from random import Random
+from typing import List
+
+import numpy as np
 
 rng = Random()
 
 def seed(value: int) -> None:
     rng.seed(value)
+
+
+@dataclass
+class GenerationContext:
+    """
+    RNG stream owned by one maze build.
+
+    Generators draw from ctx.random instead of the module-global rng, so
+    builds are independent of call order and safe across threads/processes.
+    A context made from seed_value reproduces exactly what seeding the
+    global rng with that value used to produce.
+    """
+    random: Random
+    seed_value: int | None = None
+
+    @classmethod
+    def from_seed(cls, seed_value: int) -> "GenerationContext":
+        return cls(random=Random(seed_value), seed_value=seed_value)
+
+    @classmethod
+    def spawn(cls, root_seed: int, n: int) -> List["GenerationContext"]:
+        # n statistically independent streams from one root via NumPy SeedSequence
+        children = np.random.SeedSequence(root_seed).spawn(n)
+        return [cls.from_seed(int(child.generate_state(1, dtype=np.uint64)[0])) for child in children]
@@ -1,11 +1,84 @@
 # runner.py
 #orchestration for maze generation/construction tied to parameters
 
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import numpy as np
+
 from src import generators, maze
-from src.rng import seed
+from src import rng as rng_mod
+from src.components import ComponentTracker
+from src.grids import CompactGrid
+from src.lazy_maze import create_lazy_maze
+from src.rng import GenerationContext
+
+def run_config(cfg: dict, *, verbose: bool = False, grid_backend: str = "list",
+               ctx: GenerationContext | None = None, stats: dict | None = None) -> maze.Maze:
+    return run(**cfg, verbose=verbose, grid_backend=grid_backend, ctx=ctx, stats=stats)
+
+def run_configs(configs: List[dict], *, workers: int = 1, grid_backend: str = "list") -> List[maze.Maze]:
+    # every config owns its RNG stream, so pooled builds are byte-identical
+    # to serial ones and come back in input order.
+    # Seeded Family B configs with family_b_engine="batch" are grouped by
+    # (size, open_ratio) and built with run_batch instead.
+    mazes: List[maze.Maze | None] = [None] * len(configs)
+
+    groups: dict = {}
+    rest: List[int] = []
+    for i, cfg in enumerate(configs):
+        if (cfg.get("family_b_engine") == "batch" and cfg.get("seed_value") is not None
+                and str(cfg["family"]).upper().strip() == "B"):
+            key = (cfg["width"], cfg["height"], cfg.get("open_ratio"))
+            groups.setdefault(key, []).append(i)
+        else:
+            rest.append(i)
+
+    for (width, height, open_ratio), indices in groups.items():
+        if open_ratio is None:
+            raise ValueError("Family B requires open_ratio (e.g., 0.25).")
+        seeds = [configs[i]["seed_value"] for i in indices]
+        for i, m in zip(indices, run_batch(width, height, open_ratio, seeds, grid_backend=grid_backend)):
+            mazes[i] = m
+
+    rest_configs = [configs[i] for i in rest]
+    if workers <= 1:
+        built = [run_config(cfg, grid_backend=grid_backend) for cfg in rest_configs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            built = list(pool.map(_run_config_in_worker, rest_configs, [grid_backend] * len(rest_configs)))
+
+    for i, m in zip(rest, built):
+        mazes[i] = m
+    return mazes
+
+def _run_config_in_worker(cfg: dict, grid_backend: str) -> maze.Maze:
+    return run_config(cfg, grid_backend=grid_backend)
+
+def run_batch(width: int, height: int, open_ratio: float, seeds: List[int], *,
+              grid_backend: str = "compact") -> List[maze.Maze]:
+    # many Family B mazes of one size in one vectorized pass; maze i is
+    # identical to run(width, height, "B", seeds[i], open_ratio, family_b_engine="batch").
+    # Compact grids are views into the shared (K, H, W) array; components are not tracked.
+    if width <= 0 or height <= 0:
+        raise ValueError(f"width/height must be positive, got {width}x{height}")
+    if not (0.0 <= open_ratio <= 1.0):
+        raise ValueError(f"open_ratio must be in [0.0, 1.0], got {open_ratio}")
+    if grid_backend not in generators.GRID_BACKENDS:
+        raise ValueError(f"Unknown grid_backend={grid_backend!r}. Expected one of {generators.GRID_BACKENDS}.")
+
+    start = (0, 0)
+    end = (width - 1, height - 1)
+    batch = generators.generate_dense_batch(seeds, width, height, open_ratio, start, end)
 
-def run_config(cfg: dict, *, verbose: bool = False) -> maze.Maze:
-    return run(**cfg, verbose=verbose)
+    mazes = []
+    for cells in batch:
+        if grid_backend == "compact":
+            grid = CompactGrid(width, height, memoryview(cells.reshape(-1)))
+        else:
+            grid = cells.tolist()
+        mazes.append(maze.Maze(width, height, grid, start, end))
+    return mazes
 
 def run(width: int,
         height: int,
@@ -14,42 +87,92 @@ def run(width: int,
         open_ratio: float | None = None,
         *,
         verbose: bool = True,
+        grid_backend: str = "list",
+        perfect_algorithm: str = "backtracker",
+        family_b_engine: str = "frontier",
+        ctx: GenerationContext | None = None,
+        stats: dict | None = None,
     ) -> maze.Maze:
+    # stats: optional dict that generators add their counters to
+    # (backtracks / rejected_draws / frontier_batches)
     # ---- validation ----
     if width <= 0 or height <= 0:
         raise ValueError(f"width/height must be positive, got {width}x{height}")
 
     family = family.upper().strip()
-    if family not in {"A", "B"}:
-        raise ValueError(f"Unknown family={family!r}. Expected 'A' or 'B'.")
+    if family not in {"A", "B", "L"}:
+        raise ValueError(f"Unknown family={family!r}. Expected 'A', 'B' or 'L'.")
 
     # ---- seeding (once, here) ----
-    if seed_value is not None:
-        seed(seed_value)
+    # a private stream per build; the global src.rng.rng is left untouched
+    # (used only when neither ctx nor seed_value is given)
+    if ctx is None and seed_value is not None:
+        ctx = GenerationContext.from_seed(seed_value)
+    gen_rng = ctx.random if ctx is not None else None
 
-    built_grid = generators.create_grid(width, height)
+    if family == "L":
+        # lazy family: nothing is materialized, cells are hashed from the seed on access
+        if open_ratio is None:
+            raise ValueError("Family L requires open_ratio (e.g., 0.6).")
+        if not (0.0 <= open_ratio <= 1.0):
+            raise ValueError(f"open_ratio must be in [0.0, 1.0], got {open_ratio}")
+        if seed_value is not None:
+            lazy_seed = seed_value
+        else:
+            lazy_seed = (gen_rng or rng_mod.rng).getrandbits(64)
+
+        maze_created = create_lazy_maze(width, height, lazy_seed, open_ratio)
+        if verbose:
+            print(
+                f"[run] family={family} width={width} height={height} "
+                f"seed={seed_value} open_ratio={open_ratio} (lazy)"
+            )
+        return maze_created
+
+    built_grid = generators.create_grid(width, height, backend=grid_backend)
     start = (0, 0)
     end = (width - 1, height - 1)
+    tracker = None
 
     if family == "A":
         # critical: make Maze endpoints match the perfect-maze cell lattice
         start = generators.snap_to_odd_interior(built_grid, start)
         end = generators.snap_to_odd_interior(built_grid, end)
 
-        generators.generate_perfect(built_grid, start, end)
+        if perfect_algorithm == "eller":
+            generators.generate_perfect_eller(built_grid, start, end, rng=gen_rng)
+        elif perfect_algorithm == "backtracker":
+            generators.generate_perfect(built_grid, start, end, rng=gen_rng, stats=stats)
+        else:
+            raise ValueError(
+                f"Unknown perfect_algorithm={perfect_algorithm!r}. Expected 'backtracker' or 'eller'."
+            )
     elif family == "B":
         if open_ratio is None:
              raise ValueError("Family B requires open_ratio (e.g., 0.25).")
         if not (0.0 <= open_ratio <= 1.0):
             raise ValueError(f"open_ratio must be in [0.0, 1.0], got {open_ratio}")
 
-        generators.generate_dense_solvable(
-            grid=built_grid,
-            start=start,
-            end=end,
-            open_ratio=open_ratio,
-        )
-    maze_created = generators.create_maze(built_grid, start, end)
+        tracker = ComponentTracker(width, height)
+        if family_b_engine == "batch":
+            # same maze run_batch builds for this seed
+            batch_seed = seed_value if seed_value is not None else (gen_rng or rng_mod.rng).getrandbits(64)
+            cells = generators.generate_dense_batch([batch_seed], width, height, open_ratio, start, end)[0]
+            generators.write_cells(built_grid, cells)
+            tracker.open_cells(np.flatnonzero(cells.ravel() == maze.OPEN))
+        else:
+            generators.generate_dense_solvable(
+                grid=built_grid,
+                start=start,
+                end=end,
+                open_ratio=open_ratio,
+                engine=family_b_engine,
+                tracker=tracker,
+                rng=gen_rng,
+                stats=stats,
+            )
+    components = tracker.labels() if tracker is not None else None
+    maze_created = generators.create_maze(built_grid, start, end, components)
 
     if verbose:
         print(
@@ -0,0 +1,102 @@
+# shared_maze.py
+# hand mazes to worker processes through one shared-memory block instead
+# of pickling their cells into every task
+#
+# The parent copies each maze's cells into the block once (SharedMazeStore);
+# tasks carry only a small SharedMazeRef, and workers attach to the block
+# for the duration of a task (attached_maze) and wrap their slice in a
+# read-only CompactGrid (no copy on that side).
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterator, List, Sequence
+
+from src import maze as maze_mod
+from src.grids import CompactGrid, flat_cells
+
+
+@dataclass(frozen=True)
+class SharedMazeRef:
+    shm_name: str
+    offset: int
+    width: int
+    height: int
+    start: maze_mod.coord
+    end: maze_mod.coord
+
+
+class SharedMazeStore:
+    """
+    Owns one SharedMemory block holding the cells of `mazes`, back to back.
+
+    Use as a context manager and keep it open until every worker is done
+    (i.e. exit the process pool first); exiting unlinks the block. No mazes,
+    no block.
+    """
+
+    def __init__(self, mazes: Sequence[maze_mod.Maze]):
+        self.refs: List[SharedMazeRef] = []
+        total = sum(m.width * m.height for m in mazes)
+        self._shm = shared_memory.SharedMemory(create=True, size=total) if total else None
+
+        offset = 0
+        for m in mazes:
+            size = m.width * m.height
+            self._shm.buf[offset:offset + size] = bytes(flat_cells(m.grid))
+            self.refs.append(SharedMazeRef(self._shm.name, offset, m.width, m.height, m.start, m.end))
+            offset += size
+
+    def __enter__(self) -> "SharedMazeStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+@contextmanager
+def attached_maze(ref: SharedMazeRef) -> Iterator[maze_mod.Maze]:
+    """
+    The maze behind ref, backed by the shared block for the with-block only.
+
+    The block is closed on exit, so nothing may keep the maze or its grid
+    rows past it (results built from them, like paths, are fine).
+    """
+    shm = _open_block(ref.shm_name)
+    size = ref.width * ref.height
+    grid = CompactGrid(ref.width, ref.height, shm.buf[ref.offset:ref.offset + size].toreadonly())
+    try:
+        yield maze_mod.Maze(ref.width, ref.height, grid, ref.start, ref.end)
+    finally:
+        grid.release()
+        try:
+            shm.close()
+        except BufferError:
+            pass  # a row view outlived the task; the mapping goes when it does
+
+
+def _open_block(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # Before 3.13 attaching also registers the block with this process's
+    # resource tracker. Pool workers normally share the parent's tracker
+    # (inherited on fork, fd handed over by spawn/forkserver); there the
+    # registration is already the parent's and unregistering would drop it,
+    # so the parent's unlink() then trips the tracker. Only a process that
+    # had to start its own tracker must unregister, or that tracker would
+    # unlink the block when this process exits.
+    shared_tracker = getattr(resource_tracker._resource_tracker, "_fd", None) is not None
+    shm = shared_memory.SharedMemory(name=name)
+    if not shared_tracker:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
@@ -10,4 +10,12 @@ class Solution:
     visited_count: int
     max_frontier: int
     path_length: int
+    # memory-bounded solvers: True = provably shortest, None = not claimed
+    optimal: bool | None = None
+    pruned_count: int = 0  # frontier entries dropped to stay under a memory cap
+    # beam search: the shortest path length is at least this (None = no bound known)
+    cost_lower_bound: int | None = None
 
+    # set when a budget.SearchBudget cut the search short ("expansions" or
+    # "deadline"); found is then False without proving there is no path
+    budget_exceeded: str | None = None
@@ -15,9 +15,13 @@ from typing import Dict, Optional, List
 import heapq
 
 from src import maze, solution
+from src.budget import SearchBudget
+from src.tiled import TiledGrid, TileArray
 
 
-def solve_bfs( m: maze.Maze) -> solution.Solution:
+def solve_bfs( m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    if isinstance(m.grid, TiledGrid):
+        return solve_bfs_tiled(m, budget)
 
     start = m.start
     goal = m.end
@@ -30,9 +34,14 @@ def solve_bfs( m: maze.Maze) -> solution.Solution:
     expanded_count = 0
     max_frontier = len(queue)
 
+    if budget is not None:
+        budget.start()
     while queue:
         max_frontier = max(max_frontier, len(queue))
 
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, len(visited), max_frontier)
+
         current = queue.popleft()
         expanded_count += 1
 
@@ -81,7 +90,7 @@ def reconstruct_path(
 
 
 
-def solve_dfs( m: maze.Maze) -> solution.Solution:
+def solve_dfs( m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
     start = m.start
     goal = m.end
 
@@ -92,9 +101,14 @@ def solve_dfs( m: maze.Maze) -> solution.Solution:
     expanded_count = 0
     max_frontier = len(stack)
 
+    if budget is not None:
+        budget.start()
     while stack:
         max_frontier = max(max_frontier, len(stack))
 
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, len(visited), max_frontier)
+
         current = stack.pop()
         expanded_count += 1
 
@@ -125,7 +139,19 @@ def solve_dfs( m: maze.Maze) -> solution.Solution:
     )
 
 
-def solve_astar( m: maze.Maze) -> solution.Solution:
+ASTAR_QUEUES = ("heap", "bucket")
+BUCKET_TIE_BREAKS = ("lifo", "fifo")
+
+def solve_astar( m: maze.Maze, queue: str = "heap", tie_break: str = "lifo",
+                 budget: SearchBudget | None = None) -> solution.Solution:
+    # queue="bucket" -> integer bucket queue (unit costs, integer h); see solve_astar_bucket
+    if queue == "bucket":
+        return _solve_astar_buckets(m, tie_break, budget)
+    if queue != "heap":
+        raise ValueError(f"Unknown A* queue={queue!r}. Expected one of {ASTAR_QUEUES}.")
+    if isinstance(m.grid, TiledGrid):
+        return solve_astar_tiled(m, budget)
+
     start = m.start
     goal = m.end
 
@@ -148,9 +174,14 @@ def solve_astar( m: maze.Maze) -> solution.Solution:
     expanded_count = 0
     max_frontier = len(open_set)
 
+    if budget is not None:
+        budget.start()
     while open_set:
         max_frontier = max(max_frontier, len(open_set))
 
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, len(seen), max_frontier)
+
         f, _, current = heapq.heappop(open_set)
         expanded_count += 1
 
@@ -195,7 +226,839 @@ def solve_astar( m: maze.Maze) -> solution.Solution:
         max_frontier=max_frontier
     )
 
+# ---- tiled (out-of-core) mazes ----
+# Search state lives in tiled.TileArray: one small array per tile the search
+# touched instead of dicts/sets keyed by coordinate tuples. A cell's parent
+# is stored as the direction code of the move into it.
+
+_TILE_UNSEEN = 0
+_TILE_START = len(maze.DIRECTIONS) + 1
+_DIRECTION_CODE = {d: i + 1 for i, d in enumerate(maze.DIRECTIONS)}
+
+
+def _tile_size_for(m: maze.Maze) -> int:
+    return getattr(m.grid, "tile_size", 256)
+
+
+def _move_code(current: maze.coord, neighbor: maze.coord) -> int:
+    return _DIRECTION_CODE[(neighbor[0] - current[0], neighbor[1] - current[1])]
+
+
+def reconstruct_tiled_path(parents: TileArray, goal: maze.coord) -> List[maze.coord]:
+    path: List[maze.coord] = [goal]
+    x, y = goal
+    code = parents.get(goal)
+    while code != _TILE_START:
+        dx, dy = maze.DIRECTIONS[code - 1]
+        x, y = x - dx, y - dy
+        path.append((x, y))
+        code = parents.get((x, y))
+
+    path.reverse()
+    return path
+
+
+def solve_bfs_tiled(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    # same search order and counters as solve_bfs
+    start = m.start
+    goal = m.end
+
+    parents = TileArray(_tile_size_for(m), "b", _TILE_UNSEEN)
+    parents.set(start, _TILE_START)
+    visited_count = 1
+
+    queue: deque[maze.coord] = deque([start])
+    expanded_count = 0
+    max_frontier = len(queue)
+
+    if budget is not None:
+        budget.start()
+    while queue:
+        max_frontier = max(max_frontier, len(queue))
+
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, visited_count, max_frontier)
+
+        current = queue.popleft()
+        expanded_count += 1
+
+        if current == goal:
+            path = reconstruct_tiled_path(parents, goal)
+            return solution.Solution(
+                found=True,
+                path=path,
+                path_length=len(path) - 1,
+                expanded_count=expanded_count,
+                visited_count=visited_count,
+                max_frontier=max_frontier,
+            )
+
+        for neighbor in m.neighbors(current):
+            if parents.get(neighbor) == _TILE_UNSEEN:
+                parents.set(neighbor, _move_code(current, neighbor))
+                visited_count += 1
+                queue.append(neighbor)
+
+    #No path found
+    return solution.Solution(
+        found=False,
+        path=[],
+        path_length=0,
+        visited_count=visited_count,
+        expanded_count=expanded_count,
+        max_frontier=max_frontier
+    )
+
+
+def solve_astar_tiled(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    # same search order and counters as solve_astar (heap queue)
+    start = m.start
+    goal = m.end
+    tile_size = _tile_size_for(m)
+
+    parents = TileArray(tile_size, "b", _TILE_UNSEEN)
+    g_score = TileArray(tile_size, "i", -1)  # -1 = infinity
+    closed = TileArray(tile_size, "b", 0)
+
+    parents.set(start, _TILE_START)
+    g_score.set(start, 0)
+    seen_count = 1
+
+    open_set: list[tuple[int, int, maze.coord]] = [(h(start, goal), 0, start)]
+    tie = 1
+
+    expanded_count = 0
+    max_frontier = len(open_set)
+
+    if budget is not None:
+        budget.start()
+    while open_set:
+        max_frontier = max(max_frontier, len(open_set))
+
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, seen_count, max_frontier)
+
+        _, _, current = heapq.heappop(open_set)
+        expanded_count += 1
+
+        # skip stale entries
+        if closed.get(current):
+            continue
+
+        if current == goal:
+            path = reconstruct_tiled_path(parents, goal)
+            return solution.Solution(
+                found=True,
+                path=path,
+                path_length=len(path) - 1,
+                expanded_count=expanded_count,
+                visited_count=seen_count,
+                max_frontier=max_frontier,
+            )
+
+        closed.set(current, 1)
+        tentative_g = g_score.get(current) + 1  # move cost = 1
+
+        for neighbor in m.neighbors(current):
+            old_g = g_score.get(neighbor)
+            if old_g < 0 or tentative_g < old_g:
+                if old_g < 0:
+                    seen_count += 1
+                parents.set(neighbor, _move_code(current, neighbor))
+                g_score.set(neighbor, tentative_g)
+
+                heapq.heappush(open_set, (tentative_g + h(neighbor, goal), tie, neighbor))
+                tie += 1
+
+    #No path found
+    return solution.Solution(
+        found=False,
+        path=[],
+        path_length=0,
+        visited_count=seen_count,
+        expanded_count=expanded_count,
+        max_frontier=max_frontier
+    )
+
+
 def h(a: maze.coord, b: maze.coord) -> int:
     ax, ay = a
     bx, by = b
-    return abs(ax - bx) + abs(ay - by)
\ No newline at end of file
+    return abs(ax - bx) + abs(ay - by)
+
+
+def solve_astar_bucket(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    return solve_astar(m, queue="bucket", budget=budget)
+
+
+def _solve_astar_buckets(m: maze.Maze, tie_break: str,
+                         budget: SearchBudget | None = None) -> solution.Solution:
+    # Dial-style A*: moves cost 1 and h is integer Manhattan, so f is an
+    # integer that never decreases along the search (consistent h). One
+    # list per f value replaces the heap; the cursor only moves forward.
+    # tie_break within an f bucket:
+    #   "lifo" -> newest node first (deepest, i.e. larger g, in practice)
+    #   "fifo" -> oldest node first
+    if tie_break not in BUCKET_TIE_BREAKS:
+        raise ValueError(f"Unknown tie_break={tie_break!r}. Expected one of {BUCKET_TIE_BREAKS}.")
+    lifo = tie_break == "lifo"
+
+    start = m.start
+    goal = m.end
+
+    f_base = h(start, goal)
+    buckets: list[deque[maze.coord]] = [deque([start])]  # buckets[f - f_base]
+    cursor = 0
+    frontier_size = 1
+
+    came_from: Dict[maze.coord, Optional[maze.coord]] = {start: None}
+    g_score: Dict[maze.coord, int] = {start: 0}
+
+    closed: set[maze.coord] = set()
+
+    expanded_count = 0
+    max_frontier = frontier_size
+
+    if budget is not None:
+        budget.start()
+    while frontier_size:
+        max_frontier = max(max_frontier, frontier_size)
+
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, len(g_score), max_frontier)
+
+        while not buckets[cursor]:
+            cursor += 1
+        bucket = buckets[cursor]
+        current = bucket.pop() if lifo else bucket.popleft()
+        frontier_size -= 1
+        expanded_count += 1
+
+        # skip stale entries
+        if current in closed:
+            continue
+
+        if m.is_goal(current):
+            path = reconstruct_path(came_from, goal=current)
+            return solution.Solution(
+                found=True,
+                path=path,
+                path_length=len(path) - 1,
+                expanded_count=expanded_count,
+                visited_count = len(g_score),
+                max_frontier = max_frontier,
+            )
+
+        closed.add(current)
+        tentative_g = g_score[current] + 1  # move cost = 1
+
+        for neighbor in m.neighbors(current):
+            if tentative_g < g_score.get(neighbor, tentative_g + 1):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+
+                index = tentative_g + h(neighbor, goal) - f_base
+                while len(buckets) <= index:
+                    buckets.append(deque())
+                buckets[index].append(neighbor)
+                frontier_size += 1
+
+    #No path found
+    return solution.Solution(
+        found=False,
+        path=[],
+        path_length=0,
+        visited_count=len(g_score),
+        expanded_count=expanded_count,
+        max_frontier=max_frontier
+    )
+
+def solve_bidir_bfs(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    start = m.start
+    goal = m.end
+
+    if start == goal:
+        return solution.Solution(
+            found=True,
+            path=[start],
+            path_length=0,
+            expanded_count=1,
+            visited_count=1,
+            max_frontier=1,
+        )
+
+    # forward search from start, backward search from goal
+    queue_f: deque[maze.coord] = deque([start])
+    queue_b: deque[maze.coord] = deque([goal])
+    came_from_f: Dict[maze.coord, Optional[maze.coord]] = {start: None}
+    came_from_b: Dict[maze.coord, Optional[maze.coord]] = {goal: None}
+    dist_f: Dict[maze.coord, int] = {start: 0}
+    dist_b: Dict[maze.coord, int] = {goal: 0}
+
+    expanded_count = 0
+    max_frontier = 2
+
+    if budget is not None:
+        budget.start()
+
+    while queue_f and queue_b:
+        max_frontier = max(max_frontier, len(queue_f) + len(queue_b))
+
+        # expand one full layer of the smaller side
+        if len(queue_f) <= len(queue_b):
+            queue, came_from, dist, other_dist = queue_f, came_from_f, dist_f, dist_b
+        else:
+            queue, came_from, dist, other_dist = queue_b, came_from_b, dist_b, dist_f
+
+        best_len = None
+        meet = None
+
+        for _ in range(len(queue)):
+            if budget is not None and budget.exceeded(expanded_count):
+                return budget.solution(expanded_count, len(dist_f.keys() | dist_b.keys()), max_frontier)
+
+            current = queue.popleft()
+            expanded_count += 1
+
+            for neighbor in m.neighbors(current):
+                if neighbor in dist:
+                    continue
+                dist[neighbor] = dist[current] + 1
+                came_from[neighbor] = current
+                queue.append(neighbor)
+
+                # finish the layer: the first meeting is not always the shortest
+                if neighbor in other_dist:
+                    total = dist[neighbor] + other_dist[neighbor]
+                    if best_len is None or total < best_len:
+                        best_len = total
+                        meet = neighbor
+
+        if meet is not None:
+            path = stitch_paths(came_from_f, came_from_b, meet)
+            return solution.Solution(
+                found=True,
+                path=path,
+                path_length=len(path) - 1,
+                expanded_count=expanded_count,
+                visited_count=len(dist_f.keys() | dist_b.keys()),
+                max_frontier=max_frontier,
+            )
+
+    #No path found
+    return solution.Solution(
+        found=False,
+        path=[],
+        path_length=0,
+        visited_count=len(dist_f.keys() | dist_b.keys()),
+        expanded_count=expanded_count,
+        max_frontier=max_frontier
+    )
+
+
+def solve_bidir_astar(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    start = m.start
+    goal = m.end
+
+    # per-direction state; side 0 searches start->goal, side 1 goal->start
+    targets = (goal, start)
+    came_from: tuple[Dict[maze.coord, Optional[maze.coord]], ...] = ({start: None}, {goal: None})
+    g_score: tuple[Dict[maze.coord, float], ...] = ({start: 0.0}, {goal: 0.0})
+    closed: tuple[set[maze.coord], ...] = (set(), set())
+
+    # heaps of (f_score, tie_breaker, node)
+    open_sets: tuple[list[tuple[float, int, maze.coord]], ...] = (
+        [(h(start, goal), 0, start)],
+        [(h(goal, start), 1, goal)],
+    )
+    tie = 2
+
+    # best known start->goal cost and the node where the two searches touch
+    best_cost = 0.0 if start == goal else float("inf")
+    meet: Optional[maze.coord] = start if start == goal else None
+
+    expanded_count = 0
+    max_frontier = 2
+
+    if budget is not None:
+        budget.start()
+
+    while open_sets[0] and open_sets[1]:
+        max_frontier = max(max_frontier, len(open_sets[0]) + len(open_sets[1]))
+
+        # with consistent h, once either side's best f reaches best_cost
+        # no cheaper path can remain
+        if open_sets[0][0][0] >= best_cost or open_sets[1][0][0] >= best_cost:
+            break
+
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, len(g_score[0].keys() | g_score[1].keys()), max_frontier)
+
+        side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+        other = 1 - side
+
+        f, _, current = heapq.heappop(open_sets[side])
+        expanded_count += 1
+
+        # skip stale entries
+        if current in closed[side]:
+            continue
+        closed[side].add(current)
+
+        for neighbor in m.neighbors(current):
+            tentative_g = g_score[side][current] + 1.0  # move cost = 1
+
+            if tentative_g < g_score[side].get(neighbor, float("inf")):
+                came_from[side][neighbor] = current
+                g_score[side][neighbor] = tentative_g
+
+                f_neighbor = tentative_g + h(neighbor, targets[side])
+                heapq.heappush(open_sets[side], (f_neighbor, tie, neighbor))
+                tie += 1
+
+                if neighbor in g_score[other]:
+                    total = tentative_g + g_score[other][neighbor]
+                    if total < best_cost:
+                        best_cost = total
+                        meet = neighbor
+
+    visited_count = len(g_score[0].keys() | g_score[1].keys())
+
+    if meet is None:
+        #No path found
+        return solution.Solution(
+            found=False,
+            path=[],
+            path_length=0,
+            visited_count=visited_count,
+            expanded_count=expanded_count,
+            max_frontier=max_frontier
+        )
+
+    path = stitch_paths(came_from[0], came_from[1], meet)
+    return solution.Solution(
+        found=True,
+        path=path,
+        path_length=len(path) - 1,
+        expanded_count=expanded_count,
+        visited_count=visited_count,
+        max_frontier=max_frontier,
+    )
+
+
+def stitch_paths(
+    came_from_start: Dict[maze.coord, Optional[maze.coord]],
+    came_from_goal: Dict[maze.coord, Optional[maze.coord]],
+    meet: maze.coord,
+) -> List[maze.coord]:
+    # start..meet from the forward tree, meet..goal from the backward tree
+    head = reconstruct_path(came_from_start, goal=meet)
+    tail = reconstruct_path(came_from_goal, goal=meet)
+    tail.reverse()
+    return head + tail[1:]
+
+
+## Jump Point Search (4-connected, unit cost)
+# Canonical paths move vertically first and only turn from horizontal to
+# vertical where the cell diagonally behind is a wall (a forced neighbor).
+# Jumps scan straight lines without touching the heap; only jump points
+# are pushed. expanded_count / visited_count count jump points, not every
+# scanned cell.
+
+def solve_jps(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    start = m.start
+    goal = m.end
+
+    open_set: list[tuple[float, int, maze.coord]] = []
+    tie = 0
+
+    came_from: Dict[maze.coord, Optional[maze.coord]] = {start: None}
+    g_score: Dict[maze.coord, float] = {start: 0.0}
+
+    closed: set[maze.coord] = set()
+    seen: set[maze.coord] = {start}
+
+    heapq.heappush(open_set, (h(start, goal), tie, start))
+    tie += 1
+
+    expanded_count = 0
+    max_frontier = len(open_set)
+    scans: Dict[tuple, Optional[maze.coord]] = {}  # jump memo, see jps_jump
+
+    if budget is not None:
+        budget.start()
+
+    while open_set:
+        max_frontier = max(max_frontier, len(open_set))
+
+        # one expansion can scan many cells, so read the clock every time
+        if budget is not None and budget.exceeded(expanded_count, check_clock=True):
+            return budget.solution(expanded_count, len(seen), max_frontier)
+
+        f, _, current = heapq.heappop(open_set)
+        expanded_count += 1
+
+        # skip stale entries
+        if current in closed:
+            continue
+
+        if m.is_goal(current):
+            path = expand_jump_path(reconstruct_path(came_from, goal=current))
+            return solution.Solution(
+                found=True,
+                path=path,
+                path_length=len(path) - 1,
+                expanded_count=expanded_count,
+                visited_count = len(seen),
+                max_frontier = max_frontier,
+            )
+
+        closed.add(current)
+
+        for direction in jps_directions(m, current, came_from[current]):
+            jump_point = jps_jump(m, current, direction, goal, scans)
+            if jump_point is None:
+                continue
+
+            tentative_g = g_score[current] + h(current, jump_point)
+
+            if tentative_g < g_score.get(jump_point, float("inf")):
+                came_from[jump_point] = current
+                g_score[jump_point] = tentative_g
+
+                f_jump = tentative_g + h(jump_point, goal)
+                heapq.heappush(open_set, (f_jump, tie, jump_point))
+                tie += 1
+
+                seen.add(jump_point)
+
+    #No path found
+    return solution.Solution(
+        found=False,
+        path=[],
+        path_length=0,
+        visited_count=len(seen),
+        expanded_count=expanded_count,
+        max_frontier=max_frontier
+    )
+
+
+def jps_directions(m: maze.Maze, pos: maze.coord, parent: Optional[maze.coord]) -> List[maze.coord]:
+    if parent is None:
+        return list(maze.DIRECTIONS)
+
+    x, y = pos
+    dx = (x > parent[0]) - (x < parent[0])
+    dy = (y > parent[1]) - (y < parent[1])
+
+    if dx == 0:
+        # vertical travel: keep going, and branch horizontally anywhere
+        return [(0, dy), (-1, 0), (1, 0)]
+
+    # horizontal travel: keep going, turn vertical only when forced
+    directions = [(dx, 0)]
+    for sy in (-1, 1):
+        if m.is_open((x, y + sy)) and not m.is_open((x - dx, y + sy)):
+            directions.append((0, sy))
+    return directions
+
+
+def jps_jump(m: maze.Maze, pos: maze.coord, direction: maze.coord, goal: maze.coord,
+             scans: Dict[tuple, Optional[maze.coord]] | None = None) -> Optional[maze.coord]:
+    # A jump's outcome depends only on the cells it crosses, so every cell it
+    # passes through would end its own jump (same direction) at the same
+    # place. scans memoizes that per (x, y, direction) for one search
+    # (solve_jps), so each run of cells is walked once per direction instead
+    # of once per probe: vertical jumps probe a horizontal jump from every
+    # cell they cross, which made them O(W*H) each without it.
+    if scans is None:
+        scans = {}
+    is_open = _open_test(m)
+    x, y = pos
+    dx, dy = direction
+
+    passed = []
+    while True:
+        key = (x, y, dx, dy)
+        result = scans.get(key, scans)  # scans itself = no entry yet
+        if result is not scans:
+            break
+        passed.append(key)
+
+        x, y = x + dx, y + dy
+        if not is_open((x, y)):
+            result = None
+            break
+
+        if (x, y) == goal:
+            result = goal
+            break
+
+        if dy == 0:
+            # forced neighbor: side cell open here but walled one step back
+            if ((is_open((x, y - 1)) and not is_open((x - dx, y - 1)))
+                    or (is_open((x, y + 1)) and not is_open((x - dx, y + 1)))):
+                result = (x, y)
+                break
+        else:
+            # a vertical cell is a jump point if a horizontal scan from it finds one
+            if (jps_jump(m, (x, y), (-1, 0), goal, scans) is not None
+                    or jps_jump(m, (x, y), (1, 0), goal, scans) is not None):
+                result = (x, y)
+                break
+
+    for key in passed:
+        scans[key] = result
+    return result
+
+
+def _open_test(m: maze.Maze):
+    # same answer as m.is_open, minus the method and in_bounds calls
+    cells = m._cells
+    grid = m.grid
+    width, height = m.width, m.height
+
+    if cells is not None:
+        def is_open(pos: maze.coord) -> bool:
+            x, y = pos
+            return 0 <= x < width and 0 <= y < height and cells[y * width + x] == maze.OPEN
+    else:
+        def is_open(pos: maze.coord) -> bool:
+            x, y = pos
+            return 0 <= x < width and 0 <= y < height and grid[y][x] == maze.OPEN
+    return is_open
+
+
+def expand_jump_path(jump_points: List[maze.coord]) -> List[maze.coord]:
+    # jump points are joined by straight segments; fill in every cell
+    if not jump_points:
+        return []
+
+    path: List[maze.coord] = [jump_points[0]]
+    for (ax, ay), (bx, by) in zip(jump_points, jump_points[1:]):
+        dx = (bx > ax) - (bx < ax)
+        dy = (by > ay) - (by < ay)
+        x, y = ax, ay
+        while (x, y) != (bx, by):
+            x, y = x + dx, y + dy
+            path.append((x, y))
+    return path
+
+
+## Memory-bounded search
+
+def solve_idastar(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    # Iterative-deepening A*: depth-first passes bounded by f = g + h, the
+    # bound rising to the smallest f that overflowed. Memory is the current
+    # path only (max_frontier = deepest path). Cycles on the current path
+    # are skipped, but transpositions are not, so open grids with many
+    # equal-cost routes get re-expanded heavily; best suited to Family A.
+    # visited_count counts generated nodes (with repeats); tracking unique
+    # cells would need the memory this solver avoids.
+    start = m.start
+    goal = m.end
+
+    def ordered_neighbors(pos: maze.coord) -> List[maze.coord]:
+        return sorted(m.neighbors(pos), key=lambda n: h(n, goal))
+
+    bound = h(start, goal)
+    expanded_count = 0
+    generated_count = 1
+    max_frontier = 1
+    if budget is not None:
+        budget.start()
+
+    while True:
+        if budget is not None and budget.exceeded(expanded_count):
+            return budget.solution(expanded_count, generated_count, max_frontier)
+
+        path: List[maze.coord] = [start]
+        on_path: set[maze.coord] = {start}
+        branches = [iter(ordered_neighbors(start))]
+        expanded_count += 1
+        next_bound = float("inf")
+
+        if m.is_goal(start):
+            branches = []
+
+        while branches:
+            neighbor = next(branches[-1], None)
+
+            if neighbor is None:
+                branches.pop()
+                on_path.discard(path.pop())
+                continue
+
+            if neighbor in on_path:
+                continue
+
+            generated_count += 1
+            f = len(path) + h(neighbor, goal)  # g(neighbor) = len(path)
+            if f > bound:
+                next_bound = min(next_bound, f)
+                continue
+
+            if budget is not None and budget.exceeded(expanded_count):
+                return budget.solution(expanded_count, generated_count, max_frontier)
+
+            expanded_count += 1
+            path.append(neighbor)
+            on_path.add(neighbor)
+            max_frontier = max(max_frontier, len(path))
+
+            if m.is_goal(neighbor):
+                break
+
+            branches.append(iter(ordered_neighbors(neighbor)))
+
+        if path and m.is_goal(path[-1]):
+            return solution.Solution(
+                found=True,
+                path=path,
+                path_length=len(path) - 1,
+                expanded_count=expanded_count,
+                visited_count=generated_count,
+                max_frontier=max_frontier,
+                optimal=True,
+            )
+
+        if next_bound == float("inf"):
+            #No path found
+            return solution.Solution(
+                found=False,
+                path=[],
+                path_length=0,
+                visited_count=generated_count,
+                expanded_count=expanded_count,
+                max_frontier=max_frontier,
+                optimal=True,
+            )
+
+        bound = next_bound
+
+
+def solve_beam_astar(m: maze.Maze, beam_width: int = 1000,
+                     budget: SearchBudget | None = None) -> solution.Solution:
+    # Layered beam search in A* order: layer d holds cells first reached in
+    # d moves, and only the beam_width cells with the lowest f = d + h (so
+    # the lowest h) go on to the next layer. There is no closed set or
+    # g table: g is the layer depth, and duplicates are only checked against
+    # the previous, current and next layer (enough for BFS layers on an
+    # undirected grid). Each layer is cut back to beam_width as soon as it
+    # reaches 2 * beam_width, so max_frontier never exceeds that.
+    # Parents are (cell, parent) chains owned by the live layers: when a
+    # cell is dropped, every ancestor no surviving cell shares is freed
+    # with it. Retained state is the three layers plus those chains (at
+    # worst beam_width * depth cells, typically far fewer).
+    #
+    # Without pruning this is plain BFS (optimal). Once something was pruned
+    # the path is not guaranteed shortest (optimal=None), a failure is not
+    # proof there is no path, and cost_lower_bound reports the smallest f
+    # pruned (capped at the path cost): the optimum is then in
+    # [cost_lower_bound, path_length]. visited_count counts generated cells
+    # (with repeats), as in solve_idastar.
+    if beam_width < 1:
+        raise ValueError(f"beam_width must be >= 1, got {beam_width}")
+
+    start = m.start
+    goal = m.end
+    ceiling = 2 * beam_width
+    max_depth = m.width * m.height  # longer than any shortest path
+
+    # cell -> (cell, parent node)
+    previous: Dict[maze.coord, tuple] = {}
+    layer: Dict[maze.coord, tuple] = {start: (start, None)}
+    depth = 0
+
+    expanded_count = 0
+    generated_count = 1
+    pruned_count = 0
+    min_pruned_f: int | None = None
+    max_frontier = 1
+
+    def cut(nodes: Dict[maze.coord, tuple]) -> Dict[maze.coord, tuple]:
+        # keep the beam_width lowest-h cells (insertion order breaks ties)
+        nonlocal pruned_count, min_pruned_f
+        ranked = sorted(nodes, key=lambda cell: h(cell, goal))
+        dropped_f = depth + 1 + h(ranked[beam_width], goal)
+        if min_pruned_f is None or dropped_f < min_pruned_f:
+            min_pruned_f = dropped_f
+        pruned_count += len(ranked) - beam_width
+        return {cell: nodes[cell] for cell in ranked[:beam_width]}
+
+    if budget is not None:
+        budget.start()
+
+    if m.is_goal(start):
+        layer = {}
+        found = (start, None)
+    else:
+        found = None
+
+    while layer and depth < max_depth:
+        following: Dict[maze.coord, tuple] = {}
+
+        for current, node in layer.items():
+            if budget is not None and budget.exceeded(expanded_count):
+                return budget.solution(expanded_count, generated_count, max_frontier)
+            expanded_count += 1
+
+            for neighbor in m.neighbors(current):
+                if neighbor in following or neighbor in layer or neighbor in previous:
+                    continue
+                generated_count += 1
+                following[neighbor] = (neighbor, node)
+
+                if m.is_goal(neighbor):
+                    found = following[neighbor]
+                    break
+
+                if len(following) >= ceiling:
+                    max_frontier = max(max_frontier, len(following))
+                    following = cut(following)
+
+            if found is not None:
+                break
+
+        if found is not None:
+            break
+
+        max_frontier = max(max_frontier, len(following))
+        if len(following) > beam_width:
+            following = cut(following)
+        previous, layer = layer, following
+        depth += 1
+
+    if found is None:
+        #No path found
+        return solution.Solution(
+            found=False,
+            path=[],
+            path_length=0,
+            visited_count=generated_count,
+            expanded_count=expanded_count,
+            max_frontier=max_frontier,
+            optimal=True if pruned_count == 0 else None,
+            pruned_count=pruned_count,
+            cost_lower_bound=min_pruned_f,
+        )
+
+    path: List[maze.coord] = []
+    node = found
+    while node is not None:
+        path.append(node[0])
+        node = node[1]
+    path.reverse()
+
+    cost = len(path) - 1
+    return solution.Solution(
+        found=True,
+        path=path,
+        path_length=cost,
+        expanded_count=expanded_count,
+        visited_count=generated_count,
+        max_frontier=max_frontier,
+        optimal=True if pruned_count == 0 else None,
+        pruned_count=pruned_count,
+        cost_lower_bound=cost if min_pruned_f is None else min(cost, min_pruned_f),
+    )
@@ -0,0 +1,291 @@
+# tiled.py
+# out-of-core mazes: cells stored on disk in square tiles, paged in on demand
+# through a bounded LRU tile cache
+#
+# file layout (little-endian), HEADER_SIZE = 64 bytes:
+#   magic      4s   b"MAZT"
+#   version    H    FORMAT_VERSION
+#   (pad)      2x
+#   width      I
+#   height     I
+#   tile_size  I
+#   start      II   (x, y)
+#   end        II   (x, y)
+#   (pad)      to 64 bytes
+# then tiles_x * tiles_y tiles in row-major tile order, each tile_size *
+# tile_size cell bytes (row-major inside the tile). Edge tiles are padded
+# with WALL so every tile has the same size and offset rule.
+
+from __future__ import annotations
+
+import os
+import struct
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, Tuple
+
+from src import maze
+
+MAGIC = b"MAZT"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sH2xIIIIIII28x")
+HEADER_SIZE = _HEADER.size
+
+DEFAULT_TILE_SIZE = 256
+DEFAULT_MAX_TILES = 256
+
+tile_key = Tuple[int, int]  # (tx, ty)
+
+
+# ---- writing ----
+
+def write_tiled_rows(path: str, width: int, height: int, rows: Iterable, start: maze.coord,
+                     end: maze.coord, tile_size: int = DEFAULT_TILE_SIZE) -> int:
+    """
+    Write a tiled maze file from an iterable of row buffers (e.g.
+    generators.iter_eller_rows). Memory stays at one band of tile_size rows.
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError(f"width/height must be positive, got {width}x{height}")
+    if tile_size <= 0:
+        raise ValueError(f"tile_size must be positive, got {tile_size}")
+
+    tiles_x = -(-width // tile_size)
+    padded_width = tiles_x * tile_size
+    wall_row = bytes([maze.WALL]) * padded_width
+    pad = bytes([maze.WALL]) * (padded_width - width)
+
+    written = 0
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, width, height, tile_size, *start, *end))
+        written += HEADER_SIZE
+
+        band: list[bytes] = []
+        rows_seen = 0
+        for row in rows:
+            row = bytes(row)
+            if len(row) != width:
+                raise ValueError(f"Row width mismatch at y={rows_seen}: len(row)={len(row)} but width={width}")
+            band.append(row + pad)
+            rows_seen += 1
+            if len(band) == tile_size:
+                written += _write_band(f, band, tiles_x, tile_size)
+                band = []
+
+        if rows_seen != height:
+            raise ValueError(f"Row count mismatch: got {rows_seen} rows but height={height}")
+        if band:
+            band.extend([wall_row] * (tile_size - len(band)))
+            written += _write_band(f, band, tiles_x, tile_size)
+
+    return written
+
+
+def _write_band(f, band: list[bytes], tiles_x: int, tile_size: int) -> int:
+    written = 0
+    for tx in range(tiles_x):
+        lo = tx * tile_size
+        tile = b"".join(row[lo:lo + tile_size] for row in band)
+        f.write(tile)
+        written += len(tile)
+    return written
+
+
+def write_tiled(path: str, m: maze.Maze, tile_size: int = DEFAULT_TILE_SIZE) -> int:
+    return write_tiled_rows(path, m.width, m.height, (bytes(row) for row in m.grid),
+                            m.start, m.end, tile_size)
+
+
+# ---- reading ----
+
+class TiledCells:
+    """Flat view (index y*width + x) over a TiledGrid, for Maze's fast path."""
+    __slots__ = ("grid", "width")
+
+    def __init__(self, grid: "TiledGrid"):
+        self.grid = grid
+        self.width = grid.width
+
+    def __len__(self) -> int:
+        return self.grid.width * self.grid.height
+
+    def __getitem__(self, i: int) -> int:
+        y, x = divmod(i, self.width)
+        return self.grid.get(x, y)
+
+
+class TiledRow:
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid: "TiledGrid", y: int):
+        self.grid = grid
+        self.y = y
+
+    def __len__(self) -> int:
+        return self.grid.width
+
+    def __getitem__(self, x: int) -> int:
+        if x < 0:
+            x += self.grid.width
+        if not 0 <= x < self.grid.width:
+            raise IndexError(f"column out of range: x={x}")
+        return self.grid.get(x, self.y)
+
+    def __iter__(self) -> Iterator[int]:
+        get = self.grid.get
+        for x in range(self.grid.width):
+            yield get(x, self.y)
+
+
+class TiledGrid:
+    """
+    Read-only grid over a tiled maze file.
+
+    At most max_tiles tiles are held in memory (LRU); every cell read
+    counts as a tile hit or miss, and evictions are counted too, so
+    stats() shows how well a cache size fits a workload.
+    """
+    readonly = True
+
+    def __init__(self, path: str, max_tiles: int = DEFAULT_MAX_TILES):
+        if max_tiles < 1:
+            raise ValueError(f"max_tiles must be >= 1, got {max_tiles}")
+
+        self.path = path
+        self.max_tiles = max_tiles
+        self._fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+
+        header = os.pread(self._fd, HEADER_SIZE, 0)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"Truncated tiled maze file: {len(header)} bytes")
+        magic, version, width, height, tile_size, sx, sy, ex, ey = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"Not a tiled maze file: magic={magic!r}. Expected {MAGIC!r}.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported tiled maze version={version}. Expected {FORMAT_VERSION}.")
+
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.tiles_x = -(-width // tile_size)
+        self.tiles_y = -(-height // tile_size)
+        self.start = (sx, sy)
+        self.end = (ex, ey)
+        self.cells = TiledCells(self)
+
+        self._tiles: OrderedDict[tile_key, bytes] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def close(self) -> None:
+        if getattr(self, "_fd", None) is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        self.close()
+
+    def __reduce__(self):
+        # reopen the same file; the tile cache starts cold
+        return self.__class__, (self.path, self.max_tiles)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> TiledRow:
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError(f"row out of range: y={y}")
+        return TiledRow(self, y)
+
+    def __iter__(self) -> Iterator[TiledRow]:
+        for y in range(self.height):
+            yield self[y]
+
+    def tile(self, tx: int, ty: int) -> bytes:
+        key = (tx, ty)
+        tiles = self._tiles
+        data = tiles.get(key)
+        if data is not None:
+            self.hits += 1
+            tiles.move_to_end(key)
+            return data
+
+        self.misses += 1
+        size = self.tile_size * self.tile_size
+        offset = HEADER_SIZE + (ty * self.tiles_x + tx) * size
+        data = os.pread(self._fd, size, offset)
+        if len(data) != size:
+            raise ValueError(f"Truncated tiled maze file: tile {key} is incomplete")
+
+        tiles[key] = data
+        if len(tiles) > self.max_tiles:
+            tiles.popitem(last=False)
+            self.evictions += 1
+        return data
+
+    def get(self, x: int, y: int) -> int:
+        t = self.tile_size
+        return self.tile(x // t, y // t)[(y % t) * t + x % t]
+
+    def tiles_in_memory(self) -> int:
+        return len(self._tiles)
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        accesses = self.hits + self.misses
+        return {
+            "tile_size": self.tile_size,
+            "max_tiles": self.max_tiles,
+            "tile_hits": self.hits,
+            "tile_misses": self.misses,
+            "tile_evictions": self.evictions,
+            "tile_hit_rate": self.hits / accesses if accesses else 0.0,
+        }
+
+
+def load_tiled_maze(path: str, max_tiles: int = DEFAULT_MAX_TILES) -> maze.Maze:
+    grid = TiledGrid(path, max_tiles=max_tiles)
+    return maze.Maze(grid.width, grid.height, grid, grid.start, grid.end)
+
+
+# ---- per-tile search state ----
+
+class TileArray:
+    """
+    Sparse 2D array stored per tile: a tile's array is allocated on first
+    write, so search state (visited, parents, g) only costs memory in tiles
+    the search actually reached.
+    """
+
+    def __init__(self, tile_size: int, typecode: str, fill: int):
+        self.tile_size = tile_size
+        self.typecode = typecode
+        self.fill = fill
+        self.tiles: Dict[tile_key, array] = {}
+
+    def get(self, pos: maze.coord) -> int:
+        x, y = pos
+        t = self.tile_size
+        tile = self.tiles.get((x // t, y // t))
+        if tile is None:
+            return self.fill
+        return tile[(y % t) * t + x % t]
+
+    def set(self, pos: maze.coord, value: int) -> None:
+        x, y = pos
+        t = self.tile_size
+        key = (x // t, y // t)
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = array(self.typecode, [self.fill]) * (t * t)
+            self.tiles[key] = tile
+        tile[(y % t) * t + x % t] = value
+
+    def tile_count(self) -> int:
+        return len(self.tiles)
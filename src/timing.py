@@ -0,0 +1,109 @@
+# timing.py
+# repeated, low-noise timing of one call: warmup runs, N measured runs with
+# perf_counter_ns and the GC switched off, summarized as min/median/p95 plus
+# a bootstrap confidence interval of the median
+
+from __future__ import annotations
+
+import gc
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+
+BOOTSTRAP_RESAMPLES = 2000
+CONFIDENCE = 0.95
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    samples_ms: Tuple[float, ...]
+    min_ms: float
+    median_ms: float
+    p95_ms: float
+    ci_low_ms: float | None   # bootstrap CI of the median; None with < 2 samples
+    ci_high_ms: float | None
+
+    @property
+    def repeats(self) -> int:
+        return len(self.samples_ms)
+
+
+def summarize(samples_ms: List[float], confidence: float = CONFIDENCE,
+              resamples: int = BOOTSTRAP_RESAMPLES, seed: int = 0) -> TimingStats:
+    if not samples_ms:
+        raise ValueError("summarize() needs at least one sample")
+
+    arr = np.asarray(samples_ms, dtype=np.float64)
+    ci_low = ci_high = None
+    if arr.size >= 2:
+        ci_low, ci_high = bootstrap_median_ci(arr, confidence, resamples, seed)
+
+    return TimingStats(
+        samples_ms=tuple(float(x) for x in arr),
+        min_ms=float(arr.min()),
+        median_ms=float(np.median(arr)),
+        p95_ms=float(np.percentile(arr, 95)),
+        ci_low_ms=ci_low,
+        ci_high_ms=ci_high,
+    )
+
+
+def bootstrap_median_ci(samples: np.ndarray, confidence: float = CONFIDENCE,
+                        resamples: int = BOOTSTRAP_RESAMPLES, seed: int = 0) -> Tuple[float, float]:
+    # percentile bootstrap; fixed seed so reruns on the same samples agree
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, samples.size, size=(resamples, samples.size))
+    medians = np.median(samples[picks], axis=1)
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    low, high = np.percentile(medians, [tail, 100.0 - tail])
+    return float(low), float(high)
+
+
+def time_call(fn: Callable, *args, warmup: int = 1, repeats: int = 5,
+              disable_gc: bool = True,
+              stop_when: Callable[[Any], bool] | None = None) -> Tuple[Any, TimingStats]:
+    """
+    Call fn(*args) warmup times untimed, then `repeats` times timed.
+
+    Returns the last result and the timing summary. Only the call itself
+    is inside the measured window. An exception propagates as-is.
+    stop_when(result) true ends the repeats early: after that call if it
+    was timed, else after a single timed call.
+    """
+    if repeats < 1:
+        raise ValueError(f"repeats must be >= 1, got {repeats}")
+
+    result = None
+    for _ in range(warmup):
+        result = fn(*args)
+        if stop_when is not None and stop_when(result):
+            repeats = 1
+            break
+
+    samples: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        for _ in range(repeats):
+            t0 = perf_counter_ns()
+            result = fn(*args)
+            t1 = perf_counter_ns()
+            samples.append((t1 - t0) / 1e6)
+            if stop_when is not None and stop_when(result):
+                break
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+
+    return result, summarize(samples)
+
+
+def significantly_faster(a: TimingStats, b: TimingStats) -> bool:
+    """True if a's median is faster than b's with non-overlapping CIs."""
+    if a.ci_high_ms is None or b.ci_low_ms is None:
+        return False
+    return a.ci_high_ms < b.ci_low_ms
@@ -0,0 +1,115 @@
+# vector_solvers.py
+# level-synchronous BFS: expands a whole BFS layer per step with NumPy
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from src import maze, solution
+from src.budget import SearchBudget
+from src.grids import as_numpy
+
+
+def solve_bfs_layers(m: maze.Maze, budget: SearchBudget | None = None) -> solution.Solution:
+    """
+    Frontier-at-a-time BFS for large, open (Family B) mazes.
+
+    The grid is copied once into a wall-padded flat boolean mask. Each
+    iteration expands the whole frontier at once: every frontier index is
+    shifted by the four neighbor offsets, masked to open/unreached cells
+    and stamped with its distance. Cost per layer is proportional to the
+    layer size, not the grid. Long 1-wide corridors (Family A) are a poor
+    fit: one layer per corridor cell, each a handful of NumPy calls.
+
+    Counters use solve_bfs semantics at layer granularity, taking the goal
+    as the first cell popped from its layer:
+      expanded_count = cells closer than the goal + 1
+      visited_count  = cells discovered up to and including the goal layer
+      max_frontier   = largest layer
+    A budget is checked once per layer against the cells expanded so far,
+    so a run may overshoot max_expansions by up to one layer.
+    """
+    height, width = m.height, m.width
+    stride = width + 2
+
+    open_mask = np.zeros((height + 2, stride), dtype=bool)
+    open_mask[1:-1, 1:-1] = as_numpy(m.grid) == maze.OPEN
+    open_flat = open_mask.ravel()
+
+    offsets = np.array([dy * stride + dx for dx, dy in maze.DIRECTIONS], dtype=np.int64)
+
+    def index(pos: maze.coord) -> int:
+        return (pos[1] + 1) * stride + (pos[0] + 1)
+
+    start = index(m.start)
+    goal = index(m.end)
+
+    dist = np.full(open_flat.shape, -1, dtype=np.int32)
+    dist[start] = 0
+    frontier = np.array([start], dtype=np.int64)
+
+    depth = 0
+    reached_before = 0  # cells in layers < depth
+    layer_size = 1
+    max_frontier = 1
+
+    if budget is not None:
+        budget.start()
+
+    while layer_size:
+        if dist[goal] == depth:
+            path = _walk_gradient(dist.reshape(height + 2, stride), m.end)
+            return solution.Solution(
+                found=True,
+                path=path,
+                path_length=len(path) - 1,
+                expanded_count=reached_before + 1,
+                visited_count=reached_before + layer_size,
+                max_frontier=max_frontier,
+            )
+
+        if budget is not None and budget.exceeded(reached_before, check_clock=True):
+            return budget.solution(reached_before, reached_before + layer_size, max_frontier)
+
+        candidates = (frontier[:, None] + offsets).ravel()
+        candidates = candidates[open_flat[candidates] & (dist[candidates] < 0)]
+        frontier = np.unique(candidates)
+
+        depth += 1
+        dist[frontier] = depth
+
+        reached_before += layer_size
+        layer_size = len(frontier)
+        max_frontier = max(max_frontier, layer_size)
+
+    # No path found: every reachable cell was expanded
+    return solution.Solution(
+        found=False,
+        path=[],
+        path_length=0,
+        visited_count=reached_before,
+        expanded_count=reached_before,
+        max_frontier=max_frontier,
+    )
+
+
+def _walk_gradient(dist: np.ndarray, goal: maze.coord) -> List[maze.coord]:
+    # dist is wall-padded by one cell; step to any neighbor exactly one
+    # closer to start until distance 0 (padding is -1, never matches)
+    path: List[maze.coord] = [goal]
+    x, y = goal
+    d = int(dist[y + 1, x + 1])
+
+    while d > 0:
+        for dx, dy in maze.DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if dist[ny + 1, nx + 1] == d - 1:
+                x, y = nx, ny
+                break
+        d -= 1
+        path.append((x, y))
+
+    path.reverse()
+    return path
@@ -0,0 +1,28 @@
+# test_batch.py
+
+from src import runner, config
+from src.batch import solve_many, pack_maze, unpack_maze
+from src.solvers import solve_bfs, solve_dfs, solve_astar
+
+
+def _mazes():
+    return [runner.run_config(preset) for preset in config.PRESETS.values()]
+
+
+def test_pack_roundtrip_preserves_maze():
+    for m in _mazes():
+        clone = unpack_maze(pack_maze(m))
+        assert clone.grid.tolist() == [list(row) for row in m.grid]
+        assert (clone.start, clone.end) == (m.start, m.end)
+
+
+def test_solve_many_pool_matches_serial_in_input_order():
+    mazes = _mazes()
+    solvers = [solve_bfs, ("DFS", solve_dfs), solve_astar]
+
+    serial = solve_many(mazes, solvers, workers=1)
+    pooled = solve_many(mazes, solvers, workers=2, chunksize=2)
+
+    assert pooled == serial
+    assert serial[0][0] == solve_bfs(mazes[0])
+    assert serial[2][2] == solve_astar(mazes[2])
@@ -0,0 +1,208 @@
+# test_benchmark.py
+
+import os
+
+import pytest
+
+from src import config, junction_graph
+from src.benchmark import benchmark, config_key, make_run_id, read_export
+from src.maze_cache import MazeCache
+from src.junction_graph import solve_junction_astar, solve_junction_dijkstra
+from src.solvers import solve_astar, solve_bfs, solve_dfs
+
+CONFIGS = [config.PRESETS["a_small"], config.PRESETS["b_medium"], config.PRESETS["a_medium"]]
+SOLVERS = [solve_bfs, solve_dfs, solve_astar]
+
+
+def _stable(rows):
+    # everything except timing-dependent fields
+    return [(r.run_id, r.maze_hash, r.solver_name, r.solved, r.path_length, r.expanded_nodes) for r in rows]
+
+
+def test_parallel_benchmark_matches_serial_order():
+    serial = benchmark(CONFIGS, SOLVERS, repeats_per_config=2)
+    parallel = benchmark(CONFIGS, SOLVERS, repeats_per_config=2, workers=3)
+
+    assert len(parallel) == len(CONFIGS) * 2 * len(SOLVERS)
+    assert _stable(parallel) == _stable(serial)
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity") or len(os.sched_getaffinity(0)) < 2,
+                    reason="needs CPU affinity and 2 CPUs")
+def test_parallel_benchmark_with_pinned_cpus():
+    cpus = sorted(os.sched_getaffinity(0))[:2]
+    rows = benchmark(CONFIGS[:2], SOLVERS, workers=2, pin_cpus=cpus)
+    assert _stable(rows) == _stable(benchmark(CONFIGS[:2], SOLVERS))
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity not supported")
+def test_pinning_never_shares_a_cpu_between_workers():
+    cpu = sorted(os.sched_getaffinity(0))[0]
+    with pytest.raises(ValueError, match="2 workers need as many CPUs"):
+        benchmark(CONFIGS[:1], SOLVERS, workers=2, pin_cpus=[cpu])
+    with pytest.raises(ValueError):
+        benchmark(CONFIGS[:1], SOLVERS, workers=2, pin_cpus=[cpu, cpu])
+
+
+def test_parallel_benchmark_reads_cached_mazes_from_shared_memory(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    rows = benchmark(CONFIGS, SOLVERS, workers=2, maze_cache=cache)
+
+    assert cache.misses == len(CONFIGS)
+    assert _stable(rows) == _stable(benchmark(CONFIGS, SOLVERS))
+
+
+def test_solver_runs_do_not_share_per_maze_caches(monkeypatch):
+    builds = []
+    build = junction_graph.build_junction_graph
+    monkeypatch.setattr(junction_graph, "build_junction_graph", lambda m: builds.append(m) or build(m))
+
+    junction = [solve_junction_dijkstra, solve_junction_astar]
+    cfg = [config.PRESETS["a_medium"]]
+    forward = benchmark(cfg, junction)
+    backward = benchmark(cfg, junction[::-1])
+
+    # each run builds its own graph, whichever solver goes first
+    assert len(builds) == 4
+    assert sorted(_stable(forward)) == sorted(_stable(backward))
+
+    # and so does every timed call (plus warmup), not just the first
+    builds.clear()
+    rows = benchmark(cfg, junction, timing_repeats=3, timing_warmup=1)
+    assert len(builds) == 2 * 4
+    assert all(r.timing_repeats == 3 for r in rows)
+
+
+@pytest.mark.parametrize("ext", ["csv", "jsonl"])
+def test_streaming_export_resumes_after_a_crash(tmp_path, ext):
+    path = str(tmp_path / f"rows.{ext}")
+    full = benchmark(CONFIGS, SOLVERS, repeats_per_config=2, export_path=path)
+    with open(path, encoding="utf-8") as f:
+        complete = f.read()
+
+    # simulate a crash: keep the first two runs plus a torn line of the third
+    lines = complete.splitlines(keepends=True)
+    header = 1 if ext == "csv" else 0
+    kept = lines[:header + 2 * len(SOLVERS)] + [lines[header + 2 * len(SOLVERS)][:10]]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(kept))
+
+    workers = 2 if ext == "jsonl" else 1  # cover both paths
+    resumed = benchmark(CONFIGS, SOLVERS, repeats_per_config=2, export_path=path, resume=True, workers=workers)
+    assert _stable(resumed) == _stable(full[2 * len(SOLVERS):])
+
+    with open(path, encoding="utf-8") as f:
+        after = f.read().splitlines()
+    assert len(after) == len(lines)
+    assert [line.split(",")[0] for line in after] == [line.split(",")[0] for line in complete.splitlines()]
+
+    # nothing left to do, and keep_rows=False holds nothing in memory
+    assert benchmark(CONFIGS, SOLVERS, repeats_per_config=2, export_path=path, resume=True) == []
+    assert benchmark(CONFIGS, SOLVERS, export_path=str(tmp_path / f"lean.{ext}"), keep_rows=False) == []
+
+
+@pytest.mark.parametrize("ext", ["csv", "jsonl"])
+def test_resume_completes_partially_flushed_runs_without_duplicates(tmp_path, ext):
+    path = str(tmp_path / f"rows.{ext}")
+    benchmark(CONFIGS, SOLVERS, export_path=path)
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines(keepends=True)
+
+    # the crash hit after one row of the second run reached the disk
+    header = 1 if ext == "csv" else 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(lines[:header + len(SOLVERS) + 1]))
+
+    # the row that made it stays; only the solvers missing from the run rerun
+    resumed = benchmark(CONFIGS, SOLVERS, export_path=path, resume=True)
+    assert len(resumed) == 2 * len(SOLVERS) - 1
+    assert resumed[0].solver_name == SOLVERS[1].__name__
+
+    kept = [(record["run_id"], record["solver_name"]) for _, record in read_export(path)]
+    assert len(kept) == len(set(kept)) == len(CONFIGS) * len(SOLVERS)
+
+
+@pytest.mark.parametrize("ext", ["csv", "jsonl"])
+def test_resume_with_a_changed_solver_list_keeps_finished_rows(tmp_path, ext):
+    path = str(tmp_path / f"rows.{ext}")
+    benchmark(CONFIGS, SOLVERS[:2], repeats_per_config=2, export_path=path)
+    before = [(key, record["solver_name"]) for key, record in read_export(path)]
+
+    # one more solver: only it runs, for every run
+    added = benchmark(CONFIGS, SOLVERS, repeats_per_config=2, export_path=path, resume=True)
+    assert [r.solver_name for r in added] == [SOLVERS[2].__name__] * len(CONFIGS) * 2
+    after = [(key, record["solver_name"]) for key, record in read_export(path)]
+    assert after[:len(before)] == before
+    assert len(after) == len(set(after)) == len(CONFIGS) * 2 * len(SOLVERS)
+
+    # fewer solvers, or a different one: finished work is kept and skipped,
+    # a solver that never ran on these runs still runs
+    assert benchmark(CONFIGS, SOLVERS[1:], repeats_per_config=2, export_path=path, resume=True) == []
+    added = benchmark(CONFIGS, [solve_dfs, solve_bfs_unbounded], repeats_per_config=2,
+                      export_path=path, resume=True)
+    assert {r.solver_name for r in added} == {"solve_bfs_unbounded"}
+    assert all(r.is_best for r in added)  # alone in its batch
+    assert len(list(read_export(path))) == len(CONFIGS) * 2 * (len(SOLVERS) + 1)
+
+
+def test_resume_tells_apart_configs_that_share_a_run_id(tmp_path):
+    path = str(tmp_path / "rows.csv")
+    backtracker = {"width": 15, "height": 15, "family": "A", "seed_value": 1}
+    eller = dict(backtracker, perfect_algorithm="eller")
+
+    benchmark([backtracker], SOLVERS, export_path=path)
+    resumed = benchmark([backtracker, eller], SOLVERS, export_path=path, resume=True)
+
+    assert len(resumed) == len(SOLVERS)
+    assert resumed[0].run_id == make_run_id(backtracker, 0)
+    assert resumed[0].config_key == config_key(eller) != config_key(backtracker)
+
+
+@pytest.mark.parametrize("ext", ["csv", "jsonl"])
+def test_resume_rejects_a_different_schema(tmp_path, ext):
+    path = tmp_path / f"rows.{ext}"
+    text = "run_id,other\nx,1\n" if ext == "csv" else '{"run_id": "x", "other": 1}\n'
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(ValueError, match="Cannot resume"):
+        benchmark(CONFIGS[:1], SOLVERS, export_path=str(path), resume=True)
+    assert path.read_text(encoding="utf-8") == text
+
+
+def solve_bfs_unbounded(m):
+    # no budget parameter, so benchmark can't stop it
+    return solve_bfs(m)
+
+
+@pytest.mark.filterwarnings("ignore:solve_bfs_unbounded takes no budget")
+def test_budget_exceeded_runs_are_flagged_and_never_best():
+    rows = benchmark(CONFIGS[:1], [solve_bfs, solve_dfs, solve_bfs_unbounded], max_expansions=10)
+    by_name = {r.solver_name: r for r in rows}
+
+    for name in ("solve_bfs", "solve_dfs"):
+        assert not by_name[name].solved
+        assert by_name[name].notes == "budget exceeded: expansions"
+        assert not by_name[name].is_best
+
+    assert by_name["solve_bfs_unbounded"].solved
+    assert by_name["solve_bfs_unbounded"].is_best
+    assert by_name["solve_bfs_unbounded"].best_reason.endswith("(2 over budget)")
+
+    rows = benchmark(CONFIGS[:1], SOLVERS, time_limit_ms=0, workers=2)
+    assert all(r.notes == "budget exceeded: deadline" for r in rows)
+    assert [r.best_reason for r in rows if r.is_best][0].startswith("all over budget")
+
+
+def test_unbounded_solver_warns_when_a_budget_is_set():
+    with pytest.warns(UserWarning, match="solve_bfs_unbounded takes no budget"):
+        benchmark(CONFIGS[:1], [solve_bfs, solve_bfs_unbounded], max_expansions=10)
+
+
+@pytest.mark.filterwarnings("ignore:solve_bfs_unbounded takes no budget")
+def test_over_budget_runs_are_timed_once():
+    rows = benchmark(CONFIGS[:1], [solve_bfs, solve_bfs_unbounded], max_expansions=10,
+                     timing_repeats=5, timing_warmup=1)
+    by_name = {r.solver_name: r for r in rows}
+
+    assert by_name["solve_bfs"].notes == "budget exceeded: expansions"
+    assert by_name["solve_bfs"].timing_repeats == 1
+    assert by_name["solve_bfs_unbounded"].timing_repeats == 5
@@ -0,0 +1,73 @@
+# test_components.py
+
+import random
+
+import numpy as np
+
+from src import runner
+from src.analyzer import analyze_maze
+from src.components import ComponentTracker
+from src.maze import Maze, OPEN
+
+
+def _bfs_labels(open_mask):
+    height, width = open_mask.shape
+    labels = np.full((height, width), -1, dtype=np.int32)
+    next_label = 0
+    for y in range(height):
+        for x in range(width):
+            if not open_mask[y, x] or labels[y, x] >= 0:
+                continue
+            labels[y, x] = next_label
+            stack = [(x, y)]
+            while stack:
+                cx, cy = stack.pop()
+                for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+                    if 0 <= nx < width and 0 <= ny < height and open_mask[ny, nx] and labels[ny, nx] < 0:
+                        labels[ny, nx] = next_label
+                        stack.append((nx, ny))
+            next_label += 1
+    return labels, next_label
+
+
+def _same_partition(a, b):
+    pairs = {(int(x), int(y)) for x, y in zip(a.ravel(), b.ravel())}
+    return len(pairs) == len({x for x, _ in pairs}) == len({y for _, y in pairs})
+
+
+def test_tracker_matches_bfs_components_scalar_and_batched():
+    rng = random.Random(3)
+    for trial in range(30):
+        width, height = rng.randint(1, 12), rng.randint(1, 12)
+        order = list(range(width * height))
+        rng.shuffle(order)
+        order = order[:rng.randint(0, len(order))]
+
+        scalar = ComponentTracker(width, height)
+        batched = ComponentTracker(width, height)
+        for idx in order:
+            scalar.open_cell((idx % width, idx // width))
+        for i in range(0, len(order), 7):
+            batched.open_cells(np.array(order[i:i + 7]))
+
+        open_mask = np.zeros((height, width), dtype=bool)
+        open_mask.ravel()[order] = True
+        expected, count = _bfs_labels(open_mask)
+
+        for tracker in (scalar, batched):
+            assert tracker.component_count == count
+            assert _same_partition(tracker.labels(), expected)
+
+
+def test_family_b_maze_carries_component_labels():
+    m = runner.run(31, 31, "B", seed_value=2, open_ratio=0.4, verbose=False)
+
+    sx, sy = m.start
+    ex, ey = m.end
+    assert m.components is not None
+    assert m.components[sy, sx] == m.components[ey, ex]
+    assert ((m.components >= 0) == (np.array(m.grid) == OPEN)).all()
+
+    # the label shortcut and the BFS fallback agree
+    plain = Maze(m.width, m.height, m.grid, m.start, m.end)
+    assert analyze_maze(m) == analyze_maze(plain)
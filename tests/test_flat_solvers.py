@@ -0,0 +1,36 @@
+# test_flat_solvers.py
+
+from src import runner, config, solvers
+from src.flat_solvers import solve_bfs_flat, solve_dfs_flat, solve_astar_flat
+from tests.helpers import maze_from_ascii, assert_valid_path
+
+
+PAIRS = [
+    (solvers.solve_bfs, solve_bfs_flat),
+    (solvers.solve_dfs, solve_dfs_flat),
+    (solvers.solve_astar, solve_astar_flat),
+]
+
+
+def test_flat_solvers_match_tuple_solvers_on_presets():
+    for preset in config.PRESETS.values():
+        for backend in ("list", "compact"):
+            m = runner.run_config(preset, grid_backend=backend)
+            for tuple_solver, flat_solver in PAIRS:
+                sol = flat_solver(m)
+                assert sol == tuple_solver(m)
+                assert_valid_path(m, sol.path)
+
+
+def test_flat_solvers_unsolvable():
+    m = maze_from_ascii([
+        "S#E",
+        "###",
+        "...",
+    ])
+
+    for _, flat_solver in PAIRS:
+        sol = flat_solver(m)
+        assert sol.found is False
+        assert sol.path == []
+        assert sol.visited_count == 1
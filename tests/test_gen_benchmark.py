@@ -0,0 +1,42 @@
+# test_gen_benchmark.py
+
+import csv
+import json
+
+from src import runner
+from src.benchmark import compute_maze_hash
+from src.gen_benchmark import benchmark_generation, sweep_configs
+
+
+def test_sweep_covers_families_and_options():
+    configs = sweep_configs(
+        families=["A", "B"], sizes=[(21, 21)], open_ratios=[0.3, 0.5], seeds=[1, 2],
+        perfect_algorithms=["backtracker", "eller"], family_b_engines=["frontier", "legacy"],
+    )
+    assert len(configs) == 2 * 2 + 2 * 2 * 2
+    assert all("open_ratio" not in c for c in configs if c["family"] == "A")
+
+
+def test_generation_rows_and_exports(tmp_path):
+    configs = sweep_configs(sizes=[(25, 25)], open_ratios=[0.4], family_b_engines=["frontier", "legacy"])
+    rows = benchmark_generation(configs, export_path=str(tmp_path / "gen.csv"))
+
+    assert [r.generator for r in rows] == ["backtracker", "frontier", "legacy"]
+    assert len({r.run_id for r in rows}) == len(rows)
+    for cfg, row in zip(configs, rows):
+        assert row.maze_hash == compute_maze_hash(runner.run_config(cfg))
+        assert row.cells == 625 and row.cells_per_s > 0
+        assert row.peak_mem_kb > 0
+
+    backtracker, frontier, legacy = rows
+    assert backtracker.retry_count > 0 and backtracker.batch_count == 0
+    assert frontier.retry_count == 0 and frontier.batch_count > 0
+    assert legacy.retry_count > 0 and legacy.batch_count == 0
+
+    with open(tmp_path / "gen.csv", newline="", encoding="utf-8") as f:
+        assert len(list(csv.DictReader(f))) == len(rows)
+
+    benchmark_generation(configs[:1], measure_memory=False, export_path=str(tmp_path / "gen.jsonl"))
+    with open(tmp_path / "gen.jsonl", encoding="utf-8") as f:
+        record = json.loads(f.readline())
+    assert record["peak_mem_kb"] is None and record["generator"] == "backtracker"
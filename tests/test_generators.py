@@ -0,0 +1,114 @@
+# test_generators.py
+
+import numpy as np
+
+from src import runner, generators, maze
+from src.analyzer import analyze_maze
+from src.benchmark import compute_maze_hash
+from src.solvers import solve_bfs
+from tests.helpers import assert_valid_path
+
+
+def test_eller_builds_perfect_maze_on_backtracker_lattice():
+    for width, height in [(15, 15), (21, 12), (8, 31)]:
+        m = runner.run(width, height, "A", seed_value=3, verbose=False, perfect_algorithm="eller")
+        ref = runner.run(width, height, "A", seed_value=3, verbose=False)
+        f = analyze_maze(m)
+
+        # a spanning tree over the same lattice: every cell reachable, no loops
+        assert (m.start, m.end) == (ref.start, ref.end)
+        assert f.open_cells == analyze_maze(ref).open_cells
+        assert f.reachable_ratio == 1.0
+        assert_valid_path(m, solve_bfs(m).path)
+
+
+def test_eller_rows_are_deterministic_and_streamed(tmp_path):
+    rows = list(generators.iter_eller_rows(41, 9, seed=7))
+
+    assert len(rows) == 9
+    assert all(len(row) == 41 for row in rows)
+    assert rows == list(generators.iter_eller_rows(41, 9, seed=7))
+    assert rows != list(generators.iter_eller_rows(41, 9, seed=8))
+
+    out = tmp_path / "maze.bin"
+    generators.write_eller_rows(str(out), 41, 9, seed=7)
+    assert out.read_bytes() == b"".join(rows)
+
+
+def test_eller_fills_compact_grid_like_list_grid():
+    m_list = runner.run(31, 31, "A", seed_value=5, verbose=False, perfect_algorithm="eller")
+    m_compact = runner.run(31, 31, "A", seed_value=5, verbose=False, perfect_algorithm="eller",
+                           grid_backend="compact")
+
+    assert m_compact.grid.tolist() == m_list.grid
+
+
+def test_frontier_engine_hits_target_and_is_solvable():
+    for backend in ("list", "compact"):
+        for open_ratio in (0.35, 0.8):
+            m = runner.run(41, 29, "B", seed_value=11, open_ratio=open_ratio, verbose=False,
+                           grid_backend=backend)
+            f = analyze_maze(m)
+
+            target = int(open_ratio * 41 * 29)
+            assert f.open_cells == target
+            assert f.shortest_path_length is not None
+            assert_valid_path(m, solve_bfs(m).path)
+
+
+def test_family_b_engines_are_seed_deterministic():
+    for engine in generators.FAMILY_B_ENGINES:
+        a = runner.run(31, 31, "B", seed_value=4, open_ratio=0.5, verbose=False, family_b_engine=engine)
+        b = runner.run(31, 31, "B", seed_value=4, open_ratio=0.5, verbose=False, family_b_engine=engine)
+        assert a.grid == b.grid
+
+
+def test_dense_batch_is_per_seed_reproducible_and_solvable():
+    batch = generators.generate_dense_batch([5, 6, 7], 31, 21, 0.4)
+    assert batch.shape == (3, 21, 31)
+    assert (batch[1] == generators.generate_dense_batch([6], 31, 21, 0.4)[0]).all()
+    assert not (batch[0] == batch[1]).all()
+
+    open_counts = (batch == maze.OPEN).sum(axis=(1, 2))
+    assert (open_counts == int(0.4 * 31 * 21)).all()
+    assert batch_reachable(batch, (0, 0), (30, 20)).all()
+
+
+def batch_reachable(batch: np.ndarray, start: maze.coord, end: maze.coord) -> np.ndarray:
+    """(K,) bool: is end reachable from start in each maze (batched flood fill)."""
+    k, height, width = batch.shape
+    is_open = batch == maze.OPEN
+    (sx, sy), (ex, ey) = start, end
+
+    reached = np.zeros((k, height + 2, width + 2), dtype=bool)
+    reached[:, sy + 1, sx + 1] = is_open[:, sy, sx]
+    while True:
+        grown = (reached[:, 1:-1, 1:-1] | reached[:, :-2, 1:-1] | reached[:, 2:, 1:-1]
+                 | reached[:, 1:-1, :-2] | reached[:, 1:-1, 2:]) & is_open
+        if np.array_equal(grown, reached[:, 1:-1, 1:-1]):
+            break
+        reached[:, 1:-1, 1:-1] = grown
+
+    return reached[:, ey + 1, ex + 1]
+
+
+def test_run_batch_matches_single_batch_engine_runs():
+    seeds = [11, 12, 13]
+    mazes = runner.run_batch(21, 21, 0.5, seeds)
+    for seed_value, m in zip(seeds, mazes):
+        single = runner.run(21, 21, "B", seed_value, 0.5, verbose=False, family_b_engine="batch")
+        assert compute_maze_hash(m) == compute_maze_hash(single)
+        assert solve_bfs(m) == solve_bfs(single)
+        assert single.components[0][0] == single.components[20][20]
+
+
+def test_run_configs_groups_batch_engine_configs():
+    configs = [
+        {"width": 21, "height": 21, "family": "B", "seed_value": s, "open_ratio": 0.5, "family_b_engine": "batch"}
+        for s in (1, 2)
+    ]
+    configs.insert(1, {"width": 15, "height": 15, "family": "A", "seed_value": 1})
+
+    mazes = runner.run_configs(configs)
+    for cfg, m in zip(configs, mazes):
+        assert compute_maze_hash(m) == compute_maze_hash(runner.run_config(cfg))
@@ -0,0 +1,92 @@
+# test_grids.py
+
+import copy
+
+import pytest
+
+from src import runner, config, generators
+from src.analyzer import analyze_maze
+from src.benchmark import compute_maze_hash
+from src.grids import CompactGrid, freeze_maze
+from src.shared_maze import SharedMazeStore, attached_maze
+from src.solvers import solve_astar
+from tests import helpers
+
+
+def test_compact_grid_matches_list_grid():
+    cfg = config.PRESETS["b_medium"]
+    m_list = runner.run_config(cfg)
+    m_compact = runner.run_config(cfg, grid_backend="compact")
+
+    assert isinstance(m_compact.grid, CompactGrid)
+    assert m_compact.grid.tolist() == m_list.grid
+    assert compute_maze_hash(m_compact) == compute_maze_hash(m_list)
+    assert analyze_maze(m_compact) == analyze_maze(m_list)
+
+    for pos in [(0, 0), (5, 7), (30, 30), (-1, 0), (31, 0)]:
+        assert m_compact.is_open(pos) == m_list.is_open(pos)
+        if m_list.in_bounds(pos):
+            assert m_compact.neighbors(pos) == m_list.neighbors(pos)
+
+    sol = solve_astar(m_compact)
+    assert sol.found
+    assert sol.path == solve_astar(m_list).path
+    helpers.assert_valid_path(m_compact, sol.path)
+
+
+def test_compact_maze_deepcopy_is_independent():
+    m = runner.run_config(config.PRESETS["a_small"], grid_backend="compact")
+    clone = copy.deepcopy(m)
+
+    clone.grid[m.start[1]][m.start[0]] = 1
+    assert m.is_open(m.start)
+    assert not clone.is_open(m.start)
+
+
+def test_create_grid_rejects_unknown_backend():
+    try:
+        generators.create_grid(3, 3, backend="sparse")
+    except ValueError:
+        pass
+    else:
+        assert False, "expected ValueError"
+
+    g = generators.create_grid(4, 3, backend="compact")
+    assert CompactGrid.from_numpy(g.to_numpy()).tolist() == g.tolist()
+
+
+def test_frozen_maze_is_read_only_and_shared_not_copied():
+    m = runner.run_config(config.PRESETS["b_medium"])
+    frozen = freeze_maze(m)
+
+    assert frozen.grid.readonly
+    assert freeze_maze(frozen) is frozen
+    assert copy.deepcopy(frozen) is frozen
+    assert compute_maze_hash(frozen) == compute_maze_hash(m)
+    assert solve_astar(frozen) == solve_astar(m)
+
+    with pytest.raises(TypeError):
+        frozen.grid[1][1] = 0
+    with pytest.raises(TypeError):
+        frozen.grid.set(1, 1, 0)
+    with pytest.raises(ValueError):
+        frozen.components[0, 0] = 5
+
+    # a writable compact grid still deep-copies into an independent one
+    compact = runner.run_config(config.PRESETS["a_small"], grid_backend="compact")
+    clone = copy.deepcopy(compact)
+    clone.grid.set(0, 0, 0)
+    assert compact.grid.get(0, 0) != 0
+
+
+def test_shared_memory_store_roundtrip():
+    mazes = [runner.run_config(config.PRESETS[name]) for name in ("a_small", "b_medium")]
+    with SharedMazeStore(mazes) as store:
+        for m, ref in zip(mazes, store.refs):
+            with attached_maze(ref) as attached:
+                assert attached.grid.readonly
+                assert compute_maze_hash(attached) == compute_maze_hash(m)
+                assert solve_astar(attached) == solve_astar(m)
+
+    with SharedMazeStore([]) as empty:
+        assert empty.refs == [] and empty._shm is None
@@ -17,3 +17,23 @@ def test_preset_a_small_all_solvers_work():
     assert sol_dfs.found
     helpers.assert_valid_path(m, sol_dfs.path)
     assert sol_astar.path_length == sol_bfs.path_length
+
+def test_bidirectional_solvers_scored_by_oracle():
+    from src.eval.metrics import MazeMeta, run_solver_with_metrics
+    from src.eval.labeling import choose_oracle_label, compute_regret
+
+    cfg = config.PRESETS["a_medium"]
+    m = runner.run_config(cfg, verbose=False)
+    meta = MazeMeta(maze_id="a_medium", seed=cfg["seed_value"], family="A",
+                    width=cfg["width"], height=cfg["height"])
+
+    metrics = [
+        run_solver_with_metrics(m, fn, solver_name=name, meta=meta)
+        for name, fn in [("BFS", solve_bfs), ("BIDIR_BFS", solvers.solve_bidir_bfs),
+                         ("BIDIR_ASTAR", solvers.solve_bidir_astar)]
+    ]
+    oracle = choose_oracle_label(metrics)
+
+    assert all(x.solved for x in metrics)
+    assert len({x.path_length for x in metrics}) == 1
+    assert compute_regret("BIDIR_BFS", oracle, metrics) >= 0
@@ -0,0 +1,53 @@
+# test_junction_graph.py
+
+from src import runner, config
+from src.junction_graph import (
+    build_junction_graph, junction_graph_for, solve_junction_dijkstra, solve_junction_astar,
+)
+from src.solvers import solve_bfs
+from tests.helpers import maze_from_ascii, assert_valid_path
+
+
+def test_corridors_contract_to_weighted_edges():
+    m = maze_from_ascii([
+        "S...#",
+        "###.#",
+        "#...#",
+        "#.###",
+        "#...E",
+    ])
+
+    graph = build_junction_graph(m)
+
+    # a single corridor: only the two endpoints survive
+    assert set(graph.adjacency) == {m.start, m.end}
+    assert graph.adjacency[m.start][0][:2] == (m.end, 12)
+
+
+def test_junction_solvers_match_bfs_on_presets():
+    for preset in config.PRESETS.values():
+        m = runner.run_config(preset)
+        ref = solve_bfs(m)
+
+        for solver in (solve_junction_dijkstra, solve_junction_astar):
+            sol = solver(m)
+            assert sol.found == ref.found
+            assert sol.path_length == ref.path_length
+            assert_valid_path(m, sol.path)
+
+
+def test_junction_graph_is_cached_per_maze():
+    m = runner.run_config(config.PRESETS["a_medium"])
+    assert junction_graph_for(m) is junction_graph_for(m)
+
+
+def test_junction_solver_unsolvable():
+    m = maze_from_ascii([
+        "S#E",
+        "###",
+        "...",
+    ])
+
+    sol = solve_junction_astar(m)
+    assert sol.found is False
+    assert sol.path == []
@@ -0,0 +1,48 @@
+# test_lazy_maze.py
+
+import pickle
+
+from src import runner
+from src.benchmark import compute_maze_hash
+from src.grids import CompactGrid
+from src.lazy_maze import LazyGrid, create_lazy_maze
+from src.maze import Maze
+from src.solvers import solve_astar, solve_bfs
+
+
+def test_lazy_cells_are_deterministic_and_access_order_free():
+    a = create_lazy_maze(200, 150, seed=7, open_ratio=0.55, block_size=16, max_blocks=4)
+    b = create_lazy_maze(200, 150, seed=7, open_ratio=0.55, block_size=8)
+
+    probes = [(x, y) for y in range(0, 150, 7) for x in range(0, 200, 11)]
+    assert [a.is_open(p) for p in reversed(probes)][::-1] == [b.is_open(p) for p in probes]
+    assert a.grid.blocks_in_memory() <= 4 and a.grid.evictions > 0
+
+    c = create_lazy_maze(200, 150, seed=8, open_ratio=0.55)
+    assert [a.is_open(p) for p in probes] != [c.is_open(p) for p in probes]
+
+
+def test_lazy_maze_matches_materialized_copy():
+    m = runner.run_config({"width": 37, "height": 29, "family": "L", "seed_value": 3, "open_ratio": 0.5})
+    assert isinstance(m.grid, LazyGrid)
+
+    dense = Maze(m.width, m.height, CompactGrid.from_rows([list(row) for row in m.grid]), m.start, m.end)
+    assert compute_maze_hash(dense) == compute_maze_hash(m)
+
+    sol = solve_astar(m)
+    assert sol.found  # the start->end corridor is always there
+    assert sol == solve_astar(dense)
+    assert solve_bfs(m) == solve_bfs(dense)
+
+    clone = pickle.loads(pickle.dumps(m))
+    assert compute_maze_hash(clone) == compute_maze_hash(m)
+
+
+def test_astar_on_huge_lazy_maze_touches_only_nearby_blocks():
+    n = 10 ** 9
+    m = create_lazy_maze(n, n, seed=1, open_ratio=0.6, start=(n // 2, n // 2), end=(n // 2 + 300, n // 2 + 200))
+
+    sol = solve_astar(m)
+    assert sol.found
+    assert sol.path_length >= 500
+    assert m.grid.blocks_in_memory() < 500  # out of ~10^15 blocks
@@ -0,0 +1,87 @@
+# test_maze_cache.py
+
+from src import runner, config
+from src.benchmark import benchmark, compute_maze_hash
+from src.maze_cache import MazeCache, cache_key
+from src.solvers import solve_bfs, solve_astar
+
+
+def test_cache_hit_is_memory_mapped_and_identical(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    cfg = config.PRESETS["b_medium"]
+
+    built = cache.run_config(cfg)
+    loaded = cache.run_config(cfg)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert type(built.grid) is type(loaded.grid)  # miss and hit hand out the same backend
+    assert compute_maze_hash(loaded) == compute_maze_hash(built)
+    assert (loaded.start, loaded.end) == (built.start, built.end)
+    assert (loaded.components == built.components).all()
+    assert solve_astar(loaded) == solve_astar(built)
+
+    # a fresh cache object on the same directory still hits
+    again = MazeCache(str(tmp_path))
+    assert again.get(cfg) is not None
+    assert again.get_by_hash(compute_maze_hash(built)) is not None
+
+
+def test_cache_key_normalizes_defaults():
+    cfg = {"width": 15, "height": 15, "family": "a", "seed_value": 1}
+    explicit = dict(cfg, family="A", perfect_algorithm="backtracker", open_ratio=0.3)
+
+    assert cache_key(cfg) == cache_key(explicit)
+    assert cache_key(cfg) != cache_key(dict(cfg, seed_value=2))
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    a = {"width": 21, "height": 21, "family": "A", "seed_value": 1}
+    b = {"width": 21, "height": 21, "family": "A", "seed_value": 2}
+    c = {"width": 21, "height": 21, "family": "A", "seed_value": 3}
+
+    cache = MazeCache(str(tmp_path), max_bytes=2 * 21 * 21)
+    cache.run_config(a)
+    cache.run_config(b)
+    cache.run_config(a)  # a is now more recent than b
+    cache.run_config(c)
+
+    assert a in cache and c in cache
+    assert b not in cache
+    assert cache.total_bytes() <= 2 * 21 * 21
+
+
+def test_unseeded_configs_are_not_cached(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    cache.run_config({"width": 15, "height": 15, "family": "A"})
+    assert len(cache) == 0
+
+
+def test_benchmark_uses_cache(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    cfg = config.PRESETS["a_small"]
+
+    rows = benchmark([cfg], [solve_bfs], repeats_per_config=3, maze_cache=cache)
+    rows_again = benchmark([cfg], [solve_bfs], repeats_per_config=1, maze_cache=cache)
+
+    assert len({row.maze_hash for row in rows + rows_again}) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert rows[0].maze_hash == compute_maze_hash(runner.run_config(cfg))
+
+
+def test_hits_update_lru_clocks_without_rewriting_the_index(tmp_path):
+    a = {"width": 21, "height": 21, "family": "A", "seed_value": 1}
+    b = {"width": 21, "height": 21, "family": "A", "seed_value": 2}
+    index_path = tmp_path / "index.json"
+
+    with MazeCache(str(tmp_path)) as cache:
+        cache.run_config(a)
+        cache.run_config(b)
+        written = index_path.read_text()
+        assert cache.get_by_hash(compute_maze_hash(cache.run_config(b))) is not None
+        cache.run_config(a)
+        assert index_path.read_text() == written
+
+    # clocks reach disk on close: a was used last, so b goes first
+    cache = MazeCache(str(tmp_path), max_bytes=2 * 21 * 21)
+    cache.put({"width": 21, "height": 21, "family": "A", "seed_value": 3}, runner.run_config(a))
+    assert a in cache and b not in cache
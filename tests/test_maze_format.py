@@ -0,0 +1,68 @@
+# test_maze_format.py
+
+import copy
+import pickle
+
+import pytest
+
+from src import config, runner
+from src.analyzer import analyze_maze
+from src.benchmark import compute_maze_hash
+from src.flat_solvers import solve_bfs_flat
+from src.grids import PackedGrid
+from src.maze_format import (
+    HEADER_SIZE, encode_maze, decode_maze, load_maze, read_header, write_config_maze, write_maze,
+)
+from src.solvers import solve_astar, solve_bfs
+
+
+@pytest.mark.parametrize("preset", ["a_medium", "b_medium"])
+def test_roundtrip_through_file(tmp_path, preset):
+    cfg = config.PRESETS[preset]
+    m = runner.run_config(cfg)
+    path = str(tmp_path / "maze.bin")
+
+    size = write_config_maze(path, cfg, m)
+    loaded = load_maze(path, verify=True)
+
+    assert isinstance(loaded.grid, PackedGrid)
+    assert size == HEADER_SIZE + (m.width * m.height + 7) // 8
+    assert compute_maze_hash(loaded) == compute_maze_hash(m)
+    assert (loaded.start, loaded.end) == (m.start, m.end)
+    assert solve_bfs(loaded) == solve_bfs(m)
+    assert solve_astar(loaded) == solve_astar(m)
+    assert solve_bfs_flat(loaded) == solve_bfs(m)
+    assert analyze_maze(loaded) == analyze_maze(m)
+
+    header = read_header(path)
+    assert header.family == cfg["family"].upper()
+    assert header.seed == cfg["seed_value"]
+
+
+def test_loaded_maze_copies_and_pickles(tmp_path):
+    m = runner.run_config(config.PRESETS["a_small"])
+    path = str(tmp_path / "maze.bin")
+    write_maze(path, m, checksum=False)
+    loaded = load_maze(path)
+
+    assert read_header(path).checksum is None
+    for clone in (copy.deepcopy(loaded), pickle.loads(pickle.dumps(loaded))):
+        assert compute_maze_hash(clone) == compute_maze_hash(m)
+        assert solve_bfs(clone) == solve_bfs(m)
+
+
+def test_corrupt_and_foreign_files_are_rejected():
+    m = runner.run_config(config.PRESETS["a_small"])
+    data = bytearray(encode_maze(m, family="A", seed=1))
+
+    data[-1] ^= 0xFF
+    decode_maze(bytes(data))  # no verify: read as-is
+    with pytest.raises(ValueError, match="checksum"):
+        decode_maze(bytes(data), verify=True)
+
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_maze(bytes(data[:-1]))
+
+    data[:4] = b"NOPE"
+    with pytest.raises(ValueError, match="Not a maze file"):
+        decode_maze(bytes(data))
@@ -0,0 +1,69 @@
+# test_maze_index.py
+
+import pytest
+
+from src import runner, config
+from src.maze_index import MazeIndex
+from src.solvers import solve_bfs
+from tests.helpers import maze_from_ascii, assert_valid_path
+
+
+def test_index_path_matches_bfs():
+    m = runner.run_config(config.PRESETS["b_medium"])
+    index = MazeIndex(m)
+
+    sol = index.solve()
+    ref = solve_bfs(m)
+
+    assert sol.found
+    assert sol.path == ref.path
+    assert index.distance_to(m.end) == ref.path_length
+    assert_valid_path(m, sol.path)
+
+
+def test_index_answers_many_goals_from_one_tree():
+    m = maze_from_ascii([
+        "S....",
+        "###..",
+        "...#.",
+        "..##.",
+        "....E",
+    ])
+    index = MazeIndex(m)
+
+    assert index.distance_to((4, 0)) == 4
+    assert index.distance_to((0, 4)) == 12
+    assert index.distance_to((0, 1)) is None  # wall
+    assert index.path_to((0, 1)).found is False
+    assert index.path_to((2, 0)).path == [(0, 0), (1, 0), (2, 0)]
+    assert (index.hits, index.misses) == (4, 1)
+
+
+def test_index_evicts_least_recently_used_source():
+    m = maze_from_ascii([
+        "S...E",
+    ])
+    index = MazeIndex(m, max_trees=2)
+
+    index.distance_to(m.end, source=(0, 0))
+    index.distance_to(m.end, source=(1, 0))
+    index.distance_to(m.end, source=(0, 0))
+    index.distance_to(m.end, source=(2, 0))
+
+    assert index.sources() == [(0, 0), (2, 0)]
+    assert index.distance_to((0, 0), source=(2, 0)) == 2
+
+
+def test_index_rejects_out_of_bounds_source():
+    m = maze_from_ascii([
+        "S...",
+        "....",
+        "...E",
+    ])
+    index = MazeIndex(m)
+
+    for source in [(6, 0), (0, 5), (-1, 0), (4, 2)]:
+        with pytest.raises(ValueError, match="out of bounds"):
+            index.path_to(m.end, source=source)
+    assert index.sources() == []
+    assert index.path_to(m.end, source=(3, 0)).path[0] == (3, 0)
@@ -0,0 +1,40 @@
+# test_rng.py
+
+from src import runner, rng
+from src.benchmark import compute_maze_hash
+from src.rng import GenerationContext
+
+
+CONFIGS = [
+    {"width": 21, "height": 21, "family": "A", "seed_value": 3},
+    {"width": 25, "height": 19, "family": "B", "seed_value": 8, "open_ratio": 0.45},
+    {"width": 21, "height": 21, "family": "A", "seed_value": 3, "perfect_algorithm": "eller"},
+]
+
+
+def test_pooled_generation_is_byte_identical_to_serial():
+    serial = runner.run_configs(CONFIGS)
+    pooled = runner.run_configs(CONFIGS, workers=2)
+
+    assert [compute_maze_hash(m) for m in pooled] == [compute_maze_hash(m) for m in serial]
+
+
+def test_generation_does_not_touch_global_rng():
+    rng.seed(123)
+    expected = rng.rng.random()
+
+    rng.seed(123)
+    runner.run_config(CONFIGS[1])
+    assert rng.rng.random() == expected
+
+
+def test_context_matches_seed_value_and_spawns_distinct_streams():
+    cfg = dict(CONFIGS[1])
+    seeded = runner.run_config(cfg)
+    del cfg["seed_value"]
+    with_ctx = runner.run_config(cfg, ctx=GenerationContext.from_seed(8))
+    assert with_ctx.grid == seeded.grid
+
+    streams = GenerationContext.spawn(root_seed=0, n=3)
+    assert [c.seed_value for c in streams] == [c.seed_value for c in GenerationContext.spawn(0, 3)]
+    assert len({c.random.random() for c in streams}) == 3
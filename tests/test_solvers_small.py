@@ -1,7 +1,12 @@
 # test_solvers_small.py
 
 from tests.helpers import maze_from_ascii, assert_valid_path
-from src.solvers import solve_bfs, solve_astar, solve_dfs
+from src.solvers import solve_bfs, solve_astar, solve_dfs, solve_bidir_bfs, solve_bidir_astar, solve_jps
+from src.solvers import solve_astar_bucket, solve_idastar, solve_beam_astar
+from src.budget import SearchBudget
+from src.flat_solvers import solve_astar_flat, solve_bfs_flat, solve_dfs_flat
+from src.junction_graph import solve_junction_astar, solve_junction_dijkstra
+from src.vector_solvers import solve_bfs_layers
 
 def test_bfs_finds_path():
     m = maze_from_ascii([
@@ -61,3 +66,214 @@ def test_unsolvable_maze_returns_not_found():
     assert sol.found is False
     assert sol.path == []
     assert sol.path_length == 0
+
+def test_bidirectional_solvers_match_bfs_shortest_path():
+    m = maze_from_ascii([
+        "S....",
+        "###..",
+        "...#.",
+        "..##.",
+        "....E",
+    ])
+
+    sol_bfs = solve_bfs(m)
+
+    for solver in (solve_bidir_bfs, solve_bidir_astar):
+        sol = solver(m)
+        assert sol.found
+        assert sol.path_length == sol_bfs.path_length
+        assert_valid_path(m, sol.path)
+
+def test_bidirectional_solvers_unsolvable_and_adjacent():
+    blocked = maze_from_ascii([
+        "S#E",
+        "###",
+        "...",
+    ])
+    adjacent = maze_from_ascii(["S", "E"])
+
+    for solver in (solve_bidir_bfs, solve_bidir_astar):
+        sol = solver(blocked)
+        assert sol.found is False
+        assert sol.path == []
+
+        sol = solver(adjacent)
+        assert sol.path == [adjacent.start, adjacent.end]
+
+def test_jps_matches_bfs_shortest_path():
+    m = maze_from_ascii([
+        "S....",
+        "###..",
+        "...#.",
+        "..##.",
+        "....E",
+    ])
+
+    sol_bfs = solve_bfs(m)
+    sol_jps = solve_jps(m)
+
+    assert sol_jps.found
+    assert sol_jps.path_length == sol_bfs.path_length
+    assert_valid_path(m, sol_jps.path)
+
+def test_jps_prunes_open_grid():
+    m = maze_from_ascii([
+        "S.......",
+        "........",
+        "........",
+        ".......E",
+    ])
+
+    sol_astar = solve_astar(m)
+    sol_jps = solve_jps(m)
+
+    assert sol_jps.path_length == sol_astar.path_length
+    assert_valid_path(m, sol_jps.path)
+    assert sol_jps.expanded_count < sol_astar.expanded_count
+
+def test_bucket_astar_matches_heap_astar():
+    m = maze_from_ascii([
+        "S....",
+        "###..",
+        "...#.",
+        "..##.",
+        "....E",
+    ])
+
+    sol_heap = solve_astar(m)
+
+    for tie_break in ("lifo", "fifo"):
+        sol = solve_astar(m, queue="bucket", tie_break=tie_break)
+        assert sol.found
+        assert sol.path_length == sol_heap.path_length
+        assert_valid_path(m, sol.path)
+
+    assert solve_astar_bucket(m).path_length == sol_heap.path_length
+
+def test_bucket_astar_lifo_prefers_deep_nodes_on_open_grid():
+    m = maze_from_ascii([
+        "S.......",
+        "........",
+        "........",
+        ".......E",
+    ])
+
+    sol = solve_astar(m, queue="bucket", tie_break="lifo")
+
+    assert sol.path_length == 10
+    assert sol.expanded_count == sol.path_length + 1
+
+def test_idastar_finds_shortest_path_with_small_memory():
+    m = maze_from_ascii([
+        "S....",
+        "###..",
+        "...#.",
+        "..##.",
+        "....E",
+    ])
+
+    sol = solve_idastar(m)
+
+    assert sol.found
+    assert sol.optimal is True
+    assert sol.path_length == solve_bfs(m).path_length
+    assert sol.max_frontier == sol.path_length + 1
+    assert_valid_path(m, sol.path)
+
+def test_beam_astar_respects_frontier_ceiling():
+    m = maze_from_ascii([
+        "S.......",
+        "..#.....",
+        "....#...",
+        ".#.....E",
+    ])
+
+    unbounded = solve_beam_astar(m)
+    assert unbounded.optimal is True
+    assert unbounded.pruned_count == 0
+    assert unbounded.path_length == solve_astar(m).path_length
+
+    bounded = solve_beam_astar(m, beam_width=2)
+    assert bounded.max_frontier <= 4
+    assert bounded.pruned_count > 0
+    assert bounded.optimal is None
+    assert bounded.cost_lower_bound <= unbounded.path_length <= bounded.path_length
+    assert_valid_path(m, bounded.path)
+
+def test_beam_astar_retained_state_stays_below_astar():
+    # peak memory, not just the frontier: closed/parent/g state must not
+    # grow with the number of cells visited
+    import gc
+    import tracemalloc
+    from src.maze import Maze
+
+    n = 100
+    m = Maze(n, n, [[0] * n for _ in range(n)], (0, 0), (n - 1, n - 1))
+
+    def peak_kb(solver):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            sol = solver(m)
+            return sol, tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    beam, beam_kb = peak_kb(lambda m: solve_beam_astar(m, beam_width=16))
+    astar, astar_kb = peak_kb(solve_astar)
+
+    assert beam.found and beam.max_frontier <= 32
+    assert beam.path_length == astar.path_length
+    assert beam_kb < astar_kb / 4
+
+def test_budget_stops_search_with_distinct_status():
+    # pillars, so that JPS also needs more than a handful of jump points
+    pillars = [".#" * 10, "." * 20] * 9
+    m = maze_from_ascii(["S" + "." * 19] + pillars + ["." * 19 + "E"])
+    solvers = [solve_bfs, solve_dfs, solve_astar, solve_astar_bucket, solve_idastar, solve_beam_astar,
+               solve_bidir_bfs, solve_bidir_astar, solve_jps, solve_bfs_flat, solve_dfs_flat,
+               solve_astar_flat, solve_junction_dijkstra, solve_junction_astar, solve_bfs_layers]
+
+    for solver in solvers:
+        sol = solver(m, budget=SearchBudget(max_expansions=5))
+        assert not sol.found and sol.path == []
+        assert sol.budget_exceeded == "expansions"
+        if solver is solve_bfs_layers:
+            # checked per layer: may overshoot by up to one layer
+            assert 5 <= sol.expanded_count < 5 + sol.max_frontier
+        else:
+            assert sol.expanded_count == 5
+
+        sol = solver(m, budget=SearchBudget(time_limit_ms=0))
+        assert sol.budget_exceeded == "deadline"
+
+        # a budget that is never hit changes nothing
+        roomy = solver(m, budget=SearchBudget(max_expansions=10**6, time_limit_ms=60_000))
+        plain = solver(m)
+        assert roomy.budget_exceeded is None
+        assert (roomy.path, roomy.expanded_count) == (plain.path, plain.expanded_count)
+
+def test_jps_grid_reads_scale_linearly():
+    # vertical jumps probe horizontal jumps from every cell they cross; each
+    # cell's scans must be shared, or one jump costs O(W*H) on open grids
+    from src import runner
+    from src.maze import Maze, WALL
+
+    class CountingRows(list):
+        reads = 0
+
+        def __getitem__(self, y):
+            CountingRows.reads += 1
+            return list.__getitem__(self, y)
+
+    for n in (40, 80, 120):
+        built = runner.run_config({"width": n, "height": n, "family": "B", "open_ratio": 0.9, "seed_value": 1})
+        rows = [list(row) for row in built.grid]
+        ex, ey = built.end
+        rows[ey - 1][ex] = WALL  # wall the goal in, so the search covers everything
+        rows[ey][ex - 1] = WALL
+        m = Maze(n, n, CountingRows(rows), built.start, built.end)
+
+        CountingRows.reads = 0
+        assert not solve_jps(m).found
+        assert CountingRows.reads <= 12 * n * n
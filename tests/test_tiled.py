@@ -0,0 +1,51 @@
+# test_tiled.py
+
+import pickle
+
+import pytest
+
+from src import config, generators, runner
+from src.benchmark import compute_maze_hash
+from src.solvers import solve_astar, solve_astar_tiled, solve_bfs, solve_bfs_tiled
+from src.tiled import TiledGrid, load_tiled_maze, write_tiled, write_tiled_rows
+
+
+@pytest.mark.parametrize("preset", ["a_medium", "b_medium"])
+def test_tiled_search_matches_in_memory(tmp_path, preset):
+    m = runner.run_config(config.PRESETS[preset])
+    path = str(tmp_path / "maze.tiles")
+    write_tiled(path, m, tile_size=8)  # 31x31 -> 4x4 tiles, ragged edges
+
+    tiled = load_tiled_maze(path, max_tiles=3)
+    assert isinstance(tiled.grid, TiledGrid)
+    assert compute_maze_hash(tiled) == compute_maze_hash(m)
+
+    assert solve_bfs(tiled) == solve_bfs(m)
+    assert solve_astar(tiled) == solve_astar(m)
+
+    stats = tiled.grid.stats()
+    assert stats["tile_misses"] > 0 and stats["tile_hits"] > 0
+    assert stats["tile_evictions"] > 0
+    assert tiled.grid.tiles_in_memory() <= 3
+
+
+def test_tiled_solvers_work_on_in_memory_mazes():
+    m = runner.run_config(config.PRESETS["b_medium"])
+    assert solve_bfs_tiled(m) == solve_bfs(m)
+    assert solve_astar_tiled(m) == solve_astar(m)
+
+
+def test_streamed_rows_and_pickle(tmp_path):
+    width, height = 41, 23
+    path = str(tmp_path / "eller.tiles")
+    write_tiled_rows(path, width, height, generators.iter_eller_rows(width, height, seed=5),
+                     start=(1, 1), end=(width - 2, height - 2), tile_size=16)
+
+    tiled = load_tiled_maze(path, max_tiles=2)
+    sol = solve_bfs(tiled)
+    assert sol.found
+    assert sol.path[0] == (1, 1) and sol.path[-1] == (width - 2, height - 2)
+
+    clone = pickle.loads(pickle.dumps(tiled))
+    assert solve_bfs(clone) == sol
+    assert clone.grid.misses > 0 and clone.grid.max_tiles == 2
@@ -0,0 +1,69 @@
+# test_timing.py
+
+import gc
+
+from src import config
+from src.benchmark import SolverResult, benchmark, select_best
+from src.solvers import solve_astar, solve_bfs
+from src.timing import significantly_faster, summarize, time_call
+
+
+def _result(name, samples):
+    stats = summarize(samples)
+    return SolverResult(name, True, [(0, 0)], 1, 10, stats.median_ms, None, timing=stats)
+
+
+def test_summarize_and_bootstrap_ci():
+    stats = summarize([5.0, 1.0, 3.0, 2.0, 4.0])
+    assert (stats.min_ms, stats.median_ms, stats.repeats) == (1.0, 3.0, 5)
+    assert 4.0 < stats.p95_ms <= 5.0
+    assert stats.ci_low_ms <= stats.median_ms <= stats.ci_high_ms
+    assert summarize([2.0]).ci_low_ms is None
+
+
+def test_time_call_warms_up_and_restores_gc():
+    calls = []
+    result, stats = time_call(lambda x: calls.append(x) or x * 2, 21, warmup=2, repeats=4)
+    assert result == 42
+    assert len(calls) == 6 and stats.repeats == 4
+    assert gc.isenabled()
+
+
+def test_time_call_stops_repeating_when_asked():
+    calls = []
+    _, stats = time_call(lambda: calls.append(1), warmup=0, repeats=5, stop_when=lambda _: len(calls) == 2)
+    assert len(calls) == 2 and stats.repeats == 2
+
+    # stopped during warmup: one timed call still gives a sample
+    calls.clear()
+    _, stats = time_call(lambda: calls.append(1), warmup=3, repeats=5, stop_when=lambda _: True)
+    assert len(calls) == 2 and stats.repeats == 1
+
+
+def test_select_best_uses_runtime_only_when_significant():
+    slow = _result("slow", [10.0, 10.2, 9.9, 10.1, 10.0, 10.3])
+    fast = _result("fast", [1.0, 1.1, 0.9, 1.0, 1.2, 1.0])
+    noisy = _result("noisy", [0.5, 12.0, 0.6, 11.0, 0.7, 10.0])
+
+    assert significantly_faster(fast.timing, slow.timing)
+    assert select_best([slow, fast], ["solved", "path_length", "runtime_ms"])[0] == "fast"
+
+    # overlapping intervals: runtime can't separate them, input order decides
+    name, reason = select_best([slow, noisy], ["solved", "path_length", "runtime_ms"])
+    assert name == "slow"
+    assert "not significant" in reason
+
+    # single samples keep the old behavior
+    a = SolverResult("a", True, [(0, 0)], 1, 10, 5.0, None)
+    b = SolverResult("b", True, [(0, 0)], 1, 10, 4.0, None)
+    assert select_best([a, b], ["solved", "runtime_ms"])[0] == "b"
+
+
+def test_benchmark_rows_carry_timing_stats():
+    rows = benchmark([config.PRESETS["a_small"]], [solve_bfs, solve_astar], timing_repeats=5, timing_warmup=1)
+    for row in rows:
+        assert row.timing_repeats == 5
+        assert row.runtime_min_ms <= row.runtime_median_ms <= row.runtime_p95_ms
+        assert row.runtime_ci_low_ms <= row.runtime_median_ms <= row.runtime_ci_high_ms
+        assert row.runtime_ms == row.runtime_median_ms
+    assert sum(row.is_best for row in rows) == 1
@@ -0,0 +1,51 @@
+# test_vector_solvers.py
+
+from src import runner, config
+from src.solvers import solve_bfs
+from src.vector_solvers import solve_bfs_layers
+from tests.helpers import maze_from_ascii, assert_valid_path
+
+
+def test_layers_bfs_matches_bfs_on_presets():
+    for preset in config.PRESETS.values():
+        for backend in ("list", "compact"):
+            m = runner.run_config(preset, grid_backend=backend)
+            sol = solve_bfs_layers(m)
+            ref = solve_bfs(m)
+
+            assert sol.found == ref.found
+            assert sol.path_length == ref.path_length
+            assert_valid_path(m, sol.path)
+            # same layers, goal counted as first of its layer
+            assert sol.expanded_count <= ref.expanded_count
+            assert sol.visited_count <= ref.visited_count
+
+
+def test_layers_bfs_counts():
+    m = maze_from_ascii([
+        "S..",
+        ".#.",
+        "..E",
+    ])
+
+    sol = solve_bfs_layers(m)
+
+    assert sol.found
+    assert sol.path_length == 4
+    assert sol.expanded_count == 8   # layers 0..3 hold 1+2+2+2 cells, then the goal
+    assert sol.visited_count == 8
+    assert sol.max_frontier == 2
+
+
+def test_layers_bfs_unsolvable():
+    m = maze_from_ascii([
+        "S#E",
+        "###",
+        "...",
+    ])
+
+    sol = solve_bfs_layers(m)
+
+    assert sol.found is False
+    assert sol.path == []
+    assert sol.expanded_count == 1